@@ -6,10 +6,28 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.storage import Store
 
 from custom_components.csnet_home.api import CSNetHomeAPI
-from custom_components.csnet_home.const import CONF_LANGUAGE, DOMAIN
-from custom_components.csnet_home.coordinator import CSNetHomeCoordinator
+from custom_components.csnet_home.const import (
+    CONF_ALARMS_INTERVAL,
+    CONF_INSTALLATION_DEVICES_INTERVAL,
+    CONF_LANGUAGE,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_ALARMS_INTERVAL,
+    DEFAULT_INSTALLATION_DEVICES_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    SESSION_STORAGE_KEY,
+    SESSION_STORAGE_VERSION,
+    TRANSLATIONS_STORAGE_KEY,
+    TRANSLATIONS_STORAGE_VERSION,
+)
+from custom_components.csnet_home.coordinator import (
+    ENDPOINT_ALARMS,
+    ENDPOINT_INSTALLATION_DEVICES,
+    CSNetHomeCoordinator,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,11 +59,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     api = CSNetHomeAPI(hass, username, password)
     # store preferred language for translations
     api.preferred_language = entry.data.get(CONF_LANGUAGE)
+    # reuse the session of the previous run to skip the login handshake
+    api.session_store = _session_store(hass, entry)
+    await api.async_restore_session()
+    # translation bundles are shared by all entries and revalidated in background
+    api.translations_store = Store(
+        hass, TRANSLATIONS_STORAGE_VERSION, TRANSLATIONS_STORAGE_KEY
+    )
 
     _LOGGER.debug("Starting CSNet Home sensor setup")
+    _async_migrate_scan_interval(hass, entry)
+    settings = entry.options
     coordinator = CSNetHomeCoordinator(
-        hass, entry.data.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL), entry.entry_id
+        hass,
+        settings.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
+        entry.entry_id,
+        endpoint_intervals={
+            ENDPOINT_INSTALLATION_DEVICES: settings.get(
+                CONF_INSTALLATION_DEVICES_INTERVAL,
+                DEFAULT_INSTALLATION_DEVICES_INTERVAL,
+            ),
+            ENDPOINT_ALARMS: settings.get(
+                CONF_ALARMS_INTERVAL, DEFAULT_ALARMS_INTERVAL
+            ),
+        },
+        stale_grace_period=settings.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+        ),
     )
+    api.translations_listener = coordinator.async_translations_updated
 
     # Initialise a listener for config flow options changes.
     # See config_flow for defining an options setting that shows up as configure on the integration.
@@ -64,6 +106,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     return True
 
 
+def _async_migrate_scan_interval(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Move the scan interval of older entries from their data to the options.
+
+    The polling intervals are only read from the options; a scan interval
+    already saved in the options is kept.
+    """
+    if CONF_SCAN_INTERVAL not in entry.data:
+        return
+    data = dict(entry.data)
+    scan_interval = data.pop(CONF_SCAN_INTERVAL)
+    hass.config_entries.async_update_entry(
+        entry,
+        data=data,
+        options={CONF_SCAN_INTERVAL: scan_interval, **entry.options},
+    )
+
+
+def _session_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the storage holding the CSNet session of a config entry."""
+    return Store(
+        hass,
+        SESSION_STORAGE_VERSION,
+        f"{SESSION_STORAGE_KEY}.{entry.entry_id}",
+        private=True,
+    )
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry):
     """Handle config options update."""
     # Reload the integration when the options change.
@@ -100,3 +169,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Return that unloading was successful.
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted session when the integration is deleted."""
+    await _session_store(hass, entry).async_remove()
@@ -0,0 +1,242 @@
+"""Alarm code decoding and the translated alarm catalog for CSNet Home."""
+
+import re
+from dataclasses import dataclass
+
+# Unit types for which the cloud reports an alarm origin
+ORIGIN_UNIT_TYPES = frozenset({"yutaki", "water_heater"})
+
+_ALARM_KEY = re.compile(r"alarm_(\d+)")
+
+# Alarm Origin Map Constants
+BCD_ALARM_ORIGIN_MAP = {
+    0x62: "STR_ORIGIN_INVERTER",
+    0x5B: "STR_ORIGIN_OUTDOOR_FAN",
+    0x5C: "STR_ORIGIN_OUTDOOR_FAN",
+    0xEE: "STR_ORIGIN_COMPRESSOR",
+}
+
+ALARM_ORIGIN_MAP = {
+    # Standard Map entries
+    2: "STR_REFRIGERANT_CYCLE",
+    3: "STR_ORIGIN_TRANSMISSION",
+    4: "STR_ORIGIN_TRANSMISSION",
+    5: "STR_ORIGIN_POWER_SUPPLY",
+    6: "STR_ORIGIN_VOLTAGE",
+    7: "STR_REFRIGERANT_CYCLE",
+    8: "STR_REFRIGERANT_CYCLE",
+    10: "STR_ORIGIN_INDOOR",
+    23: "STR_ORIGIN_2ND_CYCLE",
+    27: "STR_ORIGIN_OUTDOOR",
+    31: "STR_ORIGIN_SYSTEM",
+    35: "STR_ORIGIN_SYSTEM",
+    36: "STR_ORIGIN_SYSTEM",
+    41: "STR_ORIGIN_INDOOR",
+    42: "STR_REFRIGERANT_CYCLE",
+    43: "STR_REFRIGERANT_CYCLE",
+    44: "STR_REFRIGERANT_CYCLE",
+    45: "STR_REFRIGERANT_CYCLE",
+    46: "STR_REFRIGERANT_CYCLE",
+    47: "STR_REFRIGERANT_CYCLE",
+    48: "STR_ORIGIN_INVERTER",
+    49: "STR_REFRIGERANT_CYCLE",
+    51: "STR_ORIGIN_INVERTER",
+    53: "STR_ORIGIN_INVERTER",
+    54: "STR_ORIGIN_INVERTER",
+    55: "STR_ORIGIN_INVERTER",
+    57: "STR_ORIGIN_OUTDOOR_FAN",
+    60: "STR_ORIGIN_COMUNICATION",
+    61: "STR_ORIGIN_COMUNICATION",
+    77: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
+    78: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
+    79: "STR_ORIGIN_SYSTEM",
+    80: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
+    81: "STR_ORIGIN_INDOOR",
+    85: "STR_ORIGIN_INDOOR",
+    91: "STR_ORIGIN_OUTDOOR_FAN",
+    92: "STR_ORIGIN_OUTDOOR_FAN",
+    238: "STR_ORIGIN_COMPRESSOR",
+    # Merged List entries
+    # STR_ORIGIN_INDOOR list 1
+    11: "STR_ORIGIN_INDOOR",
+    12: "STR_ORIGIN_INDOOR",
+    13: "STR_ORIGIN_INDOOR",
+    14: "STR_ORIGIN_INDOOR",
+    75: "STR_ORIGIN_INDOOR",
+    76: "STR_ORIGIN_INDOOR",
+    83: "STR_ORIGIN_INDOOR",
+    # STR_ORIGIN_INDOOR list 2
+    15: "STR_ORIGIN_INDOOR",
+    16: "STR_ORIGIN_INDOOR",
+    17: "STR_ORIGIN_INDOOR",
+    18: "STR_ORIGIN_INDOOR",
+    19: "STR_ORIGIN_INDOOR",
+    25: "STR_ORIGIN_INDOOR",
+    33: "STR_ORIGIN_INDOOR",
+    34: "STR_ORIGIN_INDOOR",
+    40: "STR_ORIGIN_INDOOR",
+    72: "STR_ORIGIN_INDOOR",
+    73: "STR_ORIGIN_INDOOR",
+    74: "STR_ORIGIN_INDOOR",
+    # STR_ORIGIN_OUTDOOR
+    20: "STR_ORIGIN_OUTDOOR",
+    21: "STR_ORIGIN_OUTDOOR",
+    22: "STR_ORIGIN_OUTDOOR",
+    24: "STR_ORIGIN_OUTDOOR",
+    28: "STR_ORIGIN_OUTDOOR",
+    29: "STR_ORIGIN_OUTDOOR",
+    38: "STR_ORIGIN_OUTDOOR",
+    59: "STR_ORIGIN_OUTDOOR",
+    # Single value checks
+    26: "STR_ORIGIN_INDOOR",
+    # STR_ORIGIN_INDOOR list 3
+    70: "STR_ORIGIN_INDOOR",
+    71: "STR_ORIGIN_INDOOR",
+    84: "STR_ORIGIN_INDOOR",
+    90: "STR_ORIGIN_INDOOR",
+    # STR_ORIGIN_2ND_CYCLE list
+    101: "STR_ORIGIN_2ND_CYCLE",
+    102: "STR_ORIGIN_2ND_CYCLE",
+    103: "STR_ORIGIN_2ND_CYCLE",
+    104: "STR_ORIGIN_2ND_CYCLE",
+    105: "STR_ORIGIN_2ND_CYCLE",
+    106: "STR_ORIGIN_2ND_CYCLE",
+    124: "STR_ORIGIN_2ND_CYCLE",
+    125: "STR_ORIGIN_2ND_CYCLE",
+    126: "STR_ORIGIN_2ND_CYCLE",
+    127: "STR_ORIGIN_2ND_CYCLE",
+    128: "STR_ORIGIN_2ND_CYCLE",
+    129: "STR_ORIGIN_2ND_CYCLE",
+    130: "STR_ORIGIN_2ND_CYCLE",
+    132: "STR_ORIGIN_2ND_CYCLE",
+    134: "STR_ORIGIN_2ND_CYCLE",
+    135: "STR_ORIGIN_2ND_CYCLE",
+    136: "STR_ORIGIN_2ND_CYCLE",
+    151: "STR_ORIGIN_2ND_CYCLE",
+    152: "STR_ORIGIN_2ND_CYCLE",
+    153: "STR_ORIGIN_2ND_CYCLE",
+    154: "STR_ORIGIN_2ND_CYCLE",
+    155: "STR_ORIGIN_2ND_CYCLE",
+    156: "STR_ORIGIN_2ND_CYCLE",
+    157: "STR_ORIGIN_2ND_CYCLE",
+    # STR_ORIGIN_INDOOR list 4
+    202: "STR_ORIGIN_INDOOR",
+    203: "STR_ORIGIN_INDOOR",
+    204: "STR_ORIGIN_INDOOR",
+    205: "STR_ORIGIN_INDOOR",
+    # STR_ORIGIN_CASCADE_CONTROLLER
+    208: "STR_ORIGIN_CASCADE_CONTROLLER",
+    209: "STR_ORIGIN_CASCADE_CONTROLLER",
+    # STR_ORIGIN_CASCADE_MODULE
+    211: "STR_ORIGIN_CASCADE_MODULE",
+    212: "STR_ORIGIN_CASCADE_MODULE",
+    213: "STR_ORIGIN_CASCADE_MODULE",
+    214: "STR_ORIGIN_CASCADE_MODULE",
+    215: "STR_ORIGIN_CASCADE_MODULE",
+    216: "STR_ORIGIN_CASCADE_MODULE",
+    217: "STR_ORIGIN_CASCADE_MODULE",
+    218: "STR_ORIGIN_CASCADE_MODULE",
+    # STR_ORIGIN_UNIT_CONTROLLER
+    220: "STR_ORIGIN_UNIT_CONTROLLER",
+}
+
+
+def has_alarm_letter(alarm_code: int) -> bool:
+    """Check if alarm code has letter format (BCD encoded)."""
+    if alarm_code is None:
+        return False
+    return (alarm_code & 0xFF00) > 0
+
+
+def reverse_bcd(val: int) -> int:
+    """Reverse BCD conversion for alarm codes."""
+    aux1 = (val // 10) - 1
+    aux2 = (val % 10) + 10
+    return (aux1 * 16) + aux2
+
+
+def format_alarm_code(alarm_code: int) -> str:
+    """Format alarm code as hex (if BCD) or decimal."""
+    if alarm_code is None or alarm_code == 0:
+        return "0"
+
+    if has_alarm_letter(alarm_code):
+        # Extract low byte and convert it to hex directly (BCD format)
+        return format(alarm_code & 0x00FF, "X")
+    return str(alarm_code)
+
+
+def origin_applies(unit_type: str) -> bool:
+    """Return True if alarms of this unit type carry an origin."""
+    return unit_type in ORIGIN_UNIT_TYPES
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmRecord:
+    """Decoded and translated view of a single alarm code."""
+
+    formatted_code: str
+    origin: str
+    message: str | None
+
+
+NO_ALARM = AlarmRecord(formatted_code="0", origin="", message=None)
+
+
+class AlarmCatalog:
+    """Integer keyed lookup of alarm records built from a translations dict.
+
+    Translated messages are indexed once by their numeric code; the record of
+    a code is decoded on first use and memoized, so enriching an element with
+    alarm data is a single dict lookup on every following poll.
+    """
+
+    def __init__(self, translations: dict):
+        """Index the alarm messages contained in the translations."""
+        self._translations = translations
+        self._records: dict[int, AlarmRecord] = {}
+        self._messages: dict[int, str] = {}
+        ranks: dict[int, int] = {}
+        for key, message in translations.items():
+            match = _ALARM_KEY.fullmatch(key)
+            if match is None:
+                continue
+            digits = match.group(1)
+            code = int(digits)
+            # Same precedence as the website: alarm_N, then alarm_NN, alarm_NNN
+            for rank, candidate in enumerate((str(code), f"{code:02d}", f"{code:03d}")):
+                if digits == candidate:
+                    break
+            else:
+                continue
+            if rank < ranks.get(code, 3):
+                ranks[code] = rank
+                self._messages[code] = message
+
+    def lookup(self, alarm_code) -> AlarmRecord:
+        """Return the record of an alarm code, decoding it on first use."""
+        if not alarm_code:
+            return NO_ALARM
+        record = self._records.get(alarm_code)
+        if record is None:
+            code = int(alarm_code)
+            record = AlarmRecord(
+                formatted_code=format_alarm_code(code),
+                origin=self._origin(code),
+                message=self._messages.get(code),
+            )
+            self._records[alarm_code] = record
+        return record
+
+    def _origin(self, alarm_code: int) -> str:
+        """Translate the origin of an alarm code, or return an empty string."""
+        is_bcd = has_alarm_letter(alarm_code)
+        # BCD-specific origins are keyed by the raw low byte (before reversing)
+        raw_value = (alarm_code & 0x00FF) if is_bcd else alarm_code
+        origin_key = BCD_ALARM_ORIGIN_MAP.get(raw_value) if is_bcd else None
+        if origin_key is None:
+            value = reverse_bcd(raw_value) if is_bcd else alarm_code
+            origin_key = ALARM_ORIGIN_MAP.get(value)
+        if origin_key is None:
+            return ""
+        return self._translations.get(origin_key, "")
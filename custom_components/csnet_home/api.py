@@ -1,18 +1,37 @@
 """API Module to connect to CSNet Home."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
+from functools import partial
+from typing import Any
 
 import aiohttp
 import async_timeout
 from homeassistant.core import HomeAssistant
-
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
+from yarl import URL
+
+from custom_components.csnet_home.alarms import (
+    AlarmCatalog,
+    format_alarm_code,
+    has_alarm_letter,
+    origin_applies,
+    reverse_bcd,
+)
+from custom_components.csnet_home.commands import HeatSettingsExecutor
 from custom_components.csnet_home.const import (
     API_URL,
+    COMMAND_DEBOUNCE_DELAY,
+    COMMAND_QUEUE_MAX_SIZE,
     COMMON_API_HEADERS,
+    DECODE_OFFLOAD_THRESHOLD,
     DEFAULT_API_TIMEOUT,
+    DEFAULT_LANGUAGE,
     ELEMENTS_PATH,
     HEAT_SETTINGS_PATH,
     HEATING_MAX_TEMPERATURE,
@@ -20,9 +39,13 @@ from custom_components.csnet_home.const import (
     INSTALLATION_DEVICES_PATH,
     LANGUAGE_FILES,
     LOGIN_PATH,
+    VALIDATED_SESSION_MAX_AGE,
+    VALIDATED_SESSIONS,
     WATER_CIRCUIT_MAX_HEAT,
     WATER_HEATER_MAX_TEMPERATURE,
 )
+from custom_components.csnet_home.helpers import extract_indoors_section
+from custom_components.csnet_home.models import ZoneState
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,139 +64,6 @@ TO_REDACT = {
     "token",
 }
 
-# Alarm Origin Map Constants
-# Optimized for performance to avoid recreation on every call
-BCD_ALARM_ORIGIN_MAP = {
-    0x62: "STR_ORIGIN_INVERTER",
-    0x5B: "STR_ORIGIN_OUTDOOR_FAN",
-    0x5C: "STR_ORIGIN_OUTDOOR_FAN",
-    0xEE: "STR_ORIGIN_COMPRESSOR",
-}
-
-ALARM_ORIGIN_MAP = {
-    # Standard Map entries
-    2: "STR_REFRIGERANT_CYCLE",
-    3: "STR_ORIGIN_TRANSMISSION",
-    4: "STR_ORIGIN_TRANSMISSION",
-    5: "STR_ORIGIN_POWER_SUPPLY",
-    6: "STR_ORIGIN_VOLTAGE",
-    7: "STR_REFRIGERANT_CYCLE",
-    8: "STR_REFRIGERANT_CYCLE",
-    10: "STR_ORIGIN_INDOOR",
-    23: "STR_ORIGIN_2ND_CYCLE",
-    27: "STR_ORIGIN_OUTDOOR",
-    31: "STR_ORIGIN_SYSTEM",
-    35: "STR_ORIGIN_SYSTEM",
-    36: "STR_ORIGIN_SYSTEM",
-    41: "STR_ORIGIN_INDOOR",
-    42: "STR_REFRIGERANT_CYCLE",
-    43: "STR_REFRIGERANT_CYCLE",
-    44: "STR_REFRIGERANT_CYCLE",
-    45: "STR_REFRIGERANT_CYCLE",
-    46: "STR_REFRIGERANT_CYCLE",
-    47: "STR_REFRIGERANT_CYCLE",
-    48: "STR_ORIGIN_INVERTER",
-    49: "STR_REFRIGERANT_CYCLE",
-    51: "STR_ORIGIN_INVERTER",
-    53: "STR_ORIGIN_INVERTER",
-    54: "STR_ORIGIN_INVERTER",
-    55: "STR_ORIGIN_INVERTER",
-    57: "STR_ORIGIN_OUTDOOR_FAN",
-    60: "STR_ORIGIN_COMUNICATION",
-    61: "STR_ORIGIN_COMUNICATION",
-    77: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
-    78: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
-    79: "STR_ORIGIN_SYSTEM",
-    80: "STR_ORIGIN_INDOOR_UNIT_CONTROLLER",
-    81: "STR_ORIGIN_INDOOR",
-    85: "STR_ORIGIN_INDOOR",
-    91: "STR_ORIGIN_OUTDOOR_FAN",
-    92: "STR_ORIGIN_OUTDOOR_FAN",
-    238: "STR_ORIGIN_COMPRESSOR",
-    # Merged List entries
-    # STR_ORIGIN_INDOOR list 1
-    11: "STR_ORIGIN_INDOOR",
-    12: "STR_ORIGIN_INDOOR",
-    13: "STR_ORIGIN_INDOOR",
-    14: "STR_ORIGIN_INDOOR",
-    75: "STR_ORIGIN_INDOOR",
-    76: "STR_ORIGIN_INDOOR",
-    83: "STR_ORIGIN_INDOOR",
-    # STR_ORIGIN_INDOOR list 2
-    15: "STR_ORIGIN_INDOOR",
-    16: "STR_ORIGIN_INDOOR",
-    17: "STR_ORIGIN_INDOOR",
-    18: "STR_ORIGIN_INDOOR",
-    19: "STR_ORIGIN_INDOOR",
-    25: "STR_ORIGIN_INDOOR",
-    33: "STR_ORIGIN_INDOOR",
-    34: "STR_ORIGIN_INDOOR",
-    40: "STR_ORIGIN_INDOOR",
-    72: "STR_ORIGIN_INDOOR",
-    73: "STR_ORIGIN_INDOOR",
-    74: "STR_ORIGIN_INDOOR",
-    # STR_ORIGIN_OUTDOOR
-    20: "STR_ORIGIN_OUTDOOR",
-    21: "STR_ORIGIN_OUTDOOR",
-    22: "STR_ORIGIN_OUTDOOR",
-    24: "STR_ORIGIN_OUTDOOR",
-    28: "STR_ORIGIN_OUTDOOR",
-    29: "STR_ORIGIN_OUTDOOR",
-    38: "STR_ORIGIN_OUTDOOR",
-    59: "STR_ORIGIN_OUTDOOR",
-    # Single value checks
-    26: "STR_ORIGIN_INDOOR",
-    # STR_ORIGIN_INDOOR list 3
-    70: "STR_ORIGIN_INDOOR",
-    71: "STR_ORIGIN_INDOOR",
-    84: "STR_ORIGIN_INDOOR",
-    90: "STR_ORIGIN_INDOOR",
-    # STR_ORIGIN_2ND_CYCLE list
-    101: "STR_ORIGIN_2ND_CYCLE",
-    102: "STR_ORIGIN_2ND_CYCLE",
-    103: "STR_ORIGIN_2ND_CYCLE",
-    104: "STR_ORIGIN_2ND_CYCLE",
-    105: "STR_ORIGIN_2ND_CYCLE",
-    106: "STR_ORIGIN_2ND_CYCLE",
-    124: "STR_ORIGIN_2ND_CYCLE",
-    125: "STR_ORIGIN_2ND_CYCLE",
-    126: "STR_ORIGIN_2ND_CYCLE",
-    127: "STR_ORIGIN_2ND_CYCLE",
-    128: "STR_ORIGIN_2ND_CYCLE",
-    129: "STR_ORIGIN_2ND_CYCLE",
-    130: "STR_ORIGIN_2ND_CYCLE",
-    132: "STR_ORIGIN_2ND_CYCLE",
-    134: "STR_ORIGIN_2ND_CYCLE",
-    135: "STR_ORIGIN_2ND_CYCLE",
-    136: "STR_ORIGIN_2ND_CYCLE",
-    151: "STR_ORIGIN_2ND_CYCLE",
-    152: "STR_ORIGIN_2ND_CYCLE",
-    153: "STR_ORIGIN_2ND_CYCLE",
-    154: "STR_ORIGIN_2ND_CYCLE",
-    155: "STR_ORIGIN_2ND_CYCLE",
-    156: "STR_ORIGIN_2ND_CYCLE",
-    157: "STR_ORIGIN_2ND_CYCLE",
-    # STR_ORIGIN_INDOOR list 4
-    202: "STR_ORIGIN_INDOOR",
-    203: "STR_ORIGIN_INDOOR",
-    204: "STR_ORIGIN_INDOOR",
-    205: "STR_ORIGIN_INDOOR",
-    # STR_ORIGIN_CASCADE_CONTROLLER
-    208: "STR_ORIGIN_CASCADE_CONTROLLER",
-    209: "STR_ORIGIN_CASCADE_CONTROLLER",
-    # STR_ORIGIN_CASCADE_MODULE
-    211: "STR_ORIGIN_CASCADE_MODULE",
-    212: "STR_ORIGIN_CASCADE_MODULE",
-    213: "STR_ORIGIN_CASCADE_MODULE",
-    214: "STR_ORIGIN_CASCADE_MODULE",
-    215: "STR_ORIGIN_CASCADE_MODULE",
-    216: "STR_ORIGIN_CASCADE_MODULE",
-    217: "STR_ORIGIN_CASCADE_MODULE",
-    218: "STR_ORIGIN_CASCADE_MODULE",
-    # STR_ORIGIN_UNIT_CONTROLLER
-    220: "STR_ORIGIN_UNIT_CONTROLLER",
-}
-
 
 def redact_data(data):
     """Redact sensitive keys from a dictionary or list."""
@@ -187,6 +77,30 @@ def redact_data(data):
     return data
 
 
+# Returned by the JSON decoder of a response identical to the previous one
+_UNCHANGED = object()
+
+
+class LazyRedact:
+    """Log argument redacting its data only when the record is formatted.
+
+    ``_LOGGER.debug("%s", redact_data(data))`` copies the whole payload even
+    when debug logging is off; wrapping it defers that work to ``__str__``.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        """Keep a reference to the data to redact."""
+        self._data = data
+
+    def __str__(self):
+        """Return the redacted data as text."""
+        return str(redact_data(self._data))
+
+    __repr__ = __str__
+
+
 class CSNetHomeAPI:
     """Handles communication with the cloud service API."""
 
@@ -204,6 +118,34 @@ class CSNetHomeAPI:
         self.xsrf_token = None
         self.translations = {}
         self.installation_id = None
+        # Single-flight authentication: concurrent callers share one login
+        self._login_lock = asyncio.Lock()
+        self._login_generation = 0
+        self.login_count = 0
+        self.login_coalesced_count = 0
+        # Optional storage used to keep the authenticated session across restarts
+        self.session_store: Store | None = None
+        # Translation bundles are cached on disk and refreshed in the background
+        self.preferred_language = None
+        self.translations_store: Store | None = None
+        self.translations_listener = None
+        self._translations_task = None
+        self._alarm_catalog: AlarmCatalog | None = None
+        self._alarm_catalog_source = None
+        # heat_setting writes are sent in order by one worker per indoor unit
+        self.heat_settings = HeatSettingsExecutor(
+            self._async_post_heat_settings,
+            COMMAND_DEBOUNCE_DELAY,
+            COMMAND_QUEUE_MAX_SIZE,
+        )
+        # Large responses are decoded in the executor, small ones on the loop
+        self.decode_offload_threshold = DECODE_OFFLOAD_THRESHOLD
+        self.offloaded_decodes = 0
+        self.loop_block_time = None
+        self.loop_block_time_max = 0.0
+        # Digest and result of the last response of each data endpoint
+        self._response_cache: dict[str, tuple[bytes, Any]] = {}
+        self.unchanged_responses = 0
 
     async def get_xsrf_token(self):
         """Get the XSRF token from the cloud service."""
@@ -233,10 +175,96 @@ class CSNetHomeAPI:
                 )
                 return False
 
+    @staticmethod
+    def _create_client_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+        """Create a client session with its own cookie jar.
+
+        The session runs on the connector pool of Home Assistant, which keeps
+        TLS connections alive between polls, caches DNS lookups and bounds the
+        number of connections per host. It is detached, not closed, when the
+        API is done with it so that the shared connector stays open.
+        """
+        return async_create_clientsession(
+            hass, auto_cleanup=False, cookie_jar=aiohttp.CookieJar()
+        )
+
+    def _ensure_client_session(self):
+        """Create the HTTP client session if there is no usable one."""
+        if self.session is None or self.session.closed:
+            self.session = self._create_client_session(self.hass)
+
+    async def async_restore_session(self) -> bool:
+        """Restore the cookies and XSRF token saved by a previous run.
+
+        The restored session is trusted optimistically: the first data request
+        validates it, and an expired session is replaced by a regular login
+        through the shared re-authentication path.
+        """
+        validated = self._pop_validated_session()
+        if validated is not None:
+            self._apply_session_state(validated)
+            _LOGGER.debug("Reusing the CSNet session validated by the config flow")
+            await self._async_save_session()
+            return True
+
+        if self.session_store is None:
+            return False
+
+        stored = await self.session_store.async_load()
+        if (
+            not stored
+            or stored.get("username") != self.username
+            or not stored.get("cookies")
+        ):
+            return False
+
+        self._apply_session_state(stored)
+        _LOGGER.debug("Restored CSNet session from storage")
+        return True
+
+    def _pop_validated_session(self) -> dict | None:
+        """Take the session the config flow just logged in with, if still fresh.
+
+        The handover is consumed whatever its age, so a session is never
+        offered twice.
+        """
+        validated = self.hass.data.get(VALIDATED_SESSIONS, {}).pop(self.username, None)
+        if (
+            not validated
+            or not validated.get("cookies")
+            or time.monotonic() - validated["validated_at"] > VALIDATED_SESSION_MAX_AGE
+        ):
+            return None
+        return validated
+
+    def _apply_session_state(self, state: dict):
+        """Load cookies and XSRF token into the client session."""
+        self._ensure_client_session()
+        self.session.cookie_jar.update_cookies(state["cookies"], URL(self.base_url))
+        self.xsrf_token = state.get("xsrf_token")
+        self.logged_in = True
+
+    def _session_state(self) -> dict:
+        """Return the cookies and XSRF token of the client session."""
+        return {
+            "username": self.username,
+            "xsrf_token": self.xsrf_token,
+            "cookies": {cookie.key: cookie.value for cookie in self.session.cookie_jar},
+        }
+
+    async def _async_save_session(self):
+        """Persist the current cookies and XSRF token for the next start."""
+        if self.session_store is None or self.session is None:
+            return
+
+        try:
+            await self.session_store.async_save(self._session_state())
+        except Exception as e:
+            _LOGGER.debug("Unable to persist CSNet session: %s", e)
+
     async def async_login(self):
         """Log in to the cloud service and return a session cookie."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
+        self._ensure_client_session()
 
         if not await self.get_xsrf_token():
             _LOGGER.error("Failed to get XSRF token.")
@@ -279,6 +307,50 @@ class CSNetHomeAPI:
             _LOGGER.error("Login exception: %s", e, exc_info=True)
             return False
 
+    async def _async_relogin(self, seen_generation: int) -> bool:
+        """Log in again unless another caller already did it.
+
+        ``seen_generation`` is the login generation the caller was using when it
+        noticed the session was missing or expired. Callers queue on a shared
+        lock: the first one performs the handshake, the others find a newer
+        generation once they get the lock and reuse that session instead of
+        starting their own GET/POST /login round trips.
+        """
+        async with self._login_lock:
+            if self._login_generation != seen_generation and self.logged_in:
+                self.login_coalesced_count += 1
+                _LOGGER.debug("Reusing login performed by a concurrent request")
+                return True
+            self.login_count += 1
+            if await self.async_login():
+                self._login_generation += 1
+                await self._async_save_session()
+                return True
+            return False
+
+    async def _async_ensure_session(self) -> int:
+        """Make sure there is an authenticated session and return its generation."""
+        generation = self._login_generation
+        if not self.session or not self.logged_in:
+            _LOGGER.warning("No active session found.")
+            await self._async_relogin(generation)
+        return self._login_generation
+
+    async def _async_call_with_login(self, request):
+        """Run a data request, re-authenticating and retrying it once if needed.
+
+        Fetchers return None and clear ``logged_in`` when the session turned out
+        to be unusable. In that case a single shared login is performed and the
+        request is retried once.
+        """
+        generation = await self._async_ensure_session()
+        result = await request()
+        if result is None and not self.logged_in:
+            _LOGGER.debug("Session lost during request, logging in and retrying")
+            if await self._async_relogin(generation):
+                result = await request()
+        return result
+
     @staticmethod
     async def async_validate_credentials(
         hass: HomeAssistant, username: str, password: str, base_url: str = API_URL
@@ -287,7 +359,9 @@ class CSNetHomeAPI:
 
         This is a standalone method that creates a temporary API instance,
         attempts to login, and returns whether the credentials are valid.
-        The session is properly cleaned up after validation.
+        The cookies and XSRF token of a successful login are kept for a few
+        minutes so that the entry set up next can skip its own login. The
+        session is properly cleaned up after validation.
 
         Args:
             hass: HomeAssistant instance
@@ -302,7 +376,7 @@ class CSNetHomeAPI:
         # Create a temporary API instance for validation
         temp_api = CSNetHomeAPI(hass, username, password, base_url)
         # Pre-create the session so it is always available for cleanup
-        temp_api.session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar())
+        temp_api.session = CSNetHomeAPI._create_client_session(hass)
 
         try:
             # Attempt to login with the provided credentials
@@ -312,6 +386,11 @@ class CSNetHomeAPI:
                 "Credential validation result: %s",
                 "SUCCESS" if login_success else "FAILED",
             )
+            if login_success:
+                hass.data.setdefault(VALIDATED_SESSIONS, {})[username] = {
+                    **temp_api._session_state(),
+                    "validated_at": time.monotonic(),
+                }
             return login_success
         except Exception as e:
             _LOGGER.error("Credential validation exception: %s", e, exc_info=True)
@@ -319,18 +398,18 @@ class CSNetHomeAPI:
         finally:
             # Always clean up the session
             try:
-                await temp_api.session.close()
+                temp_api.session.detach()
                 _LOGGER.debug("Validation session closed successfully")
             except Exception as e:
                 _LOGGER.debug("Error closing validation session: %s", e)
 
     async def async_get_elements_data(self):
         """Get sensor data from the cloud service."""
-        sensor_data_url = f"{self.base_url}{ELEMENTS_PATH}"
+        return await self._async_call_with_login(self._async_fetch_elements_data)
 
-        if not self.session or not self.logged_in:
-            _LOGGER.warning("No active session found.")
-            await self.async_login()
+    async def _async_fetch_elements_data(self):
+        """Request and parse the elements payload once."""
+        sensor_data_url = f"{self.base_url}{ELEMENTS_PATH}"
 
         headers = COMMON_API_HEADERS | {
             "accept": "application/json, text/javascript, */*; q=0.01",
@@ -345,100 +424,30 @@ class CSNetHomeAPI:
                 async with self.session.get(
                     sensor_data_url, headers=headers, cookies=request_cookies
                 ) as response:
-                    data = await self.check_api_response(response)
-                    if data is not None and data.get("status") == "success":
+                    # The catalog is built on the event loop, the transform may
+                    # run in the executor
+                    transform = partial(
+                        self._parse_elements_data, alarm_catalog=self.alarm_catalog
+                    )
+                    result = await self.check_api_response(
+                        response, transform, ELEMENTS_PATH
+                    )
+                    if result is None and not self.logged_in:
+                        # Expired session, the caller logs in and retries
+                        return None
+                    data, data_elements = result or (None, None)
+                    if data_elements is not None:
                         _LOGGER.debug(
-                            "Sensor data retrieved: %s", redact_data(data["data"])
+                            "Sensor data retrieved: %s", LazyRedact(data["data"])
                         )
-
-                        # Parse the sensor data from the API response
-                        elements = data.get("data", {}).get("elements", [])
-                        sensors = []
-
                         # Store installation ID for alarm API calls
                         self.installation_id = data.get("data", {}).get("installation")
-
-                        common_data = {
-                            "name": data.get("data", {}).get("name"),
-                            "latitude": data.get("data", {}).get("latitude"),
-                            "longitude": data.get("data", {}).get("longitude"),
-                            "weather_temperature": data.get("data", {}).get(
-                                "weatherTemperature"
-                            ),
-                            "device_status": {
-                                device.get("id"): {
-                                    "name": device.get("name"),
-                                    "status": device.get("status"),
-                                    "firmware": device.get("firmware"),
-                                    "lastComm": device.get("lastComm"),
-                                    "rssi": device.get("rssi"),
-                                    "currentTimeMillis": device.get(
-                                        "currentTimeMillis"
-                                    ),
-                                }
-                                for device in data.get("data", {}).get(
-                                    "device_status", []
-                                )
-                            },
-                        }
-                        for index, element in enumerate(elements):
-                            alarm_code = element.get("alarmCode")
-                            sensor = {
-                                "device_name": element.get("deviceName") or "Remote",
-                                "device_id": element.get("deviceId"),
-                                "room_name": element.get("parentName")
-                                or f"Room-{element.get('parentId')}-{index}",
-                                "parent_id": element.get("parentId"),
-                                "room_id": element.get("roomId"),
-                                "operation_status": element.get("operationStatus"),
-                                "mode": element.get(
-                                    "mode"
-                                ),  # 0 = cool, 1 = heat, 2 = auto
-                                "real_mode": element.get("realMode"),
-                                "on_off": element.get("onOff"),  # 0 = Off, 1 = On
-                                "timer_running": element.get("timerRunning"),
-                                "alarm_code": alarm_code,
-                                "alarm_message": self.translate_alarm(alarm_code),
-                                "c1_demand": element.get("c1Demand"),
-                                "c2_demand": element.get("c2Demand"),
-                                "ecocomfort": element.get(
-                                    "ecocomfort"
-                                ),  # 0 = Eco, 1 = Comfort, -1 = No available mode
-                                "doingBoost": element.get("doingBoost"),
-                                "silent_mode": element.get(
-                                    "silentMode"
-                                ),  # 0 = Off, 1 = On
-                                "current_temperature": element.get(
-                                    "currentTemperature"
-                                ),
-                                "setting_temperature": self.get_current_temperature(
-                                    element
-                                ),
-                                "zone_id": element.get("elementType"),
-                                "fan1_speed": element.get(
-                                    "fan1Speed"
-                                ),  # Fan speed for C1 circuit
-                                "fan2_speed": element.get(
-                                    "fan2Speed"
-                                ),  # Fan speed for C2 circuit
-                            }
-
-                            # Add enhanced alarm fields
-                            # Note: installation_devices_data is not available here,
-                            # but coordinator can enrich with this data later if needed
-                            sensor["unit_type"] = self.get_unit_type(sensor, None)
-                            sensor["alarm_code_formatted"] = (
-                                self.get_alarm_code_formatted(alarm_code)
-                            )
-                            sensor["alarm_origin"] = self.get_alarm_origin(
-                                alarm_code, sensor["unit_type"], None
-                            )
-
-                            sensors.append(sensor)
-                        _LOGGER.debug("Retrieved Sensors: %s", redact_data(sensors))
-                        data_elements = {"common_data": common_data, "sensors": sensors}
                         _LOGGER.debug(
-                            "Retrieved Data Elements: %s", redact_data(data_elements)
+                            "Retrieved Sensors: %s",
+                            LazyRedact(data_elements["sensors"]),
+                        )
+                        _LOGGER.debug(
+                            "Retrieved Data Elements: %s", LazyRedact(data_elements)
                         )
                         return data_elements
 
@@ -449,16 +458,93 @@ class CSNetHomeAPI:
             self.logged_in = False
             return None
 
+    def _parse_elements_data(self, data, alarm_catalog: AlarmCatalog):
+        """Build the sensors of the elements response.
+
+        Return the response with the data elements, or with None when the
+        response does not report a success. Runs in the executor for large
+        installations, so it must not touch the event loop nor change the
+        state of the API: the alarm catalog is given by the caller.
+        """
+        if not isinstance(data, dict) or data.get("status") != "success":
+            return data, None
+
+        # Parse the sensor data from the API response
+        elements = data.get("data", {}).get("elements", [])
+        sensors = []
+
+        common_data = {
+            "name": data.get("data", {}).get("name"),
+            "latitude": data.get("data", {}).get("latitude"),
+            "longitude": data.get("data", {}).get("longitude"),
+            "weather_temperature": data.get("data", {}).get("weatherTemperature"),
+            "device_status": {
+                device.get("id"): {
+                    "name": device.get("name"),
+                    "status": device.get("status"),
+                    "firmware": device.get("firmware"),
+                    "lastComm": device.get("lastComm"),
+                    "rssi": device.get("rssi"),
+                    "currentTimeMillis": device.get("currentTimeMillis"),
+                }
+                for device in data.get("data", {}).get("device_status", [])
+            },
+        }
+        for index, element in enumerate(elements):
+            alarm_code = element.get("alarmCode")
+            alarm = alarm_catalog.lookup(alarm_code)
+            sensor = {
+                "device_name": element.get("deviceName") or "Remote",
+                "device_id": element.get("deviceId"),
+                "room_name": element.get("parentName")
+                or f"Room-{element.get('parentId')}-{index}",
+                "parent_id": element.get("parentId"),
+                "room_id": element.get("roomId"),
+                "operation_status": element.get("operationStatus"),
+                "mode": element.get("mode"),  # 0 = cool, 1 = heat, 2 = auto
+                "real_mode": element.get("realMode"),
+                "on_off": element.get("onOff"),  # 0 = Off, 1 = On
+                "timer_running": element.get("timerRunning"),
+                "alarm_code": alarm_code,
+                "alarm_message": alarm.message,
+                "c1_demand": element.get("c1Demand"),
+                "c2_demand": element.get("c2Demand"),
+                "ecocomfort": element.get(
+                    "ecocomfort"
+                ),  # 0 = Eco, 1 = Comfort, -1 = No available mode
+                "doingBoost": element.get("doingBoost"),
+                "silent_mode": element.get("silentMode"),  # 0 = Off, 1 = On
+                "current_temperature": element.get("currentTemperature"),
+                "setting_temperature": self.get_current_temperature(element),
+                "zone_id": element.get("elementType"),
+                "fan1_speed": element.get("fan1Speed"),  # Fan speed for C1 circuit
+                "fan2_speed": element.get("fan2Speed"),  # Fan speed for C2 circuit
+            }
+
+            # Add enhanced alarm fields
+            # Note: installation_devices_data is not available here,
+            # but coordinator can enrich with this data later if needed
+            sensor["unit_type"] = self.get_unit_type(sensor, None)
+            sensor["alarm_code_formatted"] = alarm.formatted_code
+            sensor["alarm_origin"] = (
+                alarm.origin if origin_applies(sensor["unit_type"]) else ""
+            )
+
+            sensors.append(ZoneState(**sensor))
+        return data, {"common_data": common_data, "sensors": sensors}
+
     async def async_get_installation_devices_data(self):
         """Get installation devices data from the cloud service."""
+        return await self._async_call_with_login(
+            self._async_fetch_installation_devices_data
+        )
+
+    async def _async_fetch_installation_devices_data(self):
+        """Request the installation devices payload once."""
         installation_devices_url = (
             f"{self.base_url}{INSTALLATION_DEVICES_PATH}?installationId=-1"
         )
 
-        if not self.session or not self.logged_in:
-            _LOGGER.warning("No active session found.")
-            await self.async_login()
-
         headers = COMMON_API_HEADERS | {
             "accept": "application/json, text/javascript, */*; q=0.01",
             "x-requested-with": "XMLHttpRequest",
@@ -472,10 +558,15 @@ class CSNetHomeAPI:
                 async with self.session.get(
                     installation_devices_url, headers=headers, cookies=request_cookies
                 ) as response:
-                    data = await self.check_api_response(response)
+                    data = await self.check_api_response(
+                        response, cache_key=INSTALLATION_DEVICES_PATH
+                    )
+                    if data is None and not self.logged_in:
+                        # Expired session, the caller logs in and retries
+                        return None
                     if data is not None:
                         _LOGGER.debug(
-                            "Installation devices data retrieved: %s", redact_data(data)
+                            "Installation devices data retrieved: %s", LazyRedact(data)
                         )
                         return data
                     _LOGGER.error("Error in installation devices API response")
@@ -490,16 +581,15 @@ class CSNetHomeAPI:
         if not self.installation_id:
             _LOGGER.debug("No installation ID available, skipping alarm fetch")
             return None
+        return await self._async_call_with_login(self._async_fetch_installation_alarms)
 
+    async def _async_fetch_installation_alarms(self):
+        """Request the installation alarms payload once."""
         installation_alarms_url = (
             f"{self.base_url}{INSTALLATION_ALARMS_PATH}"
             f"?installationId={self.installation_id}&_csrf={self.xsrf_token}"
         )
 
-        if not self.session or not self.logged_in:
-            _LOGGER.warning("No active session found.")
-            await self.async_login()
-
         headers = COMMON_API_HEADERS | {
             "accept": "*/*",
             "x-requested-with": "XMLHttpRequest",
@@ -513,10 +603,15 @@ class CSNetHomeAPI:
                 async with self.session.get(
                     installation_alarms_url, headers=headers, cookies=request_cookies
                 ) as response:
-                    data = await self.check_api_response(response)
+                    data = await self.check_api_response(
+                        response, cache_key=INSTALLATION_ALARMS_PATH
+                    )
+                    if data is None and not self.logged_in:
+                        # Expired session, the caller logs in and retries
+                        return None
                     if data is not None:
                         _LOGGER.debug(
-                            "Installation alarms data retrieved: %s", redact_data(data)
+                            "Installation alarms data retrieved: %s", LazyRedact(data)
                         )
                         return data
                     _LOGGER.error("Error in installation alarms API response")
@@ -548,26 +643,7 @@ class CSNetHomeAPI:
         Returns:
             dict or None: heatingStatus dictionary, or None if not found
         """
-        if not installation_devices_data:
-            return None
-
-        # Try direct access first (if already extracted)
-        heating_status = installation_devices_data.get("heatingStatus")
-        if heating_status:
-            return heating_status
-
-        # Navigate through: data[0].indoors[0].heatingStatus
-        data_array = installation_devices_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        return first_indoors.get("heatingStatus", {})
-
-        return None
+        return extract_indoors_section(installation_devices_data, "heatingStatus")
 
     def get_heating_setting_from_installation_devices(self, installation_devices_data):
         """Extract heatingSetting from installation devices data structure.
@@ -580,26 +656,7 @@ class CSNetHomeAPI:
         Returns:
             dict or None: heatingSetting dictionary, or None if not found
         """
-        if not installation_devices_data:
-            return None
-
-        # Try direct access first (if already extracted)
-        heating_setting = installation_devices_data.get("heatingSetting")
-        if heating_setting:
-            return heating_setting
-
-        # Navigate through: data[0].indoors[0].heatingSetting
-        data_array = installation_devices_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        return first_indoors.get("heatingSetting", {})
-
-        return None
+        return extract_indoors_section(installation_devices_data, "heatingSetting")
 
     def _validate_value(self, value, default):
         """Validate temperature limit value matching JavaScript validateValue logic.
@@ -729,11 +786,19 @@ class CSNetHomeAPI:
 
         return (min_temp, max_temp)
 
-    async def async_set_temperature(self, zone_id, parent_id, mode, **kwargs):
-        """Set the target temperature for a room."""
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
+    async def _async_post_heat_settings(self, indoor_id, fields) -> bool:
+        """POST one heat_setting form, logging in again if the session expired."""
+        result = await self._async_call_with_login(
+            lambda: self._async_send_heat_settings(indoor_id, fields)
+        )
+        return bool(result)
 
-        temperature = kwargs.get("temperature")
+    async def _async_send_heat_settings(self, indoor_id, fields) -> bool | None:
+        """POST one heat_setting form with the fields of an indoor unit.
+
+        Returns None when the session expired, without reading the login page.
+        """
+        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
 
         headers = COMMON_API_HEADERS | {
             "accept": "*/*",
@@ -744,9 +809,69 @@ class CSNetHomeAPI:
 
         data = {
             "orderStatus": "PENDING",
-            "indoorId": parent_id,
+            "indoorId": indoor_id,
+            **fields,
             "_csrf": self.xsrf_token,
         }
+
+        cookies = {
+            "XSRF-TOKEN": self.xsrf_token,
+            "acceptedCookies": "yes",
+        }
+
+        try:
+            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
+                async with self.session.post(
+                    settings_url, headers=headers, cookies=cookies, data=data
+                ) as response:
+                    if self.session_expired(response, json_expected=False):
+                        _LOGGER.debug("CSNet session expired, heat settings not sent")
+                        self.logged_in = False
+                        return None
+                    response_text = await response.text()
+                    _LOGGER.debug(
+                        "Set heat settings with payload=%s, status=%s, response=%s",
+                        LazyRedact(data),
+                        response.status,
+                        response_text,
+                    )
+                    if response.status != 200:
+                        _LOGGER.warning(
+                            "HTTP %s for heat settings of indoor %s: %s",
+                            response.status,
+                            indoor_id,
+                            response_text,
+                        )
+                        return False
+                    return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error(
+                "Error setting heat settings for indoor %s: %s", indoor_id, err
+            )
+            return False
+
+    async def async_write_heat_settings(self, indoor_id, fields) -> bool:
+        """Write heat_setting fields of an indoor unit.
+
+        Commands of one indoor unit are sent in order. The ones queued within
+        COMMAND_DEBOUNCE_DELAY for the same zone are merged into a single POST,
+        the last value winning for a field written more than once.
+        """
+        return await self.heat_settings.async_submit(indoor_id, fields)
+
+    @staticmethod
+    def _zone_fields(zone_id, parent_id):
+        """Return the fields identifying the zone targeted by a command."""
+        return {
+            "id": f"{parent_id}{zone_id}",  # device id + zone id
+            "updatedOn": str(int(time.time() * 1000)),  # current timestamp in ms
+        }
+
+    async def async_set_temperature(self, zone_id, parent_id, mode, **kwargs):
+        """Set the target temperature for a room."""
+        temperature = kwargs.get("temperature")
+
+        data = {}
         if zone_id == 3:
             data["settingTempDHW"] = str(int(temperature))
         elif zone_id == 4:
@@ -764,22 +889,10 @@ class CSNetHomeAPI:
         else:
             data[f"settingTempRoomZ{zone_id}"] = str(int(temperature * 10))
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response.raise_for_status()
-                    _LOGGER.debug("Temperature set to %s for %s", temperature, zone_id)
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error("Error setting temperature for %s: %s", zone_id, err)
-            return False
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug("Temperature set to %s for %s", temperature, zone_id)
+            return True
+        return False
 
     async def async_set_fixed_water_temperature(
         self, circuit: int, parent_id: int, mode: int, temperature: float
@@ -799,20 +912,7 @@ class CSNetHomeAPI:
         Returns:
             bool: True if successful, False otherwise
         """
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
-        data = {
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            "_csrf": self.xsrf_token,
-        }
+        data = {}
 
         # Set the appropriate fixed temperature field based on circuit and mode
         if mode == 1:  # Heating mode
@@ -826,89 +926,28 @@ class CSNetHomeAPI:
             _LOGGER.warning("Invalid mode %s for fixed water temperature", mode)
             return False
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response.raise_for_status()
-                    _LOGGER.debug(
-                        "Fixed water temperature set to %s for circuit %s (mode %s)",
-                        temperature,
-                        circuit,
-                        mode,
-                    )
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error(
-                "Error setting fixed water temperature for circuit %s: %s", circuit, err
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug(
+                "Fixed water temperature set to %s for circuit %s (mode %s)",
+                temperature,
+                circuit,
+                mode,
             )
-            return False
+            return True
+        return False
 
     async def set_water_heater_status(self, zone_id, parent_id, status):
         """Change the water heater forcing status."""
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
-        data = {
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            "boostDHW": status,
-            "_csrf": self.xsrf_token,
-        }
-
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response.raise_for_status()
-                    _LOGGER.debug(
-                        "Force water heater status to %s for %s", status, zone_id
-                    )
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error(
-                "Error forcing the water heater status for %s: %s", zone_id, err
-            )
-            return False
+        if await self.async_write_heat_settings(parent_id, {"boostDHW": status}):
+            _LOGGER.debug("Force water heater status to %s for %s", status, zone_id)
+            return True
+        return False
 
     async def async_set_hvac_mode(self, zone_id, parent_id, hvac_mode: str):
         """Set HVAC mode: HEAT, COOL, or OFF."""
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
         # Mapping from HA mode to CSNet parameters
         hvac_mode_lower = hvac_mode.lower()
-        data = {
-            "id": f"{parent_id}{zone_id}",  # device id + zone id
-            "updatedOn": str(int(time.time() * 1000)),  # current timestamp in ms
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            "_csrf": self.xsrf_token,
-        }
+        data = self._zone_fields(zone_id, parent_id)
 
         # For zone_id 5 (fixed temp circuit), use C1 in parameter names
         circuit_id = 1 if zone_id == 5 else zone_id
@@ -939,58 +978,16 @@ class CSNetHomeAPI:
             _LOGGER.warning("Unsupported hvac_mode=%s ignored", hvac_mode)
             return True
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug(
-                        "Set hvac_mode=%s with payload=%s, status=%s, response=%s",
-                        hvac_mode,
-                        redact_data(data),
-                        response.status,
-                        response_text,
-                    )
-                    if response.status != 200:
-                        _LOGGER.warning(
-                            "HTTP %s for hvac_mode=%s: %s",
-                            response.status,
-                            hvac_mode,
-                            response_text,
-                        )
-                        return False
-                    response.raise_for_status()
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error("Error setting hvac_mode=%s: %s", hvac_mode, err)
-            return False
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug("Set hvac_mode=%s for zone=%s", hvac_mode, zone_id)
+            return True
+        return False
 
     async def set_preset_modes(
         self, zone_id, parent_id, preset_mode, current_mode=None, on_off=None
     ):
         """Set the eco/comfort mode for a zone."""
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
-        data = {
-            "id": f"{parent_id}{zone_id}",  # device id + zone id
-            "updatedOn": str(int(time.time() * 1000)),  # current timestamp in ms
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            "_csrf": self.xsrf_token,
-        }
+        data = self._zone_fields(zone_id, parent_id)
 
         # For zone_id 5 (fixed temp circuit), use C1 in parameter names
         circuit_id = 1 if zone_id == 5 else zone_id
@@ -1016,38 +1013,10 @@ class CSNetHomeAPI:
         else:
             data[f"ecoModeC{circuit_id}"] = "1"
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug(
-                        "Set preset_mode=%s for zone=%s with payload=%s, status=%s, response=%s",
-                        preset_mode,
-                        zone_id,
-                        redact_data(data),
-                        response.status,
-                        response_text,
-                    )
-                    if response.status != 200:
-                        _LOGGER.warning(
-                            "HTTP %s for preset_mode=%s: %s",
-                            response.status,
-                            preset_mode,
-                            response_text,
-                        )
-                        return False
-                    response.raise_for_status()
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error("Error setting preset_mode for %s: %s", zone_id, err)
-            return False
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug("Set preset_mode=%s for zone=%s", preset_mode, zone_id)
+            return True
+        return False
 
     async def set_water_heater_mode(self, zone_id, parent_id, preset_mode):
         """Set the off/eco/performance demand mode for water_heater and swimming pool.
@@ -1055,21 +1024,7 @@ class CSNetHomeAPI:
         For DHW (zone_id=3): supports eco/performance/off
         For SWP (zone_id=4): supports on/off only
         """
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-        _LOGGER.debug("URL %s et mode %s", settings_url, preset_mode)
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
-        data = {
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            "_csrf": self.xsrf_token,
-        }
+        data = {}
 
         if zone_id == 3:  # DHW (water heater)
             if preset_mode == "performance":
@@ -1088,86 +1043,23 @@ class CSNetHomeAPI:
             elif preset_mode == "off":
                 data["runStopSWP"] = 0
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        _LOGGER.debug("Sending data (%s): ", redact_data(data))
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response.raise_for_status()
-                    response_text = (
-                        await response.text()
-                    )  # Récupère la réponse en texte
-                    _LOGGER.debug(
-                        "Réponse API (%s): %s", response.status, response_text
-                    )
-                    _LOGGER.debug("Set preset_mode to %s for %s", preset_mode, zone_id)
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error("Error setting preset_mode for %s: %s", zone_id, err)
-            return False
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug("Set preset_mode to %s for %s", preset_mode, zone_id)
+            return True
+        return False
 
     async def async_set_silent_mode(self, zone_id, parent_id, silent_mode: bool):
         """Set silent/quiet mode for a zone."""
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
         # For zone_id 5 (fixed temp circuit), use C1 in parameter names
         circuit_id = 1 if zone_id == 5 else zone_id
 
-        data = {
-            "id": f"{parent_id}{zone_id}",  # device id + zone id
-            "updatedOn": str(int(time.time() * 1000)),  # current timestamp in ms
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            f"silentModeC{circuit_id}": "1" if silent_mode else "0",
-            "_csrf": self.xsrf_token,
-        }
-
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
+        data = self._zone_fields(zone_id, parent_id)
+        data[f"silentModeC{circuit_id}"] = "1" if silent_mode else "0"
 
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug(
-                        "Set silent_mode=%s for zone=%s with payload=%s, status=%s, response=%s",
-                        silent_mode,
-                        zone_id,
-                        redact_data(data),
-                        response.status,
-                        response_text,
-                    )
-                    if response.status != 200:
-                        _LOGGER.warning(
-                            "HTTP %s for silent_mode=%s: %s",
-                            response.status,
-                            silent_mode,
-                            response_text,
-                        )
-                        return False
-                    response.raise_for_status()
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error("Error setting silent_mode for %s: %s", zone_id, err)
-            return False
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug("Set silent_mode=%s for zone=%s", silent_mode, zone_id)
+            return True
+        return False
 
     async def async_set_fan_speed(
         self, zone_id, parent_id, fan_speed: int, circuit: int = 1
@@ -1180,59 +1072,15 @@ class CSNetHomeAPI:
             fan_speed: Fan speed value (0=off, 1=low, 2=medium, 3=auto)
             circuit: Circuit number (1 for C1, 2 for C2)
         """
-        settings_url = f"{self.base_url}{HEAT_SETTINGS_PATH}"
-
-        headers = COMMON_API_HEADERS | {
-            "accept": "*/*",
-            "x-requested-with": "XMLHttpRequest",
-            "content-type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "origin": self.base_url,
-        }
-
-        data = {
-            "id": f"{parent_id}{zone_id}",  # device id + zone id
-            "updatedOn": str(int(time.time() * 1000)),  # current timestamp in ms
-            "orderStatus": "PENDING",
-            "indoorId": parent_id,
-            f"fan{circuit}Speed": str(fan_speed),
-            "_csrf": self.xsrf_token,
-        }
+        data = self._zone_fields(zone_id, parent_id)
+        data[f"fan{circuit}Speed"] = str(fan_speed)
 
-        cookies = {
-            "XSRF-TOKEN": self.xsrf_token,
-            "acceptedCookies": "yes",
-        }
-
-        try:
-            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                async with self.session.post(
-                    settings_url, headers=headers, cookies=cookies, data=data
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug(
-                        "Set fan_speed=%s for zone=%s circuit=%s with payload=%s, status=%s, response=%s",
-                        fan_speed,
-                        zone_id,
-                        circuit,
-                        redact_data(data),
-                        response.status,
-                        response_text,
-                    )
-                    if response.status != 200:
-                        _LOGGER.warning(
-                            "HTTP %s for fan_speed=%s: %s",
-                            response.status,
-                            fan_speed,
-                            response_text,
-                        )
-                        return False
-                    response.raise_for_status()
-                    return True
-        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-            _LOGGER.error(
-                "Error setting fan_speed for %s circuit %s: %s", zone_id, circuit, err
+        if await self.async_write_heat_settings(parent_id, data):
+            _LOGGER.debug(
+                "Set fan_speed=%s for zone=%s circuit=%s", fan_speed, zone_id, circuit
             )
-            return False
+            return True
+        return False
 
     def is_fan_coil_compatible(self, installation_devices_data):
         """Check if the system supports fan coil control.
@@ -1383,8 +1231,11 @@ class CSNetHomeAPI:
 
     async def close(self):
         """Close the session after usage."""
+        if self._translations_task is not None and not self._translations_task.done():
+            self._translations_task.cancel()
+        await self.heat_settings.async_cancel()
         if self.session:
-            await self.session.close()
+            self.session.detach()
 
     async def check_logged_in(self, response):
         """Check if the login was successful.
@@ -1404,21 +1255,137 @@ class CSNetHomeAPI:
         self.logged_in = False
         return False
 
-    async def check_api_response(self, response):
+    @staticmethod
+    def session_expired(response, json_expected: bool = True) -> bool:
+        """Return whether a response is the answer to an expired session.
+
+        CSNet answers with its login page, or an authentication error, instead
+        of the requested data. Only the status, final URL and content type are
+        looked at so that the body of the login page is never read.
+        """
+        if response.status in (401, 403) or response.url.path == LOGIN_PATH:
+            return True
+        return (
+            json_expected
+            and response.status == 200
+            and response.content_type == "text/html"
+        )
+
+    async def check_api_response(self, response, transform=None, cache_key=None):
         """Check the API response status and return the JSON content.
 
-        If the status is not 200, log an error and return None.
+        If the session expired, clear ``logged_in`` and return None so that the
+        request is retried after a new login.
+        If the status is not 200, log a warning and return None.
         If the response is not JSON, log an error and return None.
-        If the response is JSON, return the content.
+        If the response is JSON, return the content, passed through
+        ``transform`` when one is given. Responses larger than
+        ``decode_offload_threshold`` are decoded and transformed in the
+        executor; the time spent on the event loop otherwise is recorded.
+        With a ``cache_key``, a body identical to the previous one of the same
+        key is not decoded again: the previous result object is returned.
         """
-        if response.status == 200:
-            try:
-                data = await response.json()
+        if self.session_expired(response):
+            _LOGGER.debug(
+                "CSNet session expired (HTTP %s, %s)",
+                response.status,
+                response.content_type,
+            )
+            self.logged_in = False
+            return None
+        if response.status != 200:
+            _LOGGER.warning("API Response error: HTTP %s", response.status)
+            return None
+        try:
+            size = response.content_length
+            if isinstance(size, int) and size > self.decode_offload_threshold:
+                if "json" not in (response.content_type or ""):
+                    raise aiohttp.ContentTypeError(
+                        response.request_info,
+                        response.history,
+                        message=f"Unexpected content type {response.content_type}",
+                    )
+                body = await response.read()
+                digest, cached = self._lookup_response(cache_key, body)
+                if cached is not None:
+                    return cached
+                self.offloaded_decodes += 1
+                data = await self.hass.async_add_executor_job(
+                    self._decode_payload, body, transform
+                )
+                self._remember_response(cache_key, digest, data)
                 return data
-            except json.JSONDecodeError as e:
-                _LOGGER.error("API Response error: %s", e)
-                self.logged_in = False
-                return None
+
+            blocked = 0.0
+            digest = cached = None
+
+            def timed_loads(text):
+                nonlocal blocked, digest, cached
+                decode_started = time.perf_counter()
+                try:
+                    digest, cached = self._lookup_response(cache_key, text)
+                    return _UNCHANGED if cached is not None else json_loads(text)
+                finally:
+                    blocked += time.perf_counter() - decode_started
+
+            data = await response.json(loads=timed_loads)
+            if data is _UNCHANGED:
+                self._record_loop_block(blocked)
+                return cached
+            if transform is not None:
+                started = time.perf_counter()
+                data = transform(data)
+                blocked += time.perf_counter() - started
+            self._record_loop_block(blocked)
+            self._remember_response(cache_key, digest, data)
+            return data
+        except (aiohttp.ContentTypeError, json.JSONDecodeError) as e:
+            _LOGGER.error("API Response error: %s", e)
+            self.logged_in = False
+            return None
+
+    @staticmethod
+    def _decode_payload(body: bytes, transform=None):
+        """Decode a JSON body and apply the transform, in the executor."""
+        data = json_loads(body)
+        return transform(data) if transform is not None else data
+
+    def _lookup_response(self, cache_key, body):
+        """Return the digest of a body and the result cached for it, if any."""
+        if cache_key is None:
+            return None, None
+        if isinstance(body, str):
+            body = body.encode()
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None and cached[0] == digest:
+            self.unchanged_responses += 1
+            return digest, cached[1]
+        return digest, None
+
+    def _remember_response(self, cache_key, digest, data):
+        """Keep the result of a body for the next response of the same key."""
+        if digest is not None and data is not None:
+            self._response_cache[cache_key] = (digest, data)
+
+    def _record_loop_block(self, seconds: float):
+        """Account for time the event loop spent decoding a response."""
+        self.loop_block_time = seconds
+        self.loop_block_time_max = max(self.loop_block_time_max, seconds)
+
+    @property
+    def decode_metrics(self) -> dict:
+        """Return the response decoding counters, durations in milliseconds."""
+        return {
+            "offloaded": self.offloaded_decodes,
+            "unchanged": self.unchanged_responses,
+            "last_loop_block_ms": (
+                round(self.loop_block_time * 1000, 2)
+                if self.loop_block_time is not None
+                else None
+            ),
+            "max_loop_block_ms": round(self.loop_block_time_max * 1000, 2),
+        }
 
     def extract_cookie_value(self, cookies, cookie_name):
         """Extract a cookie value from a cookie jar.
@@ -1440,58 +1407,135 @@ class CSNetHomeAPI:
                 return cookie.value
         return None
 
+    def _translation_languages(self) -> list[str]:
+        """Return the languages to load, fallback first and preferred last."""
+        languages = [DEFAULT_LANGUAGE]
+        preferred = getattr(self, "preferred_language", None)
+        if preferred in LANGUAGE_FILES and preferred not in languages:
+            languages.append(preferred)
+        return languages
+
     async def load_translations(self):
-        """Load translations dictionaries for alarm messages (lazy)."""
-        if self.translations:
+        """Load translations dictionaries for alarm messages (lazy).
+
+        Cached bundles are applied straight from disk; the bundles are then
+        revalidated against the cloud in the background so that the first data
+        refresh never waits on the translation downloads.
+        """
+        if self.translations or (
+            self._translations_task is not None and not self._translations_task.done()
+        ):
+            # A download that ended without any bundle is retried on next call
             return
-        # load preferred language first, then fallback
-        endpoints = []
-        preferred = getattr(self, "preferred_language", None)
-        if preferred and preferred in LANGUAGE_FILES:
-            endpoints.append(LANGUAGE_FILES[preferred])
-        # ensure both are loaded to maximize hit rate
-        for key, file in LANGUAGE_FILES.items():
-            if file not in endpoints:
-                _LOGGER.debug("Adding language file for %s", key)
-                endpoints.append(file)
+
+        languages = self._translation_languages()
+        cached_bundles = {}
+        if self.translations_store is not None:
+            stored = await self.translations_store.async_load() or {}
+            cached_bundles = {
+                language: bundle
+                for language, bundle in stored.get("bundles", {}).items()
+                if language in languages
+            }
+        if cached_bundles:
+            self._apply_translation_bundles(languages, cached_bundles)
+
+        self._ensure_client_session()
+        self._translations_task = self.hass.async_create_background_task(
+            self._async_refresh_translations(languages, cached_bundles),
+            "csnet_home_translations",
+        )
+
+    def _apply_translation_bundles(self, languages, bundles):
+        """Merge bundles so that the preferred language wins over the fallback."""
+        translations = {}
+        for language in languages:
+            bundle = bundles.get(language)
+            if bundle:
+                translations.update(bundle.get("data") or {})
+        self.translations = translations
+        # The parsed elements carry alarm texts of the previous translations
+        self._response_cache.pop(ELEMENTS_PATH, None)
+
+    async def _async_refresh_translations(self, languages, cached_bundles):
+        """Revalidate the translation bundles concurrently and cache them."""
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_translation_bundle(
+                    language, cached_bundles.get(language)
+                )
+                for language in languages
+            )
+        )
+        bundles = {
+            language: bundle
+            for language, bundle in zip(languages, results)
+            if bundle is not None
+        }
+        if not bundles or all(
+            bundle is cached_bundles.get(language)
+            for language, bundle in bundles.items()
+        ):
+            return
+
+        self._apply_translation_bundles(languages, bundles)
+        if self.translations_store is not None:
+            await self.translations_store.async_save({"bundles": bundles})
+        if self.translations_listener is not None:
+            self.translations_listener()
+
+    async def _async_fetch_translation_bundle(self, language, cached_bundle):
+        """Download one translation file, reusing the cached copy if unchanged."""
+        url = f"{self.base_url}/translations/{LANGUAGE_FILES[language]}"
         headers = COMMON_API_HEADERS | {
             "accept": "*/*",
             "x-requested-with": "XMLHttpRequest",
         }
-        for ep in endpoints:
-            url = f"{self.base_url}/translations/{ep}"
-            try:
-                async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
-                    async with self.session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # merge/overwrite keeping last language wins for same key
-                            self.translations.update(data or {})
-            except Exception as e:
-                _LOGGER.debug("Translation load failed for %s: %s", ep, e)
+        if cached_bundle:
+            if cached_bundle.get("etag"):
+                headers["if-none-match"] = cached_bundle["etag"]
+            if cached_bundle.get("last_modified"):
+                headers["if-modified-since"] = cached_bundle["last_modified"]
+
+        try:
+            async with async_timeout.timeout(DEFAULT_API_TIMEOUT):
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        _LOGGER.debug(
+                            "Cached translations still valid for %s", language
+                        )
+                        return cached_bundle
+                    if response.status == 200:
+                        return {
+                            "etag": response.headers.get("ETag"),
+                            "last_modified": response.headers.get("Last-Modified"),
+                            "data": await response.json() or {},
+                        }
+        except Exception as e:
+            _LOGGER.debug("Translation load failed for %s: %s", language, e)
+        return cached_bundle
+
+    @property
+    def alarm_catalog(self) -> AlarmCatalog:
+        """Return the alarm catalog of the currently loaded translations."""
+        if self._alarm_catalog is None or self._alarm_catalog_source is not (
+            self.translations
+        ):
+            self._alarm_catalog = AlarmCatalog(self.translations)
+            self._alarm_catalog_source = self.translations
+        return self._alarm_catalog
 
     def has_alarm_letter(self, alarm_code: int) -> bool:
         """Check if alarm code has letter format (BCD encoded)."""
-        if alarm_code is None:
-            return False
-        return (alarm_code & 0xFF00) > 0
+        return has_alarm_letter(alarm_code)
 
     def reverse_bcd(self, val: int) -> int:
         """Reverse BCD conversion for alarm codes."""
-        aux1 = (val // 10) - 1
-        aux2 = (val % 10) + 10
-        return (aux1 * 16) + aux2
+        return reverse_bcd(val)
 
     def get_alarm_code_formatted(self, alarm_code: int) -> str:
         """Format alarm code as hex (if BCD) or decimal."""
-        if alarm_code is None or alarm_code == 0:
-            return "0"
-
-        if self.has_alarm_letter(alarm_code):
-            # Extract low byte and convert it to hex directly (BCD format)
-            code_parsed = alarm_code & 0x00FF
-            return format(code_parsed, "X")
-        return str(alarm_code)
+        return format_alarm_code(alarm_code)
 
     def get_correct_rad_hex_error_code(self, alarm_code: int) -> int:
         """Apply RAD unit alarm code correction."""
@@ -1549,60 +1593,12 @@ class CSNetHomeAPI:
     ) -> str:
         """Get alarm origin description based on code and unit type."""
         # Only provide origin for Yutaki/water systems
-        if unit_type not in ["yutaki", "water_heater"]:
+        if not origin_applies(unit_type):
             return ""
-
-        if alarm_code is None or alarm_code == 0:
-            return ""
-
-        is_bcd = self.has_alarm_letter(alarm_code)
-
-        # Extract the raw byte value first (before reversing)
-        raw_value = (alarm_code & 0x00FF) if is_bcd else alarm_code
-
         # Note: R290 and mirror unit detection would be done here if
         # installation_devices_data is expanded in the future
-
-        # Map alarm codes to origin keys based on JavaScript implementation
-        origin_key = None
-
-        # BCD-specific origins (check raw value BEFORE reversing)
-        # Note: raw_value is the hex byte value (e.g., 0x62 = 98 decimal)
-        if is_bcd:
-            origin_key = BCD_ALARM_ORIGIN_MAP.get(raw_value)
-
-        # If we found a BCD-specific origin, return it
-        if origin_key and origin_key in self.translations:
-            return self.translations[origin_key]
-
-        # Now reverse the value for standard lookup
-        if is_bcd:
-            value = self.reverse_bcd(raw_value)
-        else:
-            value = alarm_code
-
-        # Standard alarm code origins
-        if not origin_key:
-            origin_key = ALARM_ORIGIN_MAP.get(value)
-
-        # Translate the origin key if found
-        if origin_key and origin_key in self.translations:
-            return self.translations[origin_key]
-
-        return ""
+        return self.alarm_catalog.lookup(alarm_code).origin
 
     def translate_alarm(self, code):
         """Return localized alarm message for a numeric code if available."""
-        if not code:
-            return None
-        # Keys observed on website are like 'alarm_XX' or 'alarm_XXX'
-        # Provide multiple candidates; first match wins
-        key_candidates = [
-            f"alarm_{code}",
-            f"alarm_{int(code):02d}",
-            f"alarm_{int(code):03d}",
-        ]
-        for key in key_candidates:
-            if key in self.translations:
-                return self.translations[key]
-        return None
+        return self.alarm_catalog.lookup(code).message
@@ -1,6 +1,5 @@
 """Create a Climate Component for Home Assistant."""
 
-import asyncio
 import logging
 
 from homeassistant.components.climate import (
@@ -11,7 +10,9 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.climate.const import FAN_ON, ClimateEntityFeature
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_FAN_COIL_MODEL,
@@ -31,10 +32,19 @@ from .const import (
     WATER_CIRCUIT_MAX_HEAT,
     WATER_CIRCUIT_MIN_HEAT,
 )
-from .helpers import extract_heating_status
+from .coordinator import TOPIC_HEATING_STATUS, TOPIC_INSTALLATION, sensor_key
+from .helpers import extract_heating_status, reported_setting_temperature
+from .models import replace_zone
 
 _LOGGER = logging.getLogger(__name__)
 
+# CSNet mode code of each HVAC mode
+HVAC_MODE_CODES = {
+    HVACMode.COOL: 0,
+    HVACMode.HEAT: 1,
+    HVACMode.HEAT_COOL: 2,
+}
+
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the climate platform for CSNet Home."""
@@ -62,11 +72,17 @@ async def async_setup_entry(hass, entry, async_add_entities):
     )
 
 
-class CSNetHomeClimate(ClimateEntity):
+class CSNetHomeClimate(CoordinatorEntity, ClimateEntity):
     """Representation of a thermostat (climate) entity."""
 
     def __init__(self, hass, entry, sensor_data, common_data):
         """Initialize the thermostat entity."""
+        self._sensor_key = sensor_key(sensor_data)
+        # The zone record, plus the installation data used for limits and OTC
+        super().__init__(
+            hass.data[DOMAIN][entry.entry_id]["coordinator"],
+            frozenset({self._sensor_key, TOPIC_INSTALLATION, TOPIC_HEATING_STATUS}),
+        )
         self.hass = hass
         self._sensor_data = sensor_data
         self._common_data = common_data
@@ -424,21 +440,35 @@ class CSNetHomeClimate(ClimateEntity):
             temperature=temperature,
         )
         if response:
-            self._sensor_data["setting_temperature"] = temperature
-            # For water circuits (zone 5, 6), refresh data to get updated fixed temperature
-            if zone_id in [5, 6]:
-                # Wait a short delay to ensure the server has processed the change
-                await asyncio.sleep(1.5)
-                # Request coordinator refresh to update the value immediately
-                coordinator = self.hass.data[DOMAIN][self.entry.entry_id]["coordinator"]
-                await coordinator.async_refresh()
+            # Hold the setpoint in the form the cloud will report it
+            expected = {
+                "setting_temperature": reported_setting_temperature(
+                    zone_id, temperature
+                )
+            }
+            self._sensor_data = replace_zone(self._sensor_data, expected)
+            self.async_write_ha_state()
+            # Poll quickly until the cloud reports the new setpoint
+            self.coordinator.async_expect_fields(self._sensor_key, expected)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):
         """Set new target hvac mode."""
         cloud_api = self.hass.data[DOMAIN][self.entry.entry_id]["api"]
-        await cloud_api.async_set_hvac_mode(
+        response = await cloud_api.async_set_hvac_mode(
             self._sensor_data["zone_id"], self._sensor_data["parent_id"], hvac_mode
         )
+        if response:
+            # Optimistically update the sensor data until the next refresh
+            if hvac_mode == HVACMode.OFF:
+                expected = {"on_off": 0}
+            elif hvac_mode in HVAC_MODE_CODES:
+                expected = {"on_off": 1, "mode": HVAC_MODE_CODES[hvac_mode]}
+            else:
+                expected = {}
+            self._sensor_data = replace_zone(self._sensor_data, expected)
+            self.async_write_ha_state()
+            if expected:
+                self.coordinator.async_expect_fields(self._sensor_key, expected)
 
     async def async_turn_on(self) -> None:
         """Turn the climate device on (preserve current mode if possible)."""
@@ -471,7 +501,15 @@ class CSNetHomeClimate(ClimateEntity):
             on_off=self._sensor_data.get("on_off"),
         )
         if response:
-            self._sensor_data["ecocomfort"] = 1 if preset_mode == "eco" else 0
+            # ecocomfort reports 0 for eco and 1 for comfort
+            ecocomfort = 0 if preset_mode == "eco" else 1
+            self._sensor_data = replace_zone(
+                self._sensor_data, {"ecocomfort": ecocomfort}
+            )
+            self.async_write_ha_state()
+            self.coordinator.async_expect_fields(
+                self._sensor_key, {"ecocomfort": ecocomfort}
+            )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new fan mode (fan speed for fan coil, silent mode otherwise)."""
@@ -515,7 +553,13 @@ class CSNetHomeClimate(ClimateEntity):
                 self._assumed_fan_mode = fan_mode
                 # Optimistically update the sensor data
                 fan_speed_key = f"fan{circuit}_speed"
-                self._sensor_data[fan_speed_key] = fan_speed
+                self._sensor_data = replace_zone(
+                    self._sensor_data, {fan_speed_key: fan_speed}
+                )
+                self.async_write_ha_state()
+                self.coordinator.async_expect_fields(
+                    self._sensor_key, {fan_speed_key: fan_speed}
+                )
         else:
             # For non-fan coil systems, set silent mode
             silent_mode = fan_mode == FAN_ON
@@ -527,7 +571,13 @@ class CSNetHomeClimate(ClimateEntity):
             if response:
                 self._assumed_fan_mode = fan_mode
                 # Optimistically update the sensor data
-                self._sensor_data["silent_mode"] = 1 if silent_mode else 0
+                self._sensor_data = replace_zone(
+                    self._sensor_data, {"silent_mode": 1 if silent_mode else 0}
+                )
+                self.async_write_ha_state()
+                self.coordinator.async_expect_fields(
+                    self._sensor_key, {"silent_mode": self._sensor_data["silent_mode"]}
+                )
 
     def is_heating(self):
         """Return true if the thermostat is currently heating."""
@@ -551,22 +601,15 @@ class CSNetHomeClimate(ClimateEntity):
             < self._sensor_data.get("current_temperature")
         )
 
-    async def async_update(self):
-        """Update the thermostat data from the API."""
-        _LOGGER.debug("Updating CSNet Home refresh request %s", self._attr_name)
-        coordinator = self.hass.data[DOMAIN][self.entry.entry_id]["coordinator"]
-        if not coordinator:
-            _LOGGER.error("No coordinator instance found!")
-            return
-        await coordinator.async_request_refresh()
-        self._sensor_data = next(
-            (
-                x
-                for x in coordinator.get_sensors_data()
-                if x.get("room_name") == self._attr_name
-            ),
-            None,
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the thermostat with the data pushed by the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Read the zone record of the thermostat from the coordinator."""
+        self._sensor_data = self.coordinator.get_sensor(self._sensor_key)
         if self._sensor_data is None:
             _LOGGER.warning(
                 "No sensor data found for room %s after coordinator refresh",
@@ -589,7 +632,7 @@ class CSNetHomeClimate(ClimateEntity):
         else:
             self._assumed_fan_mode = api_fan_mode
 
-        self._common_data = coordinator.get_common_data()
+        self._common_data = self.coordinator.get_common_data()
         # reset cached limits after data refresh
         self._cached_limits = None
 
@@ -0,0 +1,176 @@
+"""Ordered execution of the heat setting commands sent to the CSNet Home cloud."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _Command:
+    """Fields written by one setter call, waiting for their POST."""
+
+    fields: dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class HeatSettingsExecutor:
+    """Send the heat_setting writes of each indoor unit in order.
+
+    Every ``indoorId`` gets a bounded queue consumed by its own worker, so the
+    commands of one unit are sent one POST at a time, in the order they were
+    issued; the worker stops once the queue is empty. Once a command is picked
+    up the worker waits ``delay`` seconds, then merges each run of queued
+    commands that target the same zone into a single form: a field written
+    twice keeps the value of the newest command, and commands whose fields
+    were all rewritten are superseded. The zone is the ``id`` field of the
+    form; forms without one join the zone of the command before them. A
+    command for another zone starts a new form, so the POSTs keep the order
+    of the commands and unit-wide fields such as ``mode`` end with the newest
+    value. Every command gets the result of the POST that carried its batch.
+    A full queue makes callers wait until the worker catches up.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any, dict[str, Any]], Awaitable[bool]],
+        delay: float,
+        max_queued: int,
+    ) -> None:
+        """Initialize the executor with the coroutine posting one form."""
+        self._send = send
+        self._delay = delay
+        self._max_queued = max_queued
+        self._queues: dict[Any, asyncio.Queue[_Command]] = {}
+        self._workers: dict[Any, asyncio.Task] = {}
+        self._closed = False
+        self.queued_count = 0
+        self.superseded_count = 0
+        self.sent_count = 0
+        self.last_latency: float | None = None
+        self.max_latency = 0.0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the counters of the executor, latencies in milliseconds."""
+        return {
+            "queued": self.queued_count,
+            "pending": sum(queue.qsize() for queue in self._queues.values()),
+            "superseded": self.superseded_count,
+            "sent": self.sent_count,
+            "last_latency_ms": (
+                round(self.last_latency * 1000, 1)
+                if self.last_latency is not None
+                else None
+            ),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+        }
+
+    async def async_submit(self, indoor_id, fields: dict[str, Any]) -> bool:
+        """Queue fields for an indoor unit and wait for the write carrying them."""
+        if self._closed:
+            return False
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(indoor_id)
+        if queue is None:
+            queue = self._queues[indoor_id] = asyncio.Queue(self._max_queued)
+            self._workers[indoor_id] = loop.create_task(
+                self._async_worker(indoor_id, queue)
+            )
+        command = _Command(dict(fields), loop.create_future(), time.monotonic())
+        if queue.full():
+            _LOGGER.debug("Heat setting queue of indoor %s is full", indoor_id)
+        await queue.put(command)
+        if self._closed:
+            # The executor was cancelled while waiting for room in the queue
+            return False
+        self.queued_count += 1
+        # A cancelled caller must not cancel the write shared with the others
+        return await asyncio.shield(command.future)
+
+    async def _async_worker(self, indoor_id, queue: asyncio.Queue) -> None:
+        """Send the queued commands of an indoor unit, one batch at a time."""
+        while not queue.empty():
+            commands = [queue.get_nowait()]
+            try:
+                # Leave time to the other commands of the same action to arrive
+                await asyncio.sleep(self._delay)
+                while not queue.empty():
+                    commands.append(queue.get_nowait())
+                batches: list[list[_Command]] = []
+                target = None
+                for command in commands:
+                    # Forms without an id only carry fields named after their
+                    # zone, they can share the form of the previous command
+                    command_target = command.fields.get("id", target)
+                    if not batches or command_target != target:
+                        batches.append([])
+                    target = command_target
+                    batches[-1].append(command)
+                for batch in batches:
+                    await self._async_send_batch(indoor_id, batch)
+            except asyncio.CancelledError:
+                for command in commands:
+                    if not command.future.done():
+                        command.future.set_result(False)
+                raise
+        # Nothing left to send, the next command starts a new worker
+        del self._queues[indoor_id]
+        del self._workers[indoor_id]
+
+    async def _async_send_batch(self, indoor_id, commands: list[_Command]) -> None:
+        """Merge the fields of the commands into one form and send it."""
+        fields: dict[str, Any] = {}
+        for command in commands:
+            fields.update(command.fields)
+
+        written: set[str] = set()
+        superseded = 0
+        for command in reversed(commands):
+            if command.fields and command.fields.keys() <= written:
+                superseded += 1
+            written.update(command.fields)
+        self.superseded_count += superseded
+        if len(commands) > 1:
+            _LOGGER.debug(
+                "Merged %s heat setting commands for indoor %s (%s superseded)",
+                len(commands),
+                indoor_id,
+                superseded,
+            )
+
+        self.sent_count += 1
+        try:
+            result = await self._send(indoor_id, fields)
+        except Exception as err:
+            for command in commands:
+                if not command.future.done():
+                    command.future.set_exception(err)
+                    # Callers that were cancelled never read the error
+                    command.future.exception()
+        else:
+            for command in commands:
+                command.future.set_result(result)
+
+        latency = time.monotonic() - commands[0].enqueued_at
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+    async def async_cancel(self) -> None:
+        """Stop the workers and fail the commands that were not sent yet."""
+        self._closed = True
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in self._queues.values():
+            while not queue.empty():
+                command = queue.get_nowait()
+                command.future.set_result(False)
+        self._workers.clear()
+        self._queues.clear()
@@ -5,13 +5,20 @@ import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
+from homeassistant.core import callback
 
 from .const import (
+    CONF_ALARMS_INTERVAL,
     CONF_FAN_COIL_MODEL,
+    CONF_INSTALLATION_DEVICES_INTERVAL,
     CONF_LANGUAGE,
     CONF_MAX_TEMP_OVERRIDE,
+    CONF_STALE_GRACE_PERIOD,
+    DEFAULT_ALARMS_INTERVAL,
     DEFAULT_FAN_COIL_MODEL,
+    DEFAULT_INSTALLATION_DEVICES_INTERVAL,
     DEFAULT_LANGUAGE,
+    DEFAULT_STALE_GRACE_PERIOD,
     DOMAIN,
     FAN_COIL_MODEL_LEGACY,
     FAN_COIL_MODEL_STANDARD,
@@ -28,6 +35,12 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow setting the polling intervals."""
+        return CsnetHomeOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         """Handle user input for login credentials."""
         errors = {}
@@ -47,7 +60,6 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data={
                         CONF_USERNAME: user_input[CONF_USERNAME],
                         CONF_PASSWORD: user_input[CONF_PASSWORD],
-                        CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
                         CONF_LANGUAGE: user_input.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
                         CONF_MAX_TEMP_OVERRIDE: user_input.get(CONF_MAX_TEMP_OVERRIDE),
                         # Store the Fan coil control type
@@ -55,6 +67,8 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             CONF_FAN_COIL_MODEL, DEFAULT_FAN_COIL_MODEL
                         ),
                     },
+                    # The polling intervals live in the options
+                    options={CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL]},
                 )
 
         return self.async_show_form(
@@ -121,6 +135,8 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_reconfigure(self, user_input=None):
         """Handle reconfiguration of the integration."""
         reconfigure_entry = self._get_reconfigure_entry()
+        # Entries set up before keep the scan interval in their data
+        settings = {**reconfigure_entry.data, **reconfigure_entry.options}
         errors = {}
 
         if user_input is not None:
@@ -138,13 +154,16 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data_updates={
                         CONF_USERNAME: user_input[CONF_USERNAME],
                         CONF_PASSWORD: user_input[CONF_PASSWORD],
-                        CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
                         CONF_LANGUAGE: user_input.get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
                         CONF_MAX_TEMP_OVERRIDE: user_input.get(CONF_MAX_TEMP_OVERRIDE),
                         CONF_FAN_COIL_MODEL: user_input.get(
                             CONF_FAN_COIL_MODEL, DEFAULT_FAN_COIL_MODEL
                         ),
                     },
+                    options={
+                        **reconfigure_entry.options,
+                        CONF_SCAN_INTERVAL: user_input[CONF_SCAN_INTERVAL],
+                    },
                 )
 
         # Show form pre-populated with current values
@@ -160,9 +179,7 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ): str,
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
-                        default=reconfigure_entry.data.get(
-                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                        ),
+                        default=settings.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                     ): int,
                     vol.Optional(
                         CONF_LANGUAGE,
@@ -238,3 +255,44 @@ class CsnetHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class CsnetHomeOptionsFlow(config_entries.OptionsFlow):
+    """Handle the polling intervals of CSNet Home."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the refresh interval of each CSNet endpoint."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        settings = {**self.config_entry.data, **self.config_entry.options}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=settings.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Required(
+                        CONF_INSTALLATION_DEVICES_INTERVAL,
+                        default=settings.get(
+                            CONF_INSTALLATION_DEVICES_INTERVAL,
+                            DEFAULT_INSTALLATION_DEVICES_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Required(
+                        CONF_ALARMS_INTERVAL,
+                        default=settings.get(
+                            CONF_ALARMS_INTERVAL, DEFAULT_ALARMS_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10)),
+                    vol.Required(
+                        CONF_STALE_GRACE_PERIOD,
+                        default=settings.get(
+                            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                }
+            ),
+        )
@@ -7,12 +7,42 @@ ELEMENTS_PATH = "/data/elements"
 INSTALLATION_DEVICES_PATH = "/data/installationdevices"
 INSTALLATION_ALARMS_PATH = "/data/installationalarms"
 HEAT_SETTINGS_PATH = "/data/indoor/heat_setting"
+SESSION_STORAGE_KEY = f"{DOMAIN}.session"
+SESSION_STORAGE_VERSION = 1
+# Sessions logged in by the config flow, handed over to the entry setup
+VALIDATED_SESSIONS = f"{DOMAIN}.validated_sessions"
+# Age (seconds) after which a validated session is no longer handed over
+VALIDATED_SESSION_MAX_AGE = 300
+TRANSLATIONS_STORAGE_KEY = f"{DOMAIN}.translations"
+TRANSLATIONS_STORAGE_VERSION = 1
 CONF_ENABLE_DEVICE_LOGGING = "enable_device_logging"
 CONF_MAX_TEMP_OVERRIDE = "max_temp_override"
 CONF_FAN_COIL_MODEL = "fan_coil_model"
 FAN_COIL_MODEL_STANDARD = "standard"
 FAN_COIL_MODEL_LEGACY = "legacy"
 DEFAULT_FAN_COIL_MODEL = FAN_COIL_MODEL_STANDARD
+# Refresh intervals (seconds) of the slower endpoints; elements follow the
+# scan interval and are fetched on every refresh
+CONF_INSTALLATION_DEVICES_INTERVAL = "installation_devices_interval"
+CONF_ALARMS_INTERVAL = "alarms_interval"
+DEFAULT_INSTALLATION_DEVICES_INTERVAL = 60
+DEFAULT_ALARMS_INTERVAL = 600
+# Seconds the last good data is kept when refreshes fail, before the entities
+# become unavailable
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+DEFAULT_STALE_GRACE_PERIOD = 600
+# Adaptive polling (seconds): short refreshes after a command until the cloud
+# reports the change, wider ones while nothing changes, backoff on failures
+POLL_BURST_INTERVAL = 5
+POLL_BURST_DURATION = 60
+POLL_IDLE_REFRESHES = 5
+POLL_IDLE_MAX_INTERVAL = 300
+POLL_BACKOFF_MAX_INTERVAL = 900
+POLL_BACKOFF_JITTER = 0.2
+# Seconds waited after the expected report of a device before polling
+POLL_REPORT_MARGIN = 3
+# Seconds an optimistic value is held until the cloud reports it
+PENDING_CHANGE_TIMEOUT = 90
 
 COMMON_API_HEADERS = {
     "accept-language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
@@ -22,6 +52,12 @@ COMMON_API_HEADERS = {
     "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
 }
 DEFAULT_API_TIMEOUT = 10
+# Window during which heat_setting commands of one indoor unit are merged
+COMMAND_DEBOUNCE_DELAY = 0.3
+# Commands an indoor unit can have waiting before setters have to wait
+COMMAND_QUEUE_MAX_SIZE = 20
+# Response size (bytes) above which JSON decoding runs in the executor
+DECODE_OFFLOAD_THRESHOLD = 64 * 1024
 
 WATER_HEATER_MAX_TEMPERATURE = 80
 WATER_HEATER_MIN_TEMPERATURE = 30
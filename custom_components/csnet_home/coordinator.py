@@ -1,27 +1,194 @@
 """Coordinator Class to centralise all data fetching from CSNet Home."""
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import timedelta
-
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-
-from .const import DOMAIN
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import (
+    DEFAULT_STALE_GRACE_PERIOD,
+    DOMAIN,
+    PENDING_CHANGE_TIMEOUT,
+    POLL_BACKOFF_JITTER,
+    POLL_BACKOFF_MAX_INTERVAL,
+    POLL_BURST_DURATION,
+    POLL_BURST_INTERVAL,
+    POLL_IDLE_MAX_INTERVAL,
+    POLL_IDLE_REFRESHES,
+    POLL_REPORT_MARGIN,
+)
+from .helpers import extract_heating_status
+from .models import EMPTY_SNAPSHOT, InstallationSnapshot, replace_zone
+from .polling import AdaptivePolling
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener context topics, besides the sensor keys of the zone records.
+# Entities subscribe with a frozenset of topics and are only written when one
+# of them changed in the last refresh.
+TOPIC_COMMON = "common"
+TOPIC_ALARMS = "alarms"
+TOPIC_INSTALLATION = "installation"
+TOPIC_HEATING_STATUS = "heatingStatus"
+
+_INSTALLATION_KEYS = ("installation_devices", "installation_alarms")
+
+# Endpoints refreshed on their own interval, elements are fetched every time
+ENDPOINT_INSTALLATION_DEVICES = "installation_devices"
+ENDPOINT_ALARMS = "alarms"
+_SLOW_ENDPOINTS = (ENDPOINT_INSTALLATION_DEVICES, ENDPOINT_ALARMS)
+
+
+def heating_status_topic(field: str) -> tuple:
+    """Return the topic of a single heatingStatus field."""
+    return (TOPIC_HEATING_STATUS, field)
+
+
+def _strip_heating_status(installation_devices_data: dict) -> dict:
+    """Return the installation payload without the first indoor heatingStatus."""
+    data_array = installation_devices_data.get("data")
+    if not (
+        isinstance(data_array, list) and data_array and isinstance(data_array[0], dict)
+    ):
+        return installation_devices_data
+    indoors_array = data_array[0].get("indoors")
+    if not (
+        isinstance(indoors_array, list)
+        and indoors_array
+        and isinstance(indoors_array[0], dict)
+    ):
+        return installation_devices_data
+    first_indoors = {
+        key: value
+        for key, value in indoors_array[0].items()
+        if key != TOPIC_HEATING_STATUS
+    }
+    first_device = {**data_array[0], "indoors": [first_indoors, *indoors_array[1:]]}
+    return {**installation_devices_data, "data": [first_device, *data_array[1:]]}
+
+
+def sensor_key(sensor_data: dict) -> tuple:
+    """Return the key identifying a zone record across refreshes."""
+    return (
+        sensor_data.get("device_id"),
+        sensor_data.get("parent_id"),
+        sensor_data.get("zone_id"),
+    )
+
+
+@dataclass(slots=True, eq=False)
+class PendingChange:
+    """Field values written to a zone that the cloud has not reported yet."""
+
+    key: tuple
+    fields: dict[str, Any]
+    issued_at: float
+    deadline: float
+
+
+@dataclass(slots=True)
+class DeviceWatermark:
+    """Last report of a device, as dated by the cloud."""
+
+    last_comm: int
+    # Cloud clock (ms) and local monotonic clock (s) when it was fetched
+    server_time: int
+    fetched_at: float
+    # Shortest interval (s) seen between two reports
+    period: float | None = None
+
+    def next_report_delay(self, now: float) -> float | None:
+        """Return the seconds until the device is expected to report again."""
+        if not self.period:
+            return None
+        age = (self.server_time - self.last_comm) / 1000 + now - self.fetched_at
+        return -age % self.period
+
 
 class CSNetHomeCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch all sensor data from the cloud API."""
 
-    def __init__(self, hass: HomeAssistant, update_interval: int, entry_id: str):
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        update_interval: int,
+        entry_id: str,
+        endpoint_intervals: dict[str, int] | None = None,
+        stale_grace_period: int = DEFAULT_STALE_GRACE_PERIOD,
+    ):
+        """Initialize the coordinator.
+
+        endpoint_intervals sets how often, in seconds, the installation devices
+        and alarms endpoints are requested; elements are fetched on every
+        refresh and the other endpoints default to the same pace.
+        stale_grace_period is how long, in seconds, the last good data is
+        served when refreshes fail before the update is reported as failed.
+        """
         _LOGGER.debug("Configuring CSNetHome Coordinator")
         self.hass = hass
         self.entry_id = entry_id
         self.update_interval = timedelta(seconds=update_interval)
+        self._endpoint_intervals = {
+            endpoint: (endpoint_intervals or {}).get(endpoint, update_interval)
+            for endpoint in _SLOW_ENDPOINTS
+        }
+        # Last successful response of the slower endpoints and when it arrived
+        self._endpoint_cache: dict[str, dict] = {}
+        self._endpoint_fetched_at: dict[str, float] = {}
+        self._endpoint_failed: set[str] = set()
+        self._polling = AdaptivePolling(
+            update_interval,
+            burst_interval=POLL_BURST_INTERVAL,
+            burst_duration=POLL_BURST_DURATION,
+            idle_refreshes=POLL_IDLE_REFRESHES,
+            idle_max_interval=POLL_IDLE_MAX_INTERVAL,
+            backoff_max_interval=POLL_BACKOFF_MAX_INTERVAL,
+            jitter=POLL_BACKOFF_JITTER,
+        )
+        # Checks of the commands waiting for the cloud to report their change
+        self._burst_checks: list[Callable[[], bool]] = []
+        self._fetch_failed = False
+        self._stale_grace_period = stale_grace_period
+        # When the data served was last fetched successfully (monotonic)
+        self._last_good_at: float | None = None
+        # The last refresh failed and the previous data is served instead
+        self.stale = False
+        # Optimistic writes held over the zone records until they are echoed
+        self._pending_changes: list[PendingChange] = []
+        # Seconds between a command and the refresh reporting it
+        self.command_latency: float | None = None
+        self.command_latency_max = 0.0
+        self.confirmed_commands = 0
+        self.expired_commands = 0
         self._device_data = {"sensors": [], "common_data": {}}
+        # Objects returned by the API for the data served; the API hands the
+        # same objects back when the cloud responses did not change
+        self._sources: tuple | None = None
+        self.unchanged_refreshes = 0
+        # lastComm of each device; unchanged records of devices that did not
+        # report since the previous refresh are kept as they were
+        self._watermarks: dict[Any, DeviceWatermark] = {}
+        self.held_records = 0
+        self._sensor_index: dict[tuple, dict] = {}
+        self._installation_snapshot = EMPTY_SNAPSHOT
         self._last_alarm_codes: dict[str, int] = {}
+        # Duration (ms) of each fetch phase of the last refresh, for diagnostics
+        self.last_update_timings: dict[str, float] = {}
+        # Topics changed by the last refresh; None means notify every listener
+        self._changed_topics: set | None = None
+        self._notified_success: bool | None = None
+        # Entity state writes skipped because their data did not change
+        self.skipped_writes = 0
+        self.skipped_writes_total = 0
         super().__init__(
             hass,
             _LOGGER,
@@ -44,17 +211,68 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
         # ensure translations are loaded before elements to enrich alarm messages
         await cloud_api.load_translations()
 
-        # Fetch elements data, installation devices data, and alarms
-        elements_data = await cloud_api.async_get_elements_data()
-        installation_devices_data = (
-            await cloud_api.async_get_installation_devices_data()
-        )
-        installation_alarms_data = await cloud_api.async_get_installation_alarms()
-
-        if elements_data:
-            self._device_data = elements_data
-        else:
-            self._device_data = {"sensors": [], "common_data": {}}
+        previous_data = self._device_data
+        previous_index = self._sensor_index
+
+        (
+            elements_data,
+            installation_devices_data,
+            installation_alarms_data,
+        ) = await self._async_fetch_all(cloud_api)
+
+        self._fetch_failed = not elements_data
+        if not elements_data:
+            return self._last_good_data()
+        self._last_good_at = time.monotonic()
+        self.stale = False
+
+        sources = (elements_data, installation_devices_data, installation_alarms_data)
+        if (
+            self._sources is not None
+            and not self._pending_changes
+            and all(new is old for new, old in zip(sources, self._sources))
+        ):
+            # Every response matched the previous one byte for byte
+            self.unchanged_refreshes += 1
+            self._changed_topics = set()
+            return self._device_data
+        previous_sources, self._sources = self._sources, sources
+        common_data = dict(elements_data.get("common_data") or {})
+        held_devices = self._update_watermarks(common_data.get("device_status") or {})
+        # The enriched record of a device that did not report is kept while
+        # the cloud sends the same record and installation data
+        previous_records = {}
+        if (
+            held_devices
+            and previous_sources is not None
+            and installation_devices_data is previous_sources[1]
+        ):
+            previous_records = {
+                sensor_key(sensor): sensor
+                for sensor in previous_sources[0].get("sensors", [])
+            }
+        # Zone records are replaced, never changed in place: the records of the
+        # API stay intact for the next unchanged response
+        sensors = []
+        held = set()
+        for sensor in elements_data.get("sensors", []):
+            key = sensor_key(sensor)
+            previous = previous_index.get(key)
+            if (
+                previous is not None
+                and sensor.get("device_id") in held_devices
+                and previous_records.get(key) == sensor
+            ):
+                self.held_records += 1
+                held.add(key)
+                sensors.append(previous)
+            else:
+                sensors.append(sensor)
+        self._device_data = {
+            **elements_data,
+            "common_data": common_data,
+            "sensors": sensors,
+        }
 
         # Add installation devices data to common_data
         if installation_devices_data and self._device_data.get("common_data"):
@@ -68,21 +286,28 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
                 "installation_alarms"
             ] = installation_alarms_data
 
+        # Decode heatingStatus, heatingSetting and secondCycle once per poll
+        self._installation_snapshot = InstallationSnapshot.from_installation_devices(
+            installation_devices_data
+        )
+
         # Enrich sensor data with correct temperatures from installation devices data
         # This fixes issue #137: water heater (zone_id 3) and water circuits (zone_id 5, 6)
         # need temperatures from heatingStatus, not from elements API
         if installation_devices_data and self._device_data.get("sensors"):
-            heating_status = cloud_api.get_heating_status_from_installation_devices(
-                installation_devices_data
-            )
+            heating_status = self._installation_snapshot.heating_status
             if heating_status:
-                for sensor in self._device_data["sensors"]:
+                for index, sensor in enumerate(sensors):
+                    if sensor_key(sensor) in held:
+                        continue
                     zone_id = sensor.get("zone_id")
                     # For zone_id 3 (DHW/water heater), use tempDHW from heatingStatus
                     if zone_id == 3:
                         temp_dhw = heating_status.get("tempDHW")
                         if temp_dhw is not None:
-                            sensor["current_temperature"] = temp_dhw
+                            sensors[index] = replace_zone(
+                                sensor, {"current_temperature": temp_dhw}
+                            )
                             _LOGGER.debug(
                                 "Enriched zone_id 3 (DHW) current_temperature: %s",
                                 temp_dhw,
@@ -97,7 +322,9 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
                         if "heat" not in room_name:
                             temp_c1_water = heating_status.get("waterOutletHPTemp")
                             if temp_c1_water is not None:
-                                sensor["current_temperature"] = temp_c1_water
+                                sensors[index] = replace_zone(
+                                    sensor, {"current_temperature": temp_c1_water}
+                                )
                                 _LOGGER.debug(
                                     "Enriched zone_id 5 (C1_WATER) current_temperature: %s",
                                     temp_c1_water,
@@ -111,7 +338,9 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
                     elif zone_id == 6:
                         temp_c2_water = heating_status.get("waterOutlet2Temp")
                         if temp_c2_water is not None:
-                            sensor["current_temperature"] = temp_c2_water
+                            sensors[index] = replace_zone(
+                                sensor, {"current_temperature": temp_c2_water}
+                            )
                             _LOGGER.debug(
                                 "Enriched zone_id 6 (C2_WATER) current_temperature: %s",
                                 temp_c2_water,
@@ -120,6 +349,8 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
         # Raise notification if new alarm codes appear
         try:
             for sensor in self._device_data.get("sensors", []):
+                if sensor_key(sensor) in held:
+                    continue
                 key = f"{sensor.get('device_id')}-{sensor.get('room_id')}-{sensor.get('zone_id')}"
                 alarm_code = sensor.get("alarm_code")
                 if alarm_code is None or alarm_code == 0:
@@ -176,13 +407,427 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
         except Exception as exc:  # pragma: no cover - do not fail updates on notify
             _LOGGER.debug("Alarm notification handling error: %s", exc)
 
+        self._build_sensor_index()
+        self._apply_pending_changes()
+        self._changed_topics = self._diff_topics(previous_data, previous_index)
+        return self._device_data
+
+    def _last_good_data(self):
+        """Serve the data of the last good refresh after a failed fetch.
+
+        Entities keep their state while the data is younger than the grace
+        period; past it, or without any good refresh yet, the update fails and
+        the entities become unavailable.
+        """
+        age = self.data_age
+        if age is None or age > self._stale_grace_period:
+            raise UpdateFailed("Unable to fetch data from CSNet Home")
+        _LOGGER.debug("CSNet Home fetch failed, keeping data from %.0f s ago", age)
+        self.stale = True
+        self._changed_topics = set()
         return self._device_data
 
+    def _update_watermarks(self, device_status: dict) -> set:
+        """Record the lastComm of each device and return the ones not advanced.
+
+        The cloud has no new telemetry for a device whose lastComm did not move,
+        so its records of the previous refresh can be kept when the cloud sends
+        them unchanged, unless a write to one of its zones waits for the cloud
+        to report it.
+        """
+        now = time.monotonic()
+        pending_devices = {change.key[0] for change in self._pending_changes}
+        held = set()
+        for device_id, status in device_status.items():
+            last_comm = status.get("lastComm")
+            server_time = status.get("currentTimeMillis")
+            if last_comm is None or server_time is None:
+                self._watermarks.pop(device_id, None)
+                continue
+            watermark = self._watermarks.get(device_id)
+            if watermark is None:
+                self._watermarks[device_id] = DeviceWatermark(
+                    last_comm, server_time, now
+                )
+                continue
+            if last_comm == watermark.last_comm:
+                if device_id not in pending_devices:
+                    held.add(device_id)
+            elif last_comm > watermark.last_comm:
+                # Polls may miss reports, the shortest step is the closest to
+                # the reporting period of the device
+                step = (last_comm - watermark.last_comm) / 1000
+                watermark.period = min(watermark.period or step, step)
+                watermark.last_comm = last_comm
+            else:
+                watermark.last_comm = last_comm
+            watermark.server_time = server_time
+            watermark.fetched_at = now
+        return held
+
+    def _align_to_reports(self, interval: float, now: float) -> float:
+        """Move the next refresh just after a report of the devices.
+
+        The refresh is made right after the last report expected within the
+        interval; the interval is kept when no report is expected within it.
+        """
+        delays = [
+            (delay, watermark.period)
+            for watermark in self._watermarks.values()
+            if (delay := watermark.next_report_delay(now)) is not None
+        ]
+        if not delays:
+            return interval
+        delay, period = min(delays)
+        delay += POLL_REPORT_MARGIN
+        if delay > interval:
+            return interval
+        while delay + period <= interval:
+            delay += period
+        return delay
+
+    @property
+    def data_age(self) -> float | None:
+        """Return the seconds elapsed since the data was fetched successfully."""
+        if self._last_good_at is None:
+            return None
+        return time.monotonic() - self._last_good_at
+
+    def _build_sensor_index(self):
+        """Index the zone records of the last refresh by their sensor key."""
+        index = {}
+        for sensor in self._device_data.get("sensors", []):
+            index.setdefault(sensor_key(sensor), sensor)
+        self._sensor_index = index
+
+    def _replace_record(self, key: tuple, changes: dict):
+        """Swap the zone record of a sensor key for a copy with changes."""
+        sensor = self._sensor_index.get(key)
+        if sensor is None:
+            return
+        updated = replace_zone(sensor, changes)
+        sensors = self._device_data["sensors"]
+        for index, record in enumerate(sensors):
+            if record is sensor:
+                sensors[index] = updated
+                break
+        self._sensor_index[key] = updated
+
+    def _endpoint_due(self, endpoint: str, now: float) -> bool:
+        """Return whether a slower endpoint has to be requested again.
+
+        Half a scan interval of slack keeps an endpoint polled at the scan
+        interval from slipping to every other refresh because of timer drift.
+        """
+        fetched_at = self._endpoint_fetched_at.get(endpoint)
+        if fetched_at is None or endpoint in self._endpoint_failed:
+            return True
+        if endpoint == ENDPOINT_INSTALLATION_DEVICES and self._polling.burst_active(
+            now
+        ):
+            # Settings written by a command are reported by installation devices
+            return True
+        slack = self._polling.base_interval / 2
+        return now - fetched_at >= self._endpoint_intervals[endpoint] - slack
+
+    def _apply_pending_changes(self):
+        """Confirm, expire or hold the optimistic writes over the new records.
+
+        A change is confirmed once its zone record reports all of its fields.
+        Until then its values replace the ones of the record, so that a poll
+        made before the cloud applied the command does not flip the entity
+        back, unless the deadline passed.
+        """
+        if not self._pending_changes:
+            return
+        now = time.monotonic()
+        pending = []
+        for change in self._pending_changes:
+            sensor = self._sensor_index.get(change.key)
+            if sensor is not None and all(
+                sensor.get(field) == value for field, value in change.fields.items()
+            ):
+                latency = now - change.issued_at
+                self.command_latency = latency
+                self.command_latency_max = max(self.command_latency_max, latency)
+                self.confirmed_commands += 1
+                _LOGGER.debug(
+                    "Cloud reported %s for %s after %.1f s",
+                    change.fields,
+                    change.key,
+                    latency,
+                )
+            elif now >= change.deadline:
+                self.expired_commands += 1
+                _LOGGER.warning(
+                    "Cloud did not report %s for %s within %s s, using its values",
+                    change.fields,
+                    change.key,
+                    PENDING_CHANGE_TIMEOUT,
+                )
+            else:
+                self._replace_record(change.key, change.fields)
+                pending.append(change)
+        self._pending_changes = pending
+
+    async def _async_fetch_all(self, cloud_api):
+        """Fetch elements and the installation endpoints that are due.
+
+        Installation devices and alarms are only requested once their own
+        interval elapsed; in between their last response is served from the
+        cache. A failed request is retried on every refresh, the cache keeps
+        serving the last good response for the stale grace period.
+
+        The endpoints are independent once a session exists, so they share a
+        single round trip. Alarms need the installation ID, which is only known
+        after the first elements response: until then (and whenever there is no
+        active session, so that only one login is triggered) elements are fetched
+        first and the remaining calls fan out afterwards.
+        """
+        timings: dict[str, float] = {}
+        started = time.monotonic()
+        requests = {
+            ENDPOINT_INSTALLATION_DEVICES: cloud_api.async_get_installation_devices_data,
+            ENDPOINT_ALARMS: cloud_api.async_get_installation_alarms,
+        }
+        due = [
+            endpoint
+            for endpoint in _SLOW_ENDPOINTS
+            if self._endpoint_due(endpoint, started)
+        ]
+
+        async def timed(phase, request):
+            phase_started = time.monotonic()
+            try:
+                return await request
+            finally:
+                timings[phase] = round((time.monotonic() - phase_started) * 1000, 1)
+
+        def slow_requests():
+            return [timed(endpoint, requests[endpoint]()) for endpoint in due]
+
+        if not (
+            cloud_api.session and cloud_api.logged_in and cloud_api.installation_id
+        ):
+            elements_data = await timed("elements", cloud_api.async_get_elements_data())
+            results = await asyncio.gather(*slow_requests())
+        else:
+            elements_data, *results = await asyncio.gather(
+                timed("elements", cloud_api.async_get_elements_data()),
+                *slow_requests(),
+            )
+
+        for endpoint, result in zip(due, results):
+            if result:
+                self._endpoint_cache[endpoint] = result
+                self._endpoint_fetched_at[endpoint] = started
+                self._endpoint_failed.discard(endpoint)
+                continue
+            # Keep the last good response for the grace period, ask again
+            # on the next refresh
+            self._endpoint_failed.add(endpoint)
+            fetched_at = self._endpoint_fetched_at.get(endpoint)
+            if fetched_at is None or (
+                started - fetched_at
+                > self._endpoint_intervals[endpoint] + self._stale_grace_period
+            ):
+                self._endpoint_cache.pop(endpoint, None)
+
+        timings["total"] = round((time.monotonic() - started) * 1000, 1)
+        self.last_update_timings = timings
+        _LOGGER.debug("CSNet Home fetch timings (ms): %s", timings)
+        return (
+            elements_data,
+            self._endpoint_cache.get(ENDPOINT_INSTALLATION_DEVICES),
+            self._endpoint_cache.get(ENDPOINT_ALARMS),
+        )
+
+    def _diff_topics(self, previous_data: dict, previous_index: dict) -> set | None:
+        """Return the topics whose data changed since the previous refresh.
+
+        Returns None when the installation payload cannot be compared field by
+        field, in which case every listener is notified.
+        """
+        changed = {
+            key
+            for key in self._sensor_index.keys() | previous_index.keys()
+            if (sensor := self._sensor_index.get(key)) is not previous_index.get(key)
+            and sensor != previous_index.get(key)
+        }
+
+        previous_common = previous_data.get("common_data") or {}
+        common = self._device_data.get("common_data") or {}
+        if any(
+            previous_common.get(key) != common.get(key)
+            for key in previous_common.keys() | common.keys()
+            if key not in _INSTALLATION_KEYS
+        ):
+            changed.add(TOPIC_COMMON)
+        if previous_common.get("installation_alarms") != common.get(
+            "installation_alarms"
+        ):
+            changed.add(TOPIC_ALARMS)
+
+        previous_devices = previous_common.get("installation_devices")
+        devices = common.get("installation_devices")
+        if previous_devices != devices:
+            previous_status = extract_heating_status(previous_devices)
+            status = extract_heating_status(devices)
+            if previous_status is None or status is None:
+                return None
+            fields = {
+                field
+                for field in previous_status.keys() | status.keys()
+                if previous_status.get(field) != status.get(field)
+            }
+            if fields:
+                changed.add(TOPIC_HEATING_STATUS)
+                changed.update(heating_status_topic(field) for field in fields)
+            if _strip_heating_status(previous_devices) != _strip_heating_status(
+                devices
+            ):
+                changed.add(TOPIC_INSTALLATION)
+
+        return changed
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data changed in the last refresh.
+
+        Listeners without a context, and every listener after a change of the
+        update success state, are always notified.
+        """
+        changed = self._changed_topics
+        self._changed_topics = None
+        if changed is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            self.skipped_writes = 0
+            super().async_update_listeners()
+            return
+
+        skipped = 0
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not context.isdisjoint(changed):
+                update_callback()
+            else:
+                skipped += 1
+        self.skipped_writes = skipped
+        self.skipped_writes_total += skipped
+        _LOGGER.debug("Skipped %s unchanged entity state writes", skipped)
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Pick the interval of the next refresh from the outcome of this one."""
+        now = time.monotonic()
+        success = self.last_update_success and not self._fetch_failed
+        self._polling.record_refresh(
+            success, self._changed_topics is None or bool(self._changed_topics)
+        )
+        if success and self._burst_checks:
+            self._burst_checks = [check for check in self._burst_checks if not check()]
+            if not self._burst_checks:
+                _LOGGER.debug("Commands confirmed, leaving burst polling")
+                self._polling.end_burst()
+        if not self._polling.burst_active(now):
+            self._burst_checks.clear()
+        self._async_reschedule(now)
+
+    @callback
+    def _async_reschedule(self, now: float) -> None:
+        """Apply the interval chosen by the polling policy to the next refresh."""
+        seconds = self._polling.next_interval(now)
+        if not self._polling.failures and not self._polling.burst_active(now):
+            seconds = self._align_to_reports(seconds, now)
+        interval = timedelta(seconds=seconds)
+        if interval == self.update_interval:
+            return
+        _LOGGER.debug("Next CSNet Home refresh in %s", interval)
+        self.update_interval = interval
+        if self._unsub_refresh is not None:
+            # Move the refresh already scheduled with the previous interval
+            self._schedule_refresh()
+
+    @callback
+    def async_start_burst(self, confirmed: Callable[[], bool]) -> None:
+        """Refresh at a short interval until the cloud reports a command.
+
+        confirmed is called after each successful refresh and returns True once
+        the data reflects the command; the burst also ends after a while.
+        """
+        now = time.monotonic()
+        self._burst_checks.append(confirmed)
+        self._polling.start_burst(now)
+        self._async_reschedule(now)
+
+    @callback
+    def async_expect_fields(self, key: tuple, fields: dict) -> None:
+        """Hold optimistic values of a zone record until the cloud reports them.
+
+        The values are written to the current record at once and laid over
+        the records of the next polls; the coordinator polls in a burst
+        meanwhile. A newer write of the same field replaces the value expected
+        by an older one.
+        """
+        now = time.monotonic()
+        for change in self._pending_changes:
+            if change.key == key:
+                for field in fields.keys() & change.fields.keys():
+                    del change.fields[field]
+        self._pending_changes = [
+            change for change in self._pending_changes if change.fields
+        ]
+        change = PendingChange(key, dict(fields), now, now + PENDING_CHANGE_TIMEOUT)
+        self._pending_changes.append(change)
+        # The current record shows the values too, the next poll compares to it
+        self._replace_record(key, fields)
+        self.async_start_burst(lambda: change not in self._pending_changes)
+
+    @property
+    def command_metrics(self) -> dict[str, Any]:
+        """Return the confirmation counters, latencies in milliseconds."""
+        return {
+            "pending": len(self._pending_changes),
+            "confirmed": self.confirmed_commands,
+            "expired": self.expired_commands,
+            "last_latency_ms": (
+                round(self.command_latency * 1000, 1)
+                if self.command_latency is not None
+                else None
+            ),
+            "max_latency_ms": round(self.command_latency_max * 1000, 1),
+        }
+
+    @callback
+    def async_translations_updated(self):
+        """Re-translate the alarm texts of the last refresh with new bundles."""
+        cloud_api = self.hass.data[DOMAIN][self.entry_id]["api"]
+        self._device_data["sensors"] = [
+            replace_zone(
+                sensor,
+                {
+                    "alarm_message": cloud_api.translate_alarm(
+                        sensor.get("alarm_code")
+                    ),
+                    "alarm_origin": cloud_api.get_alarm_origin(
+                        sensor.get("alarm_code"), sensor.get("unit_type"), None
+                    ),
+                },
+            )
+            for sensor in self._device_data.get("sensors", [])
+        ]
+        self._build_sensor_index()
+        self._changed_topics = None
+        self.async_update_listeners()
+
     def get_sensors_data(self):
         """Return the list of sensor data."""
 
         return self._device_data["sensors"]
 
+    def get_sensor(self, key: tuple) -> dict | None:
+        """Return the zone record matching a sensor key, if still reported."""
+        return self._sensor_index.get(key)
+
     def get_common_data(self):
         """Return common data shared between all sensors."""
 
@@ -193,6 +838,10 @@ class CSNetHomeCoordinator(DataUpdateCoordinator):
 
         return self._device_data.get("common_data", {}).get("installation_devices", {})
 
+    def get_installation_snapshot(self) -> InstallationSnapshot:
+        """Return the decoded installation devices data of the last refresh."""
+        return self._installation_snapshot
+
     def get_installation_alarms_data(self):
         """Return installation alarms data."""
 
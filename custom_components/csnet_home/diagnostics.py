@@ -0,0 +1,34 @@
+"""Diagnostics support for CSNet Home."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the polling, decoding and command counters of a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    api = entry_data["api"]
+    data_age = coordinator.data_age
+    return {
+        "options": dict(entry.options),
+        "coordinator": {
+            "stale": coordinator.stale,
+            "data_age_s": round(data_age, 1) if data_age is not None else None,
+            "unchanged_refreshes": coordinator.unchanged_refreshes,
+            "held_records": coordinator.held_records,
+            "skipped_writes": coordinator.skipped_writes,
+            "skipped_writes_total": coordinator.skipped_writes_total,
+            "commands": coordinator.command_metrics,
+        },
+        "api": {
+            "decode": api.decode_metrics,
+            "heat_settings": api.heat_settings.metrics,
+        },
+    }
@@ -1,26 +1,47 @@
 """Helper functions for CSNet Home integration."""
 
 
-def extract_heating_status(installation_devices_data):
-    """Extract heatingStatus from installation devices data structure.
+def convert_unsigned_to_signed_byte(value):
+    """Convert an unsigned byte (0-255) to a signed byte (-128 to 127).
 
-    Navigates through: data[0].indoors[0].heatingStatus
+    This is necessary because temperature values transmitted from the device
+    may be sent as unsigned bytes (0-255), but should be interpreted as signed
+    when they represent negative temperatures.
+
+    For example:
+    - 246 (unsigned) should be interpreted as -10°C (signed)
+    - 250 (unsigned) should be interpreted as -6°C (signed)
+
+    Args:
+        value: The value to convert (int or None)
+
+    Returns:
+        Converted signed value or None if input is None
+    """
+    if value is None or not isinstance(value, int):
+        return value
+
+    # If the value is in the range 128-255, it should be converted to negative
+    if value > 127:
+        return value - 256
+
+    return value
+
+
+def extract_first_indoors(installation_devices_data):
+    """Extract the first indoor unit from installation devices data.
+
+    Navigates through: data[0].indoors[0]
 
     Args:
         installation_devices_data: The installation devices API response
 
     Returns:
-        dict or None: heatingStatus dictionary, or None if not found
+        dict or None: first indoors dictionary, or None if not found
     """
-    if not installation_devices_data:
+    if not isinstance(installation_devices_data, dict):
         return None
 
-    # Try direct access first (if already extracted)
-    heating_status = installation_devices_data.get("heatingStatus")
-    if heating_status:
-        return heating_status
-
-    # Navigate through: data[0].indoors[0].heatingStatus
     data_array = installation_devices_data.get("data", [])
     if isinstance(data_array, list) and len(data_array) > 0:
         first_device = data_array[0]
@@ -29,6 +50,67 @@ def extract_heating_status(installation_devices_data):
             if isinstance(indoors_array, list) and len(indoors_array) > 0:
                 first_indoors = indoors_array[0]
                 if isinstance(first_indoors, dict):
-                    return first_indoors.get("heatingStatus", {})
+                    return first_indoors
 
     return None
+
+
+def extract_indoors_section(installation_devices_data, section):
+    """Extract a section (heatingStatus, heatingSetting...) of the first indoor.
+
+    Args:
+        installation_devices_data: The installation devices API response
+        section: Name of the section in data[0].indoors[0]
+
+    Returns:
+        dict or None: section dictionary, or None if not found
+    """
+    if not installation_devices_data:
+        return None
+
+    # Try direct access first (if already extracted)
+    value = installation_devices_data.get(section)
+    if value:
+        return value
+
+    first_indoors = extract_first_indoors(installation_devices_data)
+    if first_indoors is None:
+        return None
+    return first_indoors.get(section, {})
+
+
+def extract_heating_status(installation_devices_data):
+    """Extract heatingStatus from installation devices data structure.
+
+    Navigates through: data[0].indoors[0].heatingStatus
+
+    Args:
+        installation_devices_data: The installation devices API response
+
+    Returns:
+        dict or None: heatingStatus dictionary, or None if not found
+    """
+    return extract_indoors_section(installation_devices_data, "heatingStatus")
+
+
+def reported_setting_temperature(zone_id, temperature):
+    """Return the setting temperature the cloud reports after a write.
+
+    The water zones (3 to 6) are written in whole degrees and the room zones
+    in tenths of a degree, both truncated. The elements of type 5 report their
+    setting temperature multiplied by 10.
+
+    Args:
+        zone_id: The zone (element type) the temperature is written to
+        temperature: The temperature passed to the setter
+
+    Returns:
+        The setting_temperature value the zone record will hold
+    """
+    if zone_id in (3, 4, 5, 6):
+        value = int(temperature)
+    else:
+        value = int(temperature * 10) / 10
+    if zone_id == 5:
+        return value * 10
+    return value
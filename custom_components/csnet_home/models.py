@@ -0,0 +1,171 @@
+"""Typed snapshots of the CSNet Home cloud data shared by all platforms."""
+
+from dataclasses import dataclass, fields, replace
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping
+
+from .helpers import (
+    convert_unsigned_to_signed_byte,
+    extract_first_indoors,
+    extract_heating_status,
+)
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _scaled(value, divisor):
+    """Divide numeric raw values, leaving missing values untouched."""
+    if isinstance(value, (int, float)):
+        return value / divisor
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class InstallationSnapshot:
+    """Immutable view of the installation devices data of one refresh.
+
+    heatingStatus, heatingSetting and secondCycle of the first indoor unit are
+    located once per poll and exposed as read-only mappings; the fields that
+    need a conversion are decoded up front.
+    """
+
+    heating_status: Mapping[str, Any] = _EMPTY
+    heating_setting: Mapping[str, Any] = _EMPTY
+    second_cycle: Mapping[str, Any] = _EMPTY
+    # waterFlow is reported in tenths, waterPressure in 1/50 bar
+    water_flow: float | None = None
+    water_pressure: float | None = None
+    # Temperatures reported as unsigned bytes
+    discharge_temperature: int | None = None
+    evaporator_temperature: int | None = None
+    outdoor_ambient_temperature: int | None = None
+    secondary_discharge_temperature: int | None = None
+    secondary_suction_temperature: int | None = None
+
+    @classmethod
+    def from_installation_devices(
+        cls, installation_devices_data
+    ) -> "InstallationSnapshot":
+        """Decode the installation devices API response."""
+        if not isinstance(installation_devices_data, dict):
+            return EMPTY_SNAPSHOT
+
+        first_indoors = extract_first_indoors(installation_devices_data) or {}
+        heating_status = extract_heating_status(installation_devices_data) or {}
+        heating_setting = first_indoors.get("heatingSetting") or {}
+        second_cycle = first_indoors.get("secondCycle") or {}
+        return cls(
+            heating_status=MappingProxyType(heating_status),
+            heating_setting=MappingProxyType(heating_setting),
+            second_cycle=MappingProxyType(second_cycle),
+            water_flow=_scaled(heating_status.get("waterFlow"), 10),
+            water_pressure=_scaled(heating_status.get("waterPressure"), 50),
+            discharge_temperature=convert_unsigned_to_signed_byte(
+                heating_status.get("ouDischargeTemperature")
+            ),
+            evaporator_temperature=convert_unsigned_to_signed_byte(
+                heating_status.get("ouEvapTemperature")
+            ),
+            outdoor_ambient_temperature=convert_unsigned_to_signed_byte(
+                heating_status.get("ouAmbientTemperature")
+            ),
+            secondary_discharge_temperature=convert_unsigned_to_signed_byte(
+                second_cycle.get("dischargeTemp")
+            ),
+            secondary_suction_temperature=convert_unsigned_to_signed_byte(
+                second_cycle.get("suctionTemp")
+            ),
+        )
+
+
+EMPTY_SNAPSHOT = InstallationSnapshot()
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneState(Mapping):
+    """Immutable record of one zone (remote controller element) of a refresh.
+
+    The fields keep the keys of the former zone dicts and the record reads as
+    a read-only mapping, so ``record["mode"]`` and ``record.get("mode")`` keep
+    working. Changes are made by building a new record with ``replace``.
+    """
+
+    device_name: str | None = None
+    device_id: int | None = None
+    room_name: str | None = None
+    parent_id: int | None = None
+    room_id: int | None = None
+    operation_status: int | None = None
+    # 0 = cool, 1 = heat, 2 = auto
+    mode: int | None = None
+    real_mode: int | None = None
+    # 0 = Off, 1 = On
+    on_off: int | None = None
+    timer_running: bool | None = None
+    alarm_code: int | None = None
+    alarm_message: str | None = None
+    c1_demand: bool | None = None
+    c2_demand: bool | None = None
+    # 0 = Eco, 1 = Comfort, -1 = No available mode
+    ecocomfort: int | None = None
+    doingBoost: bool | None = None
+    # 0 = Off, 1 = On
+    silent_mode: int | None = None
+    current_temperature: float | None = None
+    setting_temperature: float | None = None
+    zone_id: int | None = None
+    # Fan speeds of the C1 and C2 circuits
+    fan1_speed: int | None = None
+    fan2_speed: int | None = None
+    unit_type: str | None = None
+    alarm_code_formatted: str | None = None
+    alarm_origin: str | None = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field, with another record or with any mapping."""
+        if isinstance(other, ZoneState):
+            return _zone_values(self) == _zone_values(other)
+        if isinstance(other, Mapping):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field like a dict item."""
+        if key not in _ZONE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names."""
+        return iter(ZONE_FIELDS)
+
+    def __len__(self) -> int:
+        """Return the number of fields."""
+        return len(ZONE_FIELDS)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether key is a field name."""
+        return key in _ZONE_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field, or default for an unknown key."""
+        if key not in _ZONE_KEYS:
+            return default
+        return getattr(self, key)
+
+    def replace(self, changes: Mapping[str, Any]) -> "ZoneState":
+        """Return a copy of the record with some fields changed."""
+        return replace(self, **changes)
+
+
+ZONE_FIELDS = tuple(field.name for field in fields(ZoneState))
+_ZONE_KEYS = frozenset(ZONE_FIELDS)
+_zone_values = attrgetter(*ZONE_FIELDS)
+
+
+def replace_zone(record: Mapping[str, Any], changes: Mapping[str, Any]):
+    """Return a copy of a zone record, a ZoneState or a plain dict, with changes."""
+    if isinstance(record, ZoneState):
+        return record.replace(changes)
+    return {**record, **changes}
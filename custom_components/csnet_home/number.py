@@ -1,6 +1,5 @@
 """Create a Number Component for Home Assistant to control fixed water temperature."""
 
-import asyncio
 import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode
@@ -16,7 +15,12 @@ from .const import (
     WATER_CIRCUIT_MAX_HEAT,
     WATER_CIRCUIT_MIN_HEAT,
 )
-from .coordinator import CSNetHomeCoordinator
+from .coordinator import (
+    TOPIC_HEATING_STATUS,
+    TOPIC_INSTALLATION,
+    CSNetHomeCoordinator,
+    sensor_key,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,26 +35,14 @@ async def async_setup_entry(hass, entry, async_add_entities):
         return None
 
     entities = []
-    installation_devices_data = coordinator.get_installation_devices_data()
-
-    if not installation_devices_data:
+    if not coordinator.get_installation_devices_data():
         _LOGGER.debug("No installation devices data available for number entities")
         return None
 
-    # Get heating status from installation devices
-    # Navigate through: data[0].indoors[0].heatingStatus and heatingSetting
-    heating_status = None
-    heating_setting = None
-    data_array = installation_devices_data.get("data", [])
-    if isinstance(data_array, list) and len(data_array) > 0:
-        first_device = data_array[0]
-        if isinstance(first_device, dict):
-            indoors_array = first_device.get("indoors", [])
-            if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                first_indoors = indoors_array[0]
-                if isinstance(first_indoors, dict):
-                    heating_status = first_indoors.get("heatingStatus", {})
-                    heating_setting = first_indoors.get("heatingSetting", {})
+    # Get heating status and setting decoded from installation devices
+    snapshot = coordinator.get_installation_snapshot()
+    heating_status = snapshot.heating_status
+    heating_setting = snapshot.heating_setting
 
     if not heating_status or not heating_setting:
         _LOGGER.debug("No heating status or setting available for number entities")
@@ -178,7 +170,12 @@ class CSNetHomeFixedWaterTemperatureNumber(CoordinatorEntity, NumberEntity):
         entry,
     ):
         """Initialize the fixed water temperature number entity."""
-        super().__init__(coordinator)
+        self._sensor_key = sensor_key(sensor_data)
+        # heatingSetting holds the value, heatingStatus the OTC type
+        super().__init__(
+            coordinator,
+            frozenset({self._sensor_key, TOPIC_INSTALLATION, TOPIC_HEATING_STATUS}),
+        )
         self._coordinator = coordinator
         self._sensor_data = sensor_data
         self._common_data = common_data
@@ -209,22 +206,7 @@ class CSNetHomeFixedWaterTemperatureNumber(CoordinatorEntity, NumberEntity):
     @property
     def native_value(self) -> float | None:
         """Return the current fixed water temperature value."""
-        installation_devices_data = self._coordinator.get_installation_devices_data()
-        if not installation_devices_data:
-            return None
-
-        # Navigate through: data[0].indoors[0].heatingSetting
-        heating_setting = None
-        data_array = installation_devices_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        heating_setting = first_indoors.get("heatingSetting", {})
-
+        heating_setting = self._coordinator.get_installation_snapshot().heating_setting
         if not heating_setting:
             return None
 
@@ -243,6 +225,8 @@ class CSNetHomeFixedWaterTemperatureNumber(CoordinatorEntity, NumberEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
+        if not super().available:
+            return False
         # Entity is only available when OTC type is FIX
         installation_devices_data = self._coordinator.get_installation_devices_data()
         if not installation_devices_data:
@@ -274,11 +258,8 @@ class CSNetHomeFixedWaterTemperatureNumber(CoordinatorEntity, NumberEntity):
                 self._circuit,
                 self._mode,
             )
-            # Wait a short delay to ensure the server has processed the change
-            # The API sometimes ignores calls between two requests
-            await asyncio.sleep(1.5)
-            # Request coordinator refresh to update the value immediately
-            await self._coordinator.async_refresh()
+            # Poll quickly until heatingSetting reports the new value
+            self._coordinator.async_start_burst(lambda: self.native_value == value)
         else:
             _LOGGER.error(
                 "Failed to set fixed water temperature for circuit %d (mode %d)",
@@ -306,14 +287,7 @@ class CSNetHomeFixedWaterTemperatureNumber(CoordinatorEntity, NumberEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Update sensor_data reference
-        sensors_data = self._coordinator.get_sensors_data()
-        self._sensor_data = next(
-            (
-                x
-                for x in sensors_data
-                if x.get("device_id") == self._sensor_data.get("device_id")
-                and x.get("zone_id") == self._sensor_data.get("zone_id")
-            ),
-            self._sensor_data,
+        self._sensor_data = (
+            self._coordinator.get_sensor(self._sensor_key) or self._sensor_data
         )
         self.async_write_ha_state()
@@ -0,0 +1,72 @@
+"""Refresh interval policy of the CSNet Home coordinator."""
+
+import random
+
+
+class AdaptivePolling:
+    """Pick the delay before the next refresh from the outcome of the last ones.
+
+    The configured interval is used while data keeps changing. A command
+    starts a burst of short refreshes that lasts until the change is confirmed
+    or the burst window ends. Refreshes that bring no change widen the interval
+    step by step, and failed refreshes back off exponentially with a random
+    jitter so that installations do not retry in lockstep during an outage.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        burst_interval: float,
+        burst_duration: float,
+        idle_refreshes: int,
+        idle_max_interval: float,
+        backoff_max_interval: float,
+        jitter: float,
+    ) -> None:
+        """Initialize the policy with its intervals in seconds."""
+        self.base_interval = base_interval
+        self._burst_interval = burst_interval
+        self._burst_duration = burst_duration
+        self._idle_refreshes = idle_refreshes
+        self._idle_max_interval = max(idle_max_interval, base_interval)
+        self._backoff_max_interval = max(backoff_max_interval, base_interval)
+        self._jitter = jitter
+        self._burst_until: float | None = None
+        self.failures = 0
+        self.unchanged_refreshes = 0
+
+    def burst_active(self, now: float) -> bool:
+        """Return whether a burst started by a command is still running."""
+        return self._burst_until is not None and now < self._burst_until
+
+    def start_burst(self, now: float) -> None:
+        """Poll at the burst interval for at most the burst duration."""
+        self._burst_until = now + self._burst_duration
+        self.unchanged_refreshes = 0
+
+    def end_burst(self) -> None:
+        """Go back to the regular interval, the command was confirmed."""
+        self._burst_until = None
+
+    def record_refresh(self, success: bool, changed: bool) -> None:
+        """Account for the outcome of a refresh."""
+        if not success:
+            self.failures += 1
+            return
+        self.failures = 0
+        if changed:
+            self.unchanged_refreshes = 0
+        else:
+            self.unchanged_refreshes += 1
+
+    def next_interval(self, now: float) -> float:
+        """Return the number of seconds to wait before the next refresh."""
+        if self.failures:
+            delay = min(
+                self.base_interval * 2**self.failures, self._backoff_max_interval
+            )
+            return delay * random.uniform(1 - self._jitter, 1 + self._jitter)
+        if self.burst_active(now):
+            return self._burst_interval
+        steps = self.unchanged_refreshes // self._idle_refreshes
+        return min(self.base_interval * 2**steps, self._idle_max_interval)
@@ -2,10 +2,18 @@
 
 import logging
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable
 
 from homeassistant.components.climate.const import HVACMode
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.const import (
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     STATE_OFF,
@@ -16,8 +24,8 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
@@ -27,36 +35,705 @@ from .const import (
     OTC_COOLING_TYPE_NAMES,
     OTC_HEATING_TYPE_NAMES,
 )
-from .coordinator import CSNetHomeCoordinator
+from .coordinator import (
+    TOPIC_ALARMS,
+    TOPIC_COMMON,
+    TOPIC_HEATING_STATUS,
+    TOPIC_INSTALLATION,
+    CSNetHomeCoordinator,
+    heating_status_topic,
+    sensor_key,
+)
+from .helpers import convert_unsigned_to_signed_byte
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map the installation sensor keys to the API keys of indoors/heatingStatus
+INSTALLATION_KEY_MAPPINGS = {
+    "pump_speed": ["pumpSpeed"],
+    "water_flow": ["waterFlow"],
+    "in_water_temperature": ["waterInletTemp"],
+    "out_water_temperature": ["waterOutletTemp"],
+    "out_water_temperature_3": ["waterOutlet3Temp"],
+    "set_water_temperature": ["waterTempSetting"],
+    "water_pressure": ["waterPressure"],
+    "defrost": ["defrosting"],
+    "mix_valve_position": ["mixingValveOpening"],
+    "external_temperature": ["outdoorAmbientTemp"],
+    "mean_external_temperature": ["outdoorAmbientAverageTemp"],
+    "gas_temperature": ["gasTemp"],
+    "liquid_temperature": ["liquidTemp"],
+    # Central control configuration
+    "central_config": ["centralConfig"],
+    "lcd_software_version": ["lcdSoft"],
+    "unit_model": ["unitModel"],
+    # DHW temperatures (Issue #155)
+    "bottom_dhw_temperature": ["bottomTempDHW"],
+    "top_dhw_temperature": ["topTempDHW"],
+    "heat_exchanger_water_outlet_temperature": ["waterOutletHPTemp"],
+}
+
+# Map the OTC sensor keys to the API keys of heatingStatus
+OTC_KEY_MAP = {
+    "otc_heating_type_c1": "otcTypeHeatC1",
+    "otc_cooling_type_c1": "otcTypeCoolC1",
+    "otc_heating_type_c2": "otcTypeHeatC2",
+    "otc_cooling_type_c2": "otcTypeCoolC2",
+}
+
+# Installation sensors decoded from heatingStatus systemConfigBits (Issue #78)
+SYSTEM_CONFIG_BITS = {
+    "cascade_slave_mode": 0x1000,
+    "fan_coil_compatible": 0x2000,
+    "c1_thermostat_present": 0x40,
+    "c2_thermostat_present": 0x80,
+}
+
+
+def _installation_context(key):
+    """Return the coordinator topics an installation sensor depends on."""
+    if key == "weather_temperature":
+        return frozenset({TOPIC_COMMON})
+    if key == "central_control_enabled":
+        fields = ["centralConfig", "unitModel", "lcdSoft"]
+    elif key in SYSTEM_CONFIG_BITS:
+        fields = ["systemConfigBits"]
+    elif key in OTC_KEY_MAP:
+        fields = [OTC_KEY_MAP[key]]
+    elif key in INSTALLATION_KEY_MAPPINGS:
+        fields = INSTALLATION_KEY_MAPPINGS[key]
+    else:
+        # Unknown or computed keys may read anything from the installation
+        return frozenset({TOPIC_INSTALLATION, TOPIC_HEATING_STATUS})
+    return frozenset(heating_status_topic(field) for field in fields)
+
+
+# Decoded unit model codes
+UNIT_MODEL_NAMES = {
+    0: "Yutaki S",
+    1: "Yutaki SC",
+    2: "Yutaki S80",
+    3: "Yutaki M",
+    4: "Yutaki SC Lite",
+    5: "Yutampo",
+}
+
+# Decoded central config values
+CENTRAL_CONFIG_NAMES = {
+    0: "Unit Only",
+    1: "RT Only",
+    2: "Unit & RT",
+    3: "Total Control",
+    4: "Total Control+",
+}
+
+# Unit model code of the Yutaki S80, which has no LCD software requirement
+CODE_YUTAKI_S80 = 2
+
+
+def _central_control_enabled(snapshot):
+    """Calculate if central control is properly configured.
+
+    Based on JavaScript function isCentralWellConfigured().
+    """
+    heating_status = snapshot.heating_status
+    if not heating_status:
+        return STATE_OFF
+
+    # Central config >= 3 means "Total" control is enabled
+    if heating_status.get("centralConfig", 0) >= 3:
+        return STATE_ON
 
-def _convert_unsigned_to_signed_byte(value):
-    """Convert an unsigned byte (0-255) to a signed byte (-128 to 127).
+    # For non-S80 models, check LCD software version
+    if heating_status.get("unitModel", 0) != CODE_YUTAKI_S80:
+        lcd_soft = heating_status.get("lcdSoft", 0)
+        # lcdSoft == 0 means not configured yet (during wizard),
+        # version >= 0x0222 (546 decimal) allows control
+        if lcd_soft == 0 or lcd_soft >= 0x0222:
+            return STATE_ON
 
-    This is necessary because temperature values transmitted from the device
-    may be sent as unsigned bytes (0-255), but should be interpreted as signed
-    when they represent negative temperatures.
+    return STATE_OFF
 
-    For example:
-    - 246 (unsigned) should be interpreted as -10°C (signed)
-    - 250 (unsigned) should be interpreted as -6°C (signed)
 
-    Args:
-        value: The value to convert (int or None)
+def compile_installation_accessor(key):
+    """Return a function reading the state of an installation sensor.
 
-    Returns:
-        Converted signed value or None if input is None
+    The API field and the conversion of the sensor are resolved once, so
+    the returned closure only does a direct lookup in the snapshot.
     """
-    if value is None or not isinstance(value, int):
+    if key == "water_flow":
+        # waterFlow value must be divided by 10 to have the right measurement unit
+        return attrgetter("water_flow")
+    if key == "water_pressure":
+        # waterPressure: app shows 4.48bar, value is 224, so divide by 50
+        return attrgetter("water_pressure")
+    if key == "central_control_enabled":
+        return _central_control_enabled
+
+    if key in SYSTEM_CONFIG_BITS:
+        bit = SYSTEM_CONFIG_BITS[key]
+
+        def system_config_flag(snapshot):
+            heating_status = snapshot.heating_status
+            if not heating_status:
+                return STATE_OFF
+            return (
+                STATE_ON
+                if heating_status.get("systemConfigBits", 0) & bit
+                else STATE_OFF
+            )
+
+        return system_config_flag
+
+    if key in OTC_KEY_MAP:
+        # OTC (Outdoor Temperature Compensation) sensors (Issue #71)
+        otc_field = OTC_KEY_MAP[key]
+        otc_names = (
+            OTC_HEATING_TYPE_NAMES if "heating" in key else OTC_COOLING_TYPE_NAMES
+        )
+
+        def otc_type(snapshot):
+            otc_value = snapshot.heating_status.get(otc_field)
+            if otc_value is None:
+                return "Unknown"
+            return otc_names.get(otc_value, f"Unknown ({otc_value})")
+
+        return otc_type
+
+    # Find the value in the API response structure: data[0].indoors[0].heatingStatus
+    field = INSTALLATION_KEY_MAPPINGS.get(key, [key])[0]
+
+    if key == "defrost":
+
+        def defrost(snapshot):
+            # defrosting: 0 = off, 1 = on
+            return STATE_ON if snapshot.heating_status.get(field) == 1 else STATE_OFF
+
+        return defrost
+
+    if key == "unit_model":
+
+        def unit_model(snapshot):
+            value = snapshot.heating_status.get(field)
+            return UNIT_MODEL_NAMES.get(value, f"Unknown ({value})")
+
+        return unit_model
+
+    if key == "lcd_software_version":
+
+        def lcd_software_version(snapshot):
+            value = snapshot.heating_status.get(field)
+            # Format as hex version (e.g., 0x0222 = v2.34)
+            if isinstance(value, int) and value > 0:
+                return f"0x{value:04X}"
+            return value
+
+        return lcd_software_version
+
+    if key == "central_config":
+
+        def central_config(snapshot):
+            value = snapshot.heating_status.get(field)
+            decoded = CENTRAL_CONFIG_NAMES.get(value, f"Unknown ({value})")
+            if value is not None and value < 3:
+                decoded += " ⚠️"  # Warning for insufficient control
+            return decoded
+
+        return central_config
+
+    def raw_value(snapshot):
+        return snapshot.heating_status.get(field)
+
+    return raw_value
+
+
+@dataclass(frozen=True, kw_only=True)
+class CSNetHomeSensorEntityDescription(SensorEntityDescription):
+    """Describes a CSNet Home sensor and how its value is read."""
+
+    value_fn: Callable[[Any], Any] | None = None
+
+
+def _description_name(description):
+    """Return the name of a sensor description, its key when it has none."""
+    if description.name in (None, UNDEFINED):
+        return description.key
+    return description.name
+
+
+def _zone_mode(sensor_data):
+    """Map the zone mode to the HA HVAC mode."""
+    value = sensor_data.get("mode")
+    if value == 0:
+        return HVACMode.COOL
+    if value == 1:
+        return HVACMode.HEAT
+    return HVACMode.OFF
+
+
+def _zone_alarm_active(sensor_data):
+    """Compute the alarm state from the alarm code."""
+    return STATE_ON if sensor_data.get("alarm_code") not in (None, 0) else STATE_OFF
+
+
+def _zone_field(key):
+    """Return a value function reading one field of a zone record."""
+
+    def value_fn(sensor_data):
+        return sensor_data.get(key)
+
+    return value_fn
+
+
+def _snapshot_field(section, field, invalid=None):
+    """Return a value function reading one field of a snapshot section.
+
+    The raw ``invalid`` marker sent by the unit (-1, 127, 255...) is mapped
+    to None.
+    """
+
+    def value_fn(snapshot):
+        value = getattr(snapshot, section).get(field)
+        if invalid is not None and value == invalid:
+            return None
         return value
 
-    # If the value is in the range 128-255, it should be converted to negative
-    if value > 127:
-        return value - 256
+    return value_fn
 
-    return value
+
+def _operation_status(snapshot):
+    """Decode the outdoor unit operation status."""
+    value = snapshot.heating_status.get("operationStatus")
+    if value is None:
+        return None
+    return OPERATION_STATUS_MAP.get(value, f"Unknown ({value})")
+
+
+def _system_status_flags(snapshot):
+    """Return the system status flags as hex string for easier interpretation."""
+    value = snapshot.heating_status.get("systemStatus2Flags")
+    return f"0x{value:04X}" if value is not None else None
+
+
+# Outdoor unit codes
+OU_CODE_MAP = {
+    0: "Unknown",
+    1: "RAS-1",
+    2: "RAS-2",
+    3: "Yutaki",
+    4: "RAD",
+}
+
+
+def _ou_code(snapshot):
+    """Decode the outdoor unit code."""
+    value = snapshot.heating_status.get("ouCode")
+    return OU_CODE_MAP.get(value, f"Code {value}")
+
+
+def _second_cycle_code(field, idle_state):
+    """Return a value function for a stop/retry code, 0 meaning idle."""
+
+    def value_fn(snapshot):
+        value = snapshot.second_cycle.get(field)
+        return value if value != 0 else idle_state
+
+    return value_fn
+
+
+# Sensors created for every zone
+ZONE_SENSORS: tuple[CSNetHomeSensorEntityDescription, ...] = (
+    CSNetHomeSensorEntityDescription(
+        key="current_temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="setting_temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="mode", device_class="enum", value_fn=_zone_mode
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="on_off",
+        device_class="enum",
+        value_fn=lambda data: STATE_ON if data.get("on_off") == 1 else STATE_OFF,
+    ),
+    CSNetHomeSensorEntityDescription(key="doingBoost", device_class="binary"),
+    # expose alarm information
+    CSNetHomeSensorEntityDescription(key="alarm_code", device_class="enum"),
+    CSNetHomeSensorEntityDescription(
+        key="alarm_active", device_class="binary", value_fn=_zone_alarm_active
+    ),
+    CSNetHomeSensorEntityDescription(key="alarm_message", device_class="enum"),
+    # Enhanced alarm information
+    CSNetHomeSensorEntityDescription(key="alarm_code_formatted", device_class="enum"),
+    CSNetHomeSensorEntityDescription(key="alarm_origin", device_class="enum"),
+    CSNetHomeSensorEntityDescription(key="unit_type", device_class="enum"),
+)
+
+# Device-level sensors created for every zone (WiFi, connectivity)
+DEVICE_SENSORS: tuple[CSNetHomeSensorEntityDescription, ...] = (
+    CSNetHomeSensorEntityDescription(
+        key="wifi_signal",
+        name="WiFi Signal",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="connectivity", name="Connectivity", device_class="binary"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="last_communication",
+        name="Last Communication",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+)
+
+# Global device holding the installation-level sensors
+GLOBAL_DEVICE_DATA = {
+    "device_name": "System",
+    "device_id": "global",
+    "room_name": "Controller",
+    "parent_id": "global",
+    "room_id": "global",
+}
+
+INSTALLATION_SENSORS: tuple[CSNetHomeSensorEntityDescription, ...] = (
+    # Water-related sensors
+    CSNetHomeSensorEntityDescription(
+        key="pump_speed",
+        name="Pump Speed",
+        device_class="percentage",
+        native_unit_of_measurement="%",
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="water_flow",
+        name="Water Flow",
+        device_class="water_debit",
+        native_unit_of_measurement=UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="in_water_temperature",
+        name="In Water Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="out_water_temperature",
+        name="Out Water Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="out_water_temperature_3",
+        name="External Tank Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="set_water_temperature",
+        name="Set Water Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="water_pressure",
+        name="Water Pressure",
+        device_class="pressure",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="gas_temperature",
+        name="Gas Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="liquid_temperature",
+        name="Liquid Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    # Heat device sensors
+    CSNetHomeSensorEntityDescription(
+        key="defrost", name="Defrost", device_class="binary"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="mix_valve_position",
+        name="Mix Valve Position",
+        device_class="percentage",
+        native_unit_of_measurement="%",
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="external_temperature",
+        name="Outdoor Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="mean_external_temperature",
+        name="Outdoor Average Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    # Weather sensor from cloud service (Issue #79)
+    CSNetHomeSensorEntityDescription(
+        key="weather_temperature",
+        name="Weather Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+    ),
+    # Central Control Configuration sensors
+    CSNetHomeSensorEntityDescription(
+        key="central_config", name="Central Config", device_class="enum"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="lcd_software_version", name="LCD Software Version"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="unit_model", name="Unit Model", device_class="enum"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="central_control_enabled",
+        name="Central Control Enabled",
+        device_class="binary",
+    ),
+    # System Configuration Diagnostic sensors (Issue #78)
+    CSNetHomeSensorEntityDescription(
+        key="cascade_slave_mode", name="Cascade Slave Mode", device_class="binary"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="fan_coil_compatible", name="Fan Coil Compatible", device_class="binary"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="c1_thermostat_present",
+        name="C1 Thermostat Present",
+        device_class="binary",
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="c2_thermostat_present",
+        name="C2 Thermostat Present",
+        device_class="binary",
+    ),
+    # OTC (Outdoor Temperature Compensation) sensors (Issue #71)
+    CSNetHomeSensorEntityDescription(
+        key="otc_heating_type_c1", name="OTC Heating Type C1", device_class="enum"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="otc_cooling_type_c1", name="OTC Cooling Type C1", device_class="enum"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="otc_heating_type_c2", name="OTC Heating Type C2", device_class="enum"
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="otc_cooling_type_c2", name="OTC Cooling Type C2", device_class="enum"
+    ),
+)
+
+ALARM_STATISTICS_SENSORS: tuple[CSNetHomeSensorEntityDescription, ...] = (
+    CSNetHomeSensorEntityDescription(key="total_alarm_count", name="Total Alarms"),
+    CSNetHomeSensorEntityDescription(key="active_alarm_count", name="Active Alarms"),
+    CSNetHomeSensorEntityDescription(key="alarm_by_origin", name="Alarms by Origin"),
+)
+
+# Device holding the compressor/outdoor unit sensors
+COMPRESSOR_DEVICE_DATA = {
+    "device_name": "Compressor",
+    "device_id": "compressor",
+    "room_name": "Outdoor Unit",
+    "parent_id": "compressor",
+    "room_id": "compressor",
+}
+
+COMPRESSOR_SENSORS: tuple[CSNetHomeSensorEntityDescription, ...] = (
+    # Primary Compressor Sensors
+    CSNetHomeSensorEntityDescription(
+        key="compressor_frequency",
+        name="Compressor Frequency",
+        device_class="frequency",
+        native_unit_of_measurement="Hz",
+        value_fn=_snapshot_field("heating_status", "ouHz"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="compressor_current",
+        name="Compressor Current",
+        device_class="current",
+        native_unit_of_measurement="A",
+        value_fn=_snapshot_field("heating_status", "ouCurrent"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="compressor_capacity",
+        name="Compressor Capacity",
+        value_fn=_snapshot_field("heating_status", "unitCapacity"),
+    ),
+    # Compressor Temperatures
+    CSNetHomeSensorEntityDescription(
+        key="discharge_temperature",
+        name="Discharge Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=attrgetter("discharge_temperature"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="evaporator_temperature",
+        name="Evaporator Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=attrgetter("evaporator_temperature"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="outdoor_ambient_temperature",
+        name="Outdoor Ambient Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=attrgetter("outdoor_ambient_temperature"),
+    ),
+    # Compressor Pressures (already reported in bar)
+    CSNetHomeSensorEntityDescription(
+        key="discharge_pressure",
+        name="Discharge Pressure",
+        device_class="pressure",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        value_fn=_snapshot_field("heating_status", "ouDischargePress"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="suction_pressure",
+        name="Suction Pressure",
+        device_class="pressure",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        value_fn=_snapshot_field("heating_status", "ouSuctionPress"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="suction_pressure_correction",
+        name="Suction Pressure Correction",
+        value_fn=_snapshot_field("heating_status", "ouSuctionPressCorrection"),
+    ),
+    # Expansion Valve and Control
+    CSNetHomeSensorEntityDescription(
+        key="expansion_valve_opening",
+        name="Expansion Valve Opening (EVI)",
+        device_class="percentage",
+        native_unit_of_measurement="%",
+        # evi is the expansion valve opening (0-100%)
+        value_fn=_snapshot_field("heating_status", "evi"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="ou_evo_1",
+        name="Expansion Valve Opening (EVO)",
+        device_class="percentage",
+        native_unit_of_measurement="%",
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="outdoor_fan_rpm",
+        name="Outdoor Fan RPM",
+        native_unit_of_measurement="RPM",
+        # -1 indicates no data or unavailable
+        value_fn=_snapshot_field("heating_status", "fanRPM", invalid=-1),
+    ),
+    # Outdoor Unit Information
+    CSNetHomeSensorEntityDescription(
+        key="operation_status",
+        name="Operation Status",
+        device_class="enum",
+        value_fn=_operation_status,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="system_status_flags",
+        name="System Status Flags",
+        value_fn=_system_status_flags,
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="ou_code", name="Outdoor Unit Code", device_class="enum", value_fn=_ou_code
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="ou_capacity_code",
+        name="Outdoor Unit Capacity Code",
+        value_fn=_snapshot_field("heating_status", "ouCapacityCode"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="ou_pcb_software",
+        name="Outdoor Unit PCB Software",
+        # -1 indicates no data
+        value_fn=_snapshot_field("heating_status", "ouPcbSoft", invalid=-1),
+    ),
+    # Secondary Cycle Sensors (for dual-cycle systems)
+    CSNetHomeSensorEntityDescription(
+        key="secondary_discharge_temp",
+        name="Secondary Discharge Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=attrgetter("secondary_discharge_temperature"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_suction_temp",
+        name="Secondary Suction Temperature",
+        device_class="temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        value_fn=attrgetter("secondary_suction_temperature"),
+    ),
+    # 127 seems to be a default/invalid value of the secondary pressures
+    CSNetHomeSensorEntityDescription(
+        key="secondary_discharge_pressure",
+        name="Secondary Discharge Pressure",
+        device_class="pressure",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        value_fn=_snapshot_field("second_cycle", "dischargePressure", invalid=127),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_suction_pressure",
+        name="Secondary Suction Pressure",
+        device_class="pressure",
+        native_unit_of_measurement=UnitOfPressure.BAR,
+        value_fn=_snapshot_field("second_cycle", "suctionPressure", invalid=127),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_compressor_frequency",
+        name="Secondary Compressor Frequency",
+        device_class="frequency",
+        native_unit_of_measurement="Hz",
+        value_fn=_snapshot_field("second_cycle", "compressorFreq"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_expansion_valve",
+        name="Secondary Expansion Valve",
+        # 255 seems to be a default/invalid value
+        value_fn=_snapshot_field("second_cycle", "expansionValve", invalid=255),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_compressor_current",
+        name="Secondary Compressor Current",
+        device_class="current",
+        native_unit_of_measurement="A",
+        value_fn=_snapshot_field("second_cycle", "compressorCurrent"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_current",
+        name="Secondary Current",
+        device_class="current",
+        native_unit_of_measurement="A",
+        value_fn=_snapshot_field("second_cycle", "secondaryCurrent"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_superheat",
+        name="Secondary Superheat",
+        value_fn=_snapshot_field("second_cycle", "teSH"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_stop_code",
+        name="Secondary Stop Code",
+        device_class="enum",
+        value_fn=_second_cycle_code("stopCode", "Running"),
+    ),
+    CSNetHomeSensorEntityDescription(
+        key="secondary_retry_code",
+        name="Secondary Retry Code",
+        device_class="enum",
+        value_fn=_second_cycle_code("retryCode", "Normal"),
+    ),
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -69,835 +746,83 @@ async def async_setup_entry(hass, entry, async_add_entities):
         return None
 
     sensors = []
+    common_data = {}
     for sensor_data in coordinator.get_sensors_data():
         common_data = coordinator.get_common_data()["device_status"][
             sensor_data["device_id"]
         ]
-
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator,
-                sensor_data,
-                common_data,
-                "current_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-            )
-        )
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator,
-                sensor_data,
-                common_data,
-                "setting_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-            )
-        )
-        sensors.append(
-            CSNetHomeSensor(coordinator, sensor_data, common_data, "mode", "enum")
-        )
-        sensors.append(
-            CSNetHomeSensor(coordinator, sensor_data, common_data, "on_off", "enum")
-        )
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator, sensor_data, common_data, "doingBoost", "binary"
-            )
-        )
-        # expose alarm information
-        sensors.append(
-            CSNetHomeSensor(coordinator, sensor_data, common_data, "alarm_code", "enum")
+        sensors.extend(
+            CSNetHomeSensor(coordinator, sensor_data, common_data, description)
+            for description in ZONE_SENSORS
         )
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator, sensor_data, common_data, "alarm_active", "binary"
-            )
-        )
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator, sensor_data, common_data, "alarm_message", "enum"
-            )
-        )
-        # Enhanced alarm information
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator, sensor_data, common_data, "alarm_code_formatted", "enum"
-            )
-        )
-        sensors.append(
-            CSNetHomeSensor(
-                coordinator, sensor_data, common_data, "alarm_origin", "enum"
-            )
-        )
-        sensors.append(
-            CSNetHomeSensor(coordinator, sensor_data, common_data, "unit_type", "enum")
-        )
-
-        # Add WiFi signal strength sensor
-        sensors.append(
-            CSNetHomeDeviceSensor(
-                coordinator,
-                sensor_data,
-                common_data,
-                "wifi_signal",
-                SensorDeviceClass.SIGNAL_STRENGTH,
-                SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-                "WiFi Signal",
-            )
-        )
-
-        # Add connectivity binary sensor
-        sensors.append(
-            CSNetHomeDeviceSensor(
-                coordinator,
-                sensor_data,
-                common_data,
-                "connectivity",
-                "binary",
-                None,
-                "Connectivity",
-            )
-        )
-
-        # Add last communication timestamp sensor
-        sensors.append(
-            CSNetHomeDeviceSensor(
-                coordinator,
-                sensor_data,
-                common_data,
-                "last_communication",
-                SensorDeviceClass.TIMESTAMP,
-                None,
-                "Last Communication",
-            )
+        sensors.extend(
+            CSNetHomeDeviceSensor(coordinator, sensor_data, common_data, description)
+            for description in DEVICE_SENSORS
         )
 
     # Add installation devices sensors
     installation_devices_data = coordinator.get_installation_devices_data()
     if installation_devices_data:
-        # Create a global device for installation-level sensors
-        global_device_data = {
-            "device_name": "System",
-            "device_id": "global",
-            "room_name": "Controller",
-            "parent_id": "global",
-            "room_id": "global",
-        }
-
-        # Water-related sensors
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "pump_speed",
-                "percentage",
-                "%",
-                "Pump Speed",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "water_flow",
-                "water_debit",
-                UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
-                "Water Flow",
-            )
-        )
-        sensors.append(
+        sensors.extend(
             CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "in_water_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "In Water Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "out_water_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Out Water Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "out_water_temperature_3",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "External Tank Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "set_water_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Set Water Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "water_pressure",
-                "pressure",
-                UnitOfPressure.BAR,
-                "Water Pressure",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "gas_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Gas Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "liquid_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Liquid Temperature",
-            )
-        )
-
-        # Heat device sensors
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "defrost",
-                "binary",
-                None,
-                "Defrost",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "mix_valve_position",
-                "percentage",
-                "%",
-                "Mix Valve Position",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "external_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Outdoor Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "mean_external_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Outdoor Average Temperature",
-            )
-        )
-
-        # Weather sensor from cloud service (Issue #79)
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "weather_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Weather Temperature",
-            )
-        )
-
-        # Central Control Configuration sensors
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "central_config",
-                "enum",
-                None,
-                "Central Config",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "lcd_software_version",
-                None,
-                None,
-                "LCD Software Version",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "unit_model",
-                "enum",
-                None,
-                "Unit Model",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "central_control_enabled",
-                "binary",
-                None,
-                "Central Control Enabled",
-            )
-        )
-
-        # System Configuration Diagnostic sensors (Issue #78)
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "cascade_slave_mode",
-                "binary",
-                None,
-                "Cascade Slave Mode",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "fan_coil_compatible",
-                "binary",
-                None,
-                "Fan Coil Compatible",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "c1_thermostat_present",
-                "binary",
-                None,
-                "C1 Thermostat Present",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "c2_thermostat_present",
-                "binary",
-                None,
-                "C2 Thermostat Present",
-            )
-        )
-
-        # OTC (Outdoor Temperature Compensation) sensors (Issue #71)
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "otc_heating_type_c1",
-                "enum",
-                None,
-                "OTC Heating Type C1",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "otc_cooling_type_c1",
-                "enum",
-                None,
-                "OTC Cooling Type C1",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "otc_heating_type_c2",
-                "enum",
-                None,
-                "OTC Heating Type C2",
-            )
-        )
-        sensors.append(
-            CSNetHomeInstallationSensor(
-                coordinator,
-                global_device_data,
-                common_data,
-                "otc_cooling_type_c2",
-                "enum",
-                None,
-                "OTC Cooling Type C2",
+                coordinator, GLOBAL_DEVICE_DATA, common_data, description
             )
+            for description in INSTALLATION_SENSORS
         )
 
     # Add alarm history sensor (shows recent alarms from installation alarms API)
     sensors.append(CSNetHomeAlarmHistorySensor(coordinator, common_data))
 
     # Add alarm statistics sensors (total count, by origin, by device)
-    sensors.append(
-        CSNetHomeAlarmStatisticsSensor(
-            coordinator, common_data, "total_alarm_count", "Total Alarms"
-        )
-    )
-    sensors.append(
-        CSNetHomeAlarmStatisticsSensor(
-            coordinator, common_data, "active_alarm_count", "Active Alarms"
-        )
-    )
-    sensors.append(
-        CSNetHomeAlarmStatisticsSensor(
-            coordinator, common_data, "alarm_by_origin", "Alarms by Origin"
-        )
+    sensors.extend(
+        CSNetHomeAlarmStatisticsSensor(coordinator, common_data, description)
+        for description in ALARM_STATISTICS_SENSORS
     )
 
     # Add compressor/outdoor unit sensors
     if installation_devices_data:
-        compressor_device_data = {
-            "device_name": "Compressor",
-            "device_id": "compressor",
-            "room_name": "Outdoor Unit",
-            "parent_id": "compressor",
-            "room_id": "compressor",
-        }
-
-        # Primary Compressor Sensors
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "compressor_frequency",
-                "frequency",
-                "Hz",
-                "Compressor Frequency",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "compressor_current",
-                "current",
-                "A",
-                "Compressor Current",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "compressor_capacity",
-                None,
-                None,
-                "Compressor Capacity",
-            )
-        )
-
-        # Compressor Temperatures
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "discharge_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Discharge Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "evaporator_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Evaporator Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "outdoor_ambient_temperature",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Outdoor Ambient Temperature",
-            )
-        )
-
-        # Compressor Pressures
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "discharge_pressure",
-                "pressure",
-                UnitOfPressure.BAR,
-                "Discharge Pressure",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "suction_pressure",
-                "pressure",
-                UnitOfPressure.BAR,
-                "Suction Pressure",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "suction_pressure_correction",
-                None,
-                None,
-                "Suction Pressure Correction",
-            )
-        )
-
-        # Expansion Valve and Control
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "expansion_valve_opening",
-                "percentage",
-                "%",
-                "Expansion Valve Opening (EVI)",
-            )
-        )
-        sensors.append(
+        sensors.extend(
             CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "ou_evo_1",
-                "percentage",
-                "%",
-                "Expansion Valve Opening (EVO)",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "outdoor_fan_rpm",
-                None,
-                "RPM",
-                "Outdoor Fan RPM",
-            )
-        )
-
-        # Outdoor Unit Information
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "operation_status",
-                "enum",
-                None,
-                "Operation Status",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "system_status_flags",
-                None,
-                None,
-                "System Status Flags",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "ou_code",
-                "enum",
-                None,
-                "Outdoor Unit Code",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "ou_capacity_code",
-                None,
-                None,
-                "Outdoor Unit Capacity Code",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "ou_pcb_software",
-                None,
-                None,
-                "Outdoor Unit PCB Software",
-            )
-        )
-
-        # Secondary Cycle Sensors (for dual-cycle systems)
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_discharge_temp",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Secondary Discharge Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_suction_temp",
-                "temperature",
-                UnitOfTemperature.CELSIUS,
-                "Secondary Suction Temperature",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_discharge_pressure",
-                "pressure",
-                UnitOfPressure.BAR,
-                "Secondary Discharge Pressure",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_suction_pressure",
-                "pressure",
-                UnitOfPressure.BAR,
-                "Secondary Suction Pressure",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_compressor_frequency",
-                "frequency",
-                "Hz",
-                "Secondary Compressor Frequency",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_expansion_valve",
-                None,
-                None,
-                "Secondary Expansion Valve",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_compressor_current",
-                "current",
-                "A",
-                "Secondary Compressor Current",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_current",
-                "current",
-                "A",
-                "Secondary Current",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_superheat",
-                None,
-                None,
-                "Secondary Superheat",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_stop_code",
-                "enum",
-                None,
-                "Secondary Stop Code",
-            )
-        )
-        sensors.append(
-            CSNetHomeCompressorSensor(
-                coordinator,
-                compressor_device_data,
-                common_data,
-                "secondary_retry_code",
-                "enum",
-                None,
-                "Secondary Retry Code",
+                coordinator, COMPRESSOR_DEVICE_DATA, common_data, description
             )
+            for description in COMPRESSOR_SENSORS
         )
 
     async_add_entities(sensors)
 
 
-class CSNetHomeSensor(CoordinatorEntity, Entity):
+class CSNetHomeSensor(CoordinatorEntity, SensorEntity):
     """Representation of a sensor from the CSNet Home integration."""
 
+    entity_description: CSNetHomeSensorEntityDescription
+
     def __init__(
         self,
         coordinator: CSNetHomeCoordinator,
         sensor_data,
         common_data,
-        key,
-        device_class=None,
-        unit=None,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        self._sensor_key = sensor_key(sensor_data)
+        super().__init__(coordinator, frozenset({self._sensor_key}))
+        self.entity_description = description
         self._coordinator = coordinator
         self._sensor_data = sensor_data
         self._common_data = common_data
-        self._key = key
-        self._device_class = device_class
-        self._unit = unit
-        self._name = f"{sensor_data.get('device_name', 'Unknown')} {sensor_data.get('room_name', 'Unknown')} {key}"
+        self._value_fn = description.value_fn or _zone_field(description.key)
+        self._name = f"{sensor_data.get('device_name', 'Unknown')} {sensor_data.get('room_name', 'Unknown')} {description.key}"
         _LOGGER.debug("Configuring Sensor %s", self._name)
 
     @property
-    def state(self):
-        """Return the current temperature as the state of the sensor."""
-        value = self._sensor_data.get(self._key)
-        if self._key == "mode":
-            if value == 0:
-                return HVACMode.COOL
-            if value == 1:
-                return HVACMode.HEAT
-            return HVACMode.OFF
-        if self._key == "on_off":
-            return STATE_ON if value == 1 else STATE_OFF
-        if self._key == "alarm_active":
-            # computed from alarm_code
-            alarm_code = self._sensor_data.get("alarm_code")
-            return STATE_ON if alarm_code not in (None, 0) else STATE_OFF
-        return value
-
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return self._device_class
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement for the sensor."""
-        return self._unit
+    def native_value(self):
+        """Return the value of the zone field."""
+        return self._value_fn(self._sensor_data)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
-        self._sensor_data = next(
-            (
-                x
-                for x in self._coordinator.get_sensors_data()
-                if x.get("room_name") in self._name
-            ),
-            None,
-        )
+        self._sensor_data = self._coordinator.get_sensor(self._sensor_key)
         if self._sensor_data:
             self.async_write_ha_state()
 
@@ -946,288 +871,42 @@ class CSNetHomeSensor(CoordinatorEntity, Entity):
         """Return unique id."""
         # All entities must have a unique id.  Think carefully what you want this to be as
         # changing it later will cause HA to create new entities.
-        return f"{DOMAIN}-{self._sensor_data.get('room_name', 'unknown')}-{self._key}"
+        return f"{DOMAIN}-{self._sensor_data.get('room_name', 'unknown')}-{self.entity_description.key}"
 
 
-class CSNetHomeInstallationSensor(CoordinatorEntity, Entity):
+class CSNetHomeInstallationSensor(CoordinatorEntity, SensorEntity):
     """Representation of an installation-level sensor from the CSNet Home integration."""
 
+    entity_description: CSNetHomeSensorEntityDescription
+
     def __init__(
         self,
         coordinator: CSNetHomeCoordinator,
         device_data,
         common_data,
-        key,
-        device_class=None,
-        unit=None,
-        friendly_name=None,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the installation sensor."""
-        super().__init__(coordinator)
+        key = description.key
+        super().__init__(coordinator, _installation_context(key))
+        self.entity_description = description
         self._coordinator = coordinator
         self._device_data = device_data
         self._common_data = common_data
-        self._key = key
-        self._device_class = device_class
-        self._unit = unit
-        self._friendly_name = friendly_name or key
-        self._name = f"{device_data['device_name']} {device_data['room_name']} {self._friendly_name}"
+        if key == "weather_temperature":
+            # Weather comes from the cloud service, not the installation (Issue #79)
+            self._accessor = lambda _snapshot: coordinator.get_common_data().get(
+                "weather_temperature"
+            )
+        else:
+            self._accessor = compile_installation_accessor(key)
+        self._name = f"{device_data['device_name']} {device_data['room_name']} {_description_name(description)}"
         _LOGGER.debug("Configuring Installation Sensor %s", self._name)
 
     @property
-    def state(self):
-        """Return the current state of the sensor."""
-        # Special handling for weather_temperature from cloud service (Issue #79)
-        if self._key == "weather_temperature":
-            common_data = self._coordinator.get_common_data()
-            return common_data.get("weather_temperature")
-
-        installation_data = self._coordinator.get_installation_devices_data()
-
-        # Map the sensor keys to actual API response keys from indoors/heatingStatus
-        key_mappings = {
-            "pump_speed": ["pumpSpeed"],
-            "water_flow": ["waterFlow"],
-            "in_water_temperature": ["waterInletTemp"],
-            "out_water_temperature": ["waterOutletTemp"],
-            "out_water_temperature_3": ["waterOutlet3Temp"],
-            "set_water_temperature": ["waterTempSetting"],
-            "water_pressure": ["waterPressure"],
-            "defrost": ["defrosting"],
-            "mix_valve_position": ["mixingValveOpening"],
-            "external_temperature": ["outdoorAmbientTemp"],
-            "mean_external_temperature": ["outdoorAmbientAverageTemp"],
-            "gas_temperature": ["gasTemp"],
-            "liquid_temperature": ["liquidTemp"],
-            # Central control configuration
-            "central_config": ["centralConfig"],
-            "lcd_software_version": ["lcdSoft"],
-            "unit_model": ["unitModel"],
-            # DHW temperatures (Issue #155)
-            "bottom_dhw_temperature": ["bottomTempDHW"],
-            "top_dhw_temperature": ["topTempDHW"],
-            "heat_exchanger_water_outlet_temperature": ["waterOutletHPTemp"],
-        }
-
-        # Try to find the value using different possible key names
-        possible_keys = key_mappings.get(self._key, [self._key])
-        value = None
-
-        # Look in the correct API response structure: data[0].indoors[0].heatingStatus
-        if isinstance(installation_data, dict):
-            # First try direct access
-            for possible_key in possible_keys:
-                value = installation_data.get(possible_key)
-                if value is not None:
-                    break
-
-            # If not found, try in data[0].indoors[0].heatingStatus structure
-            if value is None:
-                data_array = installation_data.get("data", [])
-                if isinstance(data_array, list) and len(data_array) > 0:
-                    first_device = data_array[0]
-                    if isinstance(first_device, dict):
-                        indoors_array = first_device.get("indoors", [])
-                        if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                            first_indoors = indoors_array[0]
-                            if isinstance(first_indoors, dict):
-                                heating_status = first_indoors.get("heatingStatus", {})
-                                if isinstance(heating_status, dict):
-                                    for possible_key in possible_keys:
-                                        value = heating_status.get(possible_key)
-                                        if value is not None:
-                                            break
-
-        # Handle special cases for different sensor types
-        if self._key == "defrost":
-            # defrosting: 0 = off, 1 = on
-            return STATE_ON if value == 1 else STATE_OFF
-        if self._key == "water_flow":
-            # waterFlow value must be divided by 10 to have the right measurement unit
-            if isinstance(value, (int, float)):
-                return value / 10
-            return value
-        if self._key == "water_pressure":
-            # waterPressure: app shows 4.48bar, value is 224, so divide by 50
-            if isinstance(value, (int, float)):
-                return value / 50
-            return value
-        if self._key in ["pump_speed", "mix_valve_position"]:
-            # These values are already in percentage (0-100) from the API
-            return value
-
-        # Central control configuration sensors
-        if self._key == "unit_model":
-            # Decode unit model codes
-            unit_models = {
-                0: "Yutaki S",
-                1: "Yutaki SC",
-                2: "Yutaki S80",
-                3: "Yutaki M",
-                4: "Yutaki SC Lite",
-                5: "Yutampo",
-            }
-            return unit_models.get(value, f"Unknown ({value})")
-
-        if self._key == "lcd_software_version":
-            # Format as hex version (e.g., 0x0222 = v2.34)
-            if isinstance(value, int) and value > 0:
-                return f"0x{value:04X}"
-            return value
-
-        if self._key == "central_config":
-            # Decode central config values
-            config_names = {
-                0: "Unit Only",
-                1: "RT Only",
-                2: "Unit & RT",
-                3: "Total Control",
-                4: "Total Control+",
-            }
-            decoded = config_names.get(value, f"Unknown ({value})")
-            if value is not None and value < 3:
-                decoded += " ⚠️"  # Warning for insufficient control
-            return decoded
-
-        if self._key == "central_control_enabled":
-            # Calculate if central control is properly configured
-            # Based on JavaScript function isCentralWellConfigured()
-            if not isinstance(installation_data, dict):
-                return STATE_OFF
-
-            heating_status = None
-            data_array = installation_data.get("data", [])
-            if isinstance(data_array, list) and len(data_array) > 0:
-                first_device = data_array[0]
-                if isinstance(first_device, dict):
-                    indoors_array = first_device.get("indoors", [])
-                    if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                        first_indoors = indoors_array[0]
-                        if isinstance(first_indoors, dict):
-                            heating_status = first_indoors.get("heatingStatus", {})
-
-            if not heating_status:
-                return STATE_OFF
-
-            central_config = heating_status.get("centralConfig", 0)
-
-            # Central config >= 3 means "Total" control is enabled
-            if central_config >= 3:
-                return STATE_ON
-
-            # For non-S80 models, check LCD software version
-            unit_model = heating_status.get("unitModel", 0)
-            code_yutaki_s80 = 2
-
-            if unit_model != code_yutaki_s80:
-                lcd_soft = heating_status.get("lcdSoft", 0)
-
-                # lcdSoft == 0 means not configured yet (during wizard)
-                if lcd_soft == 0:
-                    return STATE_ON
-
-                # Version >= 0x0222 (546 decimal) allows control
-                if lcd_soft >= 0x0222:
-                    return STATE_ON
-
-            return STATE_OFF
-
-        # System Configuration Diagnostic sensors (Issue #78)
-        # Extract systemConfigBits from heatingStatus
-        if self._key in [
-            "cascade_slave_mode",
-            "fan_coil_compatible",
-            "c1_thermostat_present",
-            "c2_thermostat_present",
-        ]:
-            heating_status = None
-            data_array = installation_data.get("data", [])
-            if isinstance(data_array, list) and len(data_array) > 0:
-                first_device = data_array[0]
-                if isinstance(first_device, dict):
-                    indoors_array = first_device.get("indoors", [])
-                    if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                        first_indoors = indoors_array[0]
-                        if isinstance(first_indoors, dict):
-                            heating_status = first_indoors.get("heatingStatus", {})
-
-            if not heating_status:
-                return STATE_OFF
-
-            system_config_bits = heating_status.get("systemConfigBits", 0)
-
-            # Decode the specific bit based on the sensor key
-            if self._key == "cascade_slave_mode":
-                # Bit 0x1000 (4096) indicates cascade slave mode
-                return STATE_ON if (system_config_bits & 0x1000) > 0 else STATE_OFF
-            if self._key == "fan_coil_compatible":
-                # Bit 0x2000 (8192) indicates fan coil compatibility
-                return STATE_ON if (system_config_bits & 0x2000) > 0 else STATE_OFF
-            if self._key == "c1_thermostat_present":
-                # Bit 0x40 (64) indicates C1 thermostat present
-                return STATE_ON if (system_config_bits & 0x40) > 0 else STATE_OFF
-            if self._key == "c2_thermostat_present":
-                # Bit 0x80 (128) indicates C2 thermostat present
-                return STATE_ON if (system_config_bits & 0x80) > 0 else STATE_OFF
-
-        # OTC (Outdoor Temperature Compensation) sensors (Issue #71)
-        if self._key in [
-            "otc_heating_type_c1",
-            "otc_cooling_type_c1",
-            "otc_heating_type_c2",
-            "otc_cooling_type_c2",
-        ]:
-            if not installation_data:
-                return "Unknown"
-
-            heating_status = None
-            data_array = installation_data.get("data", [])
-            if isinstance(data_array, list) and len(data_array) > 0:
-                first_device = data_array[0]
-                if isinstance(first_device, dict):
-                    indoors_array = first_device.get("indoors", [])
-                    if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                        first_indoors = indoors_array[0]
-                        if isinstance(first_indoors, dict):
-                            heating_status = first_indoors.get("heatingStatus", {})
-
-            if not heating_status:
-                return "Unknown"
-
-            # Map sensor key to API key
-            otc_key_map = {
-                "otc_heating_type_c1": "otcTypeHeatC1",
-                "otc_cooling_type_c1": "otcTypeCoolC1",
-                "otc_heating_type_c2": "otcTypeHeatC2",
-                "otc_cooling_type_c2": "otcTypeCoolC2",
-            }
-
-            api_key = otc_key_map.get(self._key)
-            if api_key:
-                otc_value = heating_status.get(api_key)
-                if otc_value is not None:
-                    # Return the descriptive name for the OTC type
-                    if "heating" in self._key:
-                        return OTC_HEATING_TYPE_NAMES.get(
-                            otc_value, f"Unknown ({otc_value})"
-                        )
-                    return OTC_COOLING_TYPE_NAMES.get(
-                        otc_value, f"Unknown ({otc_value})"
-                    )
-
-            return "Unknown"
-
-        return value
-
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return self._device_class
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement for the sensor."""
-        return self._unit
+    def native_value(self):
+        """Return the current value of the sensor."""
+        return self._accessor(self._coordinator.get_installation_snapshot())
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -1258,7 +937,7 @@ class CSNetHomeInstallationSensor(CoordinatorEntity, Entity):
     @property
     def unique_id(self) -> str:
         """Return unique id."""
-        return f"{DOMAIN}-installation-{self._key}"
+        return f"{DOMAIN}-installation-{self.entity_description.key}"
 
 
 class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
@@ -1272,19 +951,7 @@ class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
 
     def _get_heating_status(self):
         """Get heatingStatus from installation devices data."""
-        installation_data = self._coordinator.get_installation_devices_data()
-        if not isinstance(installation_data, dict):
-            return None
-        data_array = installation_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        return first_indoors.get("heatingStatus", {})
-        return None
+        return self._coordinator.get_installation_snapshot().heating_status
 
     def _calculate_complex_power(self, heating_status):
         """Calculate power using the complex physical model with guardrails."""
@@ -1294,7 +961,7 @@ class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
         p_low = heating_status.get("ouSuctionPress", 0)
 
         # Get temp using the module-level helper function
-        t_discharge = _convert_unsigned_to_signed_byte(
+        t_discharge = convert_unsigned_to_signed_byte(
             heating_status.get("ouDischargeTemperature")
         )
         if t_discharge is None:
@@ -1368,8 +1035,8 @@ class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
         return round(final_power)
 
     @property
-    def state(self):
-        """Calculate and return the state."""
+    def native_value(self):
+        """Calculate and return the value."""
         heating_status = self._get_heating_status()
         if not heating_status:
             return 0
@@ -1385,7 +1052,7 @@ class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
         # 1. Instant Consumption (Watts) - complex model with guardrails
         instant_consumption = self._calculate_complex_power(heating_status)
 
-        if self._key == "instant_consumption":
+        if self.entity_description.key == "instant_consumption":
             return instant_consumption
 
         # 2. Heating Power (Watts)
@@ -1400,11 +1067,11 @@ class CSNetHomeCalculatedSensor(CSNetHomeInstallationSensor):
         if delta_t > 0 and flow_rate >= 0.01:
             heating_power = round(flow_rate * 1160 * delta_t, 2)
 
-        if self._key == "heating_power":
+        if self.entity_description.key == "heating_power":
             return heating_power
 
         # 3. Instant COP
-        if self._key == "instant_cop":
+        if self.entity_description.key == "instant_cop":
             if instant_consumption < 50:
                 return 0.0
             return round(heating_power / instant_consumption, 2)
@@ -1432,21 +1099,12 @@ class CSNetHomeDailySensor(CSNetHomeCalculatedSensor, RestoreEntity):
         coordinator: CSNetHomeCoordinator,
         device_data,
         common_data,
-        key,
-        device_class=None,
-        unit=None,
-        friendly_name=None,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the daily sensor."""
-        super().__init__(
-            coordinator,
-            device_data,
-            common_data,
-            key,
-            device_class,
-            unit,
-            friendly_name,
-        )
+        super().__init__(coordinator, device_data, common_data, description)
+        # Energy is integrated over time, so every refresh must be processed
+        self.coordinator_context = None
         self._state = 0.0
         # Dedicated accumulators for this instance
         self._energy_in = 0.0  # Input energy (Electricity)
@@ -1469,14 +1127,14 @@ class CSNetHomeDailySensor(CSNetHomeCalculatedSensor, RestoreEntity):
         self._last_update_time = dt_util.now()
 
     @property
-    def state(self):
-        """Return the accumulated state."""
+    def native_value(self):
+        """Return the accumulated value."""
         return round(self._state, 2)
 
     @property
     def state_class(self):
         """Return the state class."""
-        if self._key.startswith("daily_cop"):
+        if self.entity_description.key.startswith("daily_cop"):
             return SensorStateClass.MEASUREMENT
         # Energy sensors are increasing counters that reset
         return SensorStateClass.TOTAL_INCREASING
@@ -1533,26 +1191,26 @@ class CSNetHomeDailySensor(CSNetHomeCalculatedSensor, RestoreEntity):
         energy_consumption_kwh = (power_consumption_w * time_diff) / 1000.0
         energy_heating_kwh = (heating_power_w * time_diff) / 1000.0
 
-        if self._key == "daily_consumption":
+        if self.entity_description.key == "daily_consumption":
             self._state += energy_consumption_kwh
 
-        elif self._key == "daily_heating":
+        elif self.entity_description.key == "daily_heating":
             self._state += energy_heating_kwh
 
         # Daily COPs
-        elif self._key in ["daily_cop_heating", "daily_cop_dhw"]:
+        elif self.entity_description.key in ["daily_cop_heating", "daily_cop_dhw"]:
             op_status = heating_status.get("operationStatus")
             defrost_active = heating_status.get("defrosting") == 1
 
             should_accumulate = False
 
-            if self._key == "daily_cop_heating":
+            if self.entity_description.key == "daily_cop_heating":
                 # Accumulate if Heating (6)
                 # OR Defrosting is active (AND we are not explicitly in DHW mode)
                 if op_status == 6 or (defrost_active and op_status != 8):
                     should_accumulate = True
 
-            elif self._key == "daily_cop_dhw":
+            elif self.entity_description.key == "daily_cop_dhw":
                 # Accumulate if DHW (8)
                 # OR Defrosting is active (AND we are not explicitly in Heating mode)
                 if op_status == 8 or (defrost_active and op_status != 6):
@@ -1574,46 +1232,43 @@ class CSNetHomeDailySensor(CSNetHomeCalculatedSensor, RestoreEntity):
         self.async_write_ha_state()
 
 
-class CSNetHomeDeviceSensor(CoordinatorEntity, Entity):
+class CSNetHomeDeviceSensor(CoordinatorEntity, SensorEntity):
     """Representation of a device-level sensor (WiFi, connectivity) from CSNet Home."""
 
+    entity_description: CSNetHomeSensorEntityDescription
+
     def __init__(
         self,
         coordinator: CSNetHomeCoordinator,
         sensor_data,
         common_data,
-        key,
-        device_class=None,
-        unit=None,
-        friendly_name=None,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the device sensor."""
-        super().__init__(coordinator)
+        self._sensor_key = sensor_key(sensor_data)
+        super().__init__(coordinator, frozenset({self._sensor_key, TOPIC_COMMON}))
+        self.entity_description = description
         self._coordinator = coordinator
         self._sensor_data = sensor_data
         self._common_data = common_data
-        self._key = key
-        self._device_class = device_class
-        self._unit = unit
-        self._friendly_name = friendly_name or key
         self._device_id = sensor_data.get("device_id")
-        self._name = f"{sensor_data['device_name']} {self._friendly_name}"
+        self._name = f"{sensor_data['device_name']} {_description_name(description)}"
         _LOGGER.debug("Configuring Device Sensor %s", self._name)
 
     @property
-    def state(self):
-        """Return the current state of the sensor."""
+    def native_value(self):
+        """Return the current value of the sensor."""
         # Get the device status from common_data
         device_status = self._common_data.get("device_status", {}).get(self._device_id)
 
         if not device_status:
             return None
 
-        if self._key == "wifi_signal":
+        if self.entity_description.key == "wifi_signal":
             # Return RSSI value (WiFi signal strength in dBm)
             return device_status.get("rssi")
 
-        if self._key == "connectivity":
+        if self.entity_description.key == "connectivity":
             # Calculate connectivity status based on lastComm timestamp
             # Device is considered offline if last communication was > 10 minutes ago
             last_comm = device_status.get("lastComm")
@@ -1630,42 +1285,23 @@ class CSNetHomeDeviceSensor(CoordinatorEntity, Entity):
             # Online if last communication was within 10 minutes
             return STATE_ON if time_diff_minutes <= 10 else STATE_OFF
 
-        if self._key == "last_communication":
-            # Return last communication timestamp as ISO 8601 datetime
+        if self.entity_description.key == "last_communication":
+            # Return last communication timestamp as a UTC datetime
             last_comm = device_status.get("lastComm")
             if last_comm is None:
                 return None
 
             # Convert from milliseconds to seconds and create datetime
             timestamp_seconds = last_comm / 1000
-            return datetime.fromtimestamp(
-                timestamp_seconds, tz=timezone.utc
-            ).isoformat()
+            return datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
 
         return None
 
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return self._device_class
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement for the sensor."""
-        return self._unit
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
         # Update sensor_data reference
-        self._sensor_data = next(
-            (
-                x
-                for x in self._coordinator.get_sensors_data()
-                if x.get("device_id") == self._device_id
-            ),
-            None,
-        )
+        self._sensor_data = self._coordinator.get_sensor(self._sensor_key)
 
         # Update common_data reference
         self._common_data = self._coordinator.get_common_data()
@@ -1699,21 +1335,21 @@ class CSNetHomeDeviceSensor(CoordinatorEntity, Entity):
     @property
     def unique_id(self) -> str:
         """Return unique id."""
-        return f"{DOMAIN}-{self._sensor_data.get('room_name', 'unknown')}-{self._key}"
+        return f"{DOMAIN}-{self._sensor_data.get('room_name', 'unknown')}-{self.entity_description.key}"
 
 
-class CSNetHomeAlarmHistorySensor(CoordinatorEntity, Entity):
+class CSNetHomeAlarmHistorySensor(CoordinatorEntity, SensorEntity):
     """Sensor showing alarm history from installation alarms API."""
 
     def __init__(self, coordinator: CSNetHomeCoordinator, common_data):
         """Initialize the alarm history sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, frozenset({TOPIC_ALARMS}))
         self._coordinator = coordinator
         self._common_data = common_data
         self._name = "Alarm History"
 
     @property
-    def state(self):
+    def native_value(self):
         """Return the number of alarms in history."""
         alarms_data = self._coordinator.get_installation_alarms_data()
         if not alarms_data:
@@ -1779,25 +1415,27 @@ class CSNetHomeAlarmHistorySensor(CoordinatorEntity, Entity):
         return f"{DOMAIN}-installation-alarm-history"
 
 
-class CSNetHomeAlarmStatisticsSensor(CoordinatorEntity, Entity):
+class CSNetHomeAlarmStatisticsSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing alarm statistics."""
 
+    entity_description: CSNetHomeSensorEntityDescription
+
     def __init__(
         self,
         coordinator: CSNetHomeCoordinator,
         common_data,
-        statistic_type: str,
-        friendly_name: str,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the alarm statistics sensor."""
         super().__init__(coordinator)
+        self.entity_description = description
         self._coordinator = coordinator
         self._common_data = common_data
-        self._statistic_type = statistic_type
-        self._name = friendly_name
+        self._statistic_type = description.key
+        self._name = _description_name(description)
 
     @property
-    def state(self):
+    def native_value(self):
         """Return the statistic value."""
         sensors = self._coordinator.get_sensors_data()
 
@@ -1909,221 +1547,52 @@ class CSNetHomeAlarmStatisticsSensor(CoordinatorEntity, Entity):
         return f"{DOMAIN}-{self._statistic_type}"
 
 
-class CSNetHomeCompressorSensor(CoordinatorEntity, Entity):
+class CSNetHomeCompressorSensor(CoordinatorEntity, SensorEntity):
     """Representation of a compressor/outdoor unit sensor from CSNet Home."""
 
+    entity_description: CSNetHomeSensorEntityDescription
+
     def __init__(
         self,
         coordinator: CSNetHomeCoordinator,
         device_data,
         common_data,
-        key,
-        device_class=None,
-        unit=None,
-        friendly_name=None,
+        description: CSNetHomeSensorEntityDescription,
     ):
         """Initialize the compressor sensor."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, frozenset({TOPIC_INSTALLATION, TOPIC_HEATING_STATUS})
+        )
+        self.entity_description = description
         self._coordinator = coordinator
         self._device_data = device_data
         self._common_data = common_data
-        self._key = key
-        self._device_class = device_class
-        self._unit = unit
-        self._friendly_name = friendly_name or key
-        self._name = f"{device_data['device_name']} {device_data['room_name']} {self._friendly_name}"
+        self._value_fn = description.value_fn
+        self._name = f"{device_data['device_name']} {device_data['room_name']} {_description_name(description)}"
         _LOGGER.debug("Configuring Compressor Sensor %s", self._name)
 
     def _get_heating_status(self):
         """Get heatingStatus from installation devices data."""
-        installation_data = self._coordinator.get_installation_devices_data()
-        if not isinstance(installation_data, dict):
-            return None
-
-        data_array = installation_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        return first_indoors.get("heatingStatus", {})
-        return None
-
-    def _get_second_cycle(self):
-        """Get secondCycle from installation devices data."""
-        installation_data = self._coordinator.get_installation_devices_data()
-        if not isinstance(installation_data, dict):
-            return None
-
-        data_array = installation_data.get("data", [])
-        if isinstance(data_array, list) and len(data_array) > 0:
-            first_device = data_array[0]
-            if isinstance(first_device, dict):
-                indoors_array = first_device.get("indoors", [])
-                if isinstance(indoors_array, list) and len(indoors_array) > 0:
-                    first_indoors = indoors_array[0]
-                    if isinstance(first_indoors, dict):
-                        return first_indoors.get("secondCycle", {})
-        return None
+        return self._coordinator.get_installation_snapshot().heating_status
 
     @property
-    def state(self):
-        """Return the current state of the sensor."""
-        heating_status = self._get_heating_status()
-        if not heating_status:
+    def native_value(self):
+        """Return the current value of the sensor."""
+        snapshot = self._coordinator.get_installation_snapshot()
+        if not snapshot.heating_status or self._value_fn is None:
             return None
-
-        # Primary compressor metrics
-        if self._key == "compressor_frequency":
-            return heating_status.get("ouHz")
-
-        if self._key == "compressor_current":
-            return heating_status.get("ouCurrent")
-
-        if self._key == "compressor_capacity":
-            return heating_status.get("unitCapacity")
-
-        # Temperatures
-        if self._key == "discharge_temperature":
-            return _convert_unsigned_to_signed_byte(
-                heating_status.get("ouDischargeTemperature")
-            )
-
-        if self._key == "evaporator_temperature":
-            return _convert_unsigned_to_signed_byte(
-                heating_status.get("ouEvapTemperature")
-            )
-
-        if self._key == "outdoor_ambient_temperature":
-            return _convert_unsigned_to_signed_byte(
-                heating_status.get("ouAmbientTemperature")
-            )
-
-        # Pressures
-        if self._key == "discharge_pressure":
-            value = heating_status.get("ouDischargePress")
-            # Pressure conversion if needed (assuming value is already in bar)
-            return value
-
-        if self._key == "suction_pressure":
-            value = heating_status.get("ouSuctionPress")
-            # Pressure conversion if needed (assuming value is already in bar)
-            return value
-
-        if self._key == "suction_pressure_correction":
-            return heating_status.get("ouSuctionPressCorrection")
-
-        # Expansion valve and control
-        if self._key == "expansion_valve_opening":
-            # evi is the expansion valve opening (0-100%)
-            return heating_status.get("evi")
-
-        if self._key == "outdoor_fan_rpm":
-            value = heating_status.get("fanRPM")
-            # -1 indicates no data or unavailable
-            return value if value != -1 else None
-
-        # Outdoor unit information
-        if self._key == "operation_status":
-            value = heating_status.get("operationStatus")
-            if value is None:
-                return None
-            return OPERATION_STATUS_MAP.get(value, f"Unknown ({value})")
-
-        if self._key == "system_status_flags":
-            # Return as hex string for easier interpretation
-            value = heating_status.get("systemStatus2Flags")
-            return f"0x{value:04X}" if value is not None else None
-
-        if self._key == "ou_code":
-            value = heating_status.get("ouCode")
-            # Outdoor unit codes
-            ou_code_map = {
-                0: "Unknown",
-                1: "RAS-1",
-                2: "RAS-2",
-                3: "Yutaki",
-                4: "RAD",
-            }
-            return ou_code_map.get(value, f"Code {value}")
-
-        if self._key == "ou_capacity_code":
-            return heating_status.get("ouCapacityCode")
-
-        if self._key == "ou_pcb_software":
-            value = heating_status.get("ouPcbSoft")
-            # -1 indicates no data
-            return value if value != -1 else None
-
-        # Secondary cycle sensors
-        second_cycle = self._get_second_cycle()
-        if not second_cycle:
+        if (
+            self.entity_description.key.startswith("secondary_")
+            and not snapshot.second_cycle
+        ):
             # If no secondary cycle data, return None
-            if self._key.startswith("secondary_"):
-                return None
-        else:
-            if self._key == "secondary_discharge_temp":
-                # 0°C is a valid temperature reading, don't filter it out
-                return _convert_unsigned_to_signed_byte(
-                    second_cycle.get("dischargeTemp")
-                )
-
-            if self._key == "secondary_suction_temp":
-                return _convert_unsigned_to_signed_byte(second_cycle.get("suctionTemp"))
-
-            if self._key == "secondary_discharge_pressure":
-                value = second_cycle.get("dischargePressure")
-                # 127 seems to be a default/invalid value
-                return value if value != 127 else None
-
-            if self._key == "secondary_suction_pressure":
-                value = second_cycle.get("suctionPressure")
-                # 127 seems to be a default/invalid value
-                return value if value != 127 else None
-
-            if self._key == "secondary_compressor_frequency":
-                return second_cycle.get("compressorFreq")
-
-            if self._key == "secondary_expansion_valve":
-                value = second_cycle.get("expansionValve")
-                # 255 seems to be a default/invalid value
-                return value if value != 255 else None
-
-            if self._key == "secondary_compressor_current":
-                return second_cycle.get("compressorCurrent")
-
-            if self._key == "secondary_current":
-                return second_cycle.get("secondaryCurrent")
-
-            if self._key == "secondary_superheat":
-                return second_cycle.get("teSH")
-
-            if self._key == "secondary_stop_code":
-                value = second_cycle.get("stopCode")
-                return value if value != 0 else "Running"
-
-            if self._key == "secondary_retry_code":
-                value = second_cycle.get("retryCode")
-                return value if value != 0 else "Normal"
-
-        return None
-
-    @property
-    def device_class(self):
-        """Return the device class of the sensor."""
-        return self._device_class
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement for the sensor."""
-        return self._unit
+            return None
+        return self._value_fn(snapshot)
 
     @property
     def extra_state_attributes(self):
         """Return additional attributes for certain sensors."""
-        if self._key == "system_status_flags":
+        if self.entity_description.key == "system_status_flags":
             heating_status = self._get_heating_status()
             if heating_status:
                 flags = heating_status.get("systemStatus2Flags", 0)
@@ -2137,7 +1606,7 @@ class CSNetHomeCompressorSensor(CoordinatorEntity, Entity):
                     "c2_thermostat": bool(flags & 0x80),
                 }
 
-        if self._key == "operation_status":
+        if self.entity_description.key == "operation_status":
             heating_status = self._get_heating_status()
             if heating_status:
                 raw_value = heating_status.get("operationStatus")
@@ -2199,4 +1668,4 @@ class CSNetHomeCompressorSensor(CoordinatorEntity, Entity):
     @property
     def unique_id(self) -> str:
         """Return unique id."""
-        return f"{DOMAIN}-compressor-{self._key}"
+        return f"{DOMAIN}-compressor-{self.entity_description.key}"
@@ -10,7 +10,9 @@ from homeassistant.components.water_heater import (
     WaterHeaterEntityFeature,
 )
 from homeassistant.const import PRECISION_WHOLE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     CONF_MAX_TEMP_OVERRIDE,
@@ -20,6 +22,9 @@ from .const import (
     WATER_HEATER_MAX_TEMPERATURE,
     WATER_HEATER_MIN_TEMPERATURE,
 )
+from .coordinator import TOPIC_HEATING_STATUS, TOPIC_INSTALLATION, sensor_key
+from .helpers import reported_setting_temperature
+from .models import replace_zone
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,11 +61,17 @@ async def async_setup_entry(hass, entry, async_add_entities):
     )
 
 
-class CSNetHomeWaterHeater(WaterHeaterEntity):
+class CSNetHomeWaterHeater(CoordinatorEntity, WaterHeaterEntity):
     """Representation of a Water Heater entity."""
 
     def __init__(self, hass, entry, sensor_data, common_data):
         """Initialize the water heater entity."""
+        self._sensor_key = sensor_key(sensor_data)
+        # The zone record, plus the installation data used for the DHW limits
+        super().__init__(
+            hass.data[DOMAIN][entry.entry_id]["coordinator"],
+            frozenset({self._sensor_key, TOPIC_INSTALLATION, TOPIC_HEATING_STATUS}),
+        )
         self.hass = hass
         self.entry = entry
         self._sensor_data = sensor_data
@@ -154,26 +165,23 @@ class CSNetHomeWaterHeater(WaterHeaterEntity):
         """Return current operation ie. eco, performance."""
         return self._attr_current_operation
 
-    async def async_update(self):
-        """Fetch new state data from the coordinator."""
-        coordinator = self.hass.data[DOMAIN][self.entry.entry_id]["coordinator"]
-        sensors_data = coordinator.get_sensors_data()
-
-        expected_zone_id = 4 if self._is_swimming_pool else 3
-        for sensor in sensors_data:
-            if (
-                sensor.get("zone_id") == expected_zone_id
-                and sensor.get("room_name") == self._attr_name
-            ):
-                self._sensor_data = sensor
-                self._update_attributes()
-                entity_type = (
-                    "swimming pool" if self._is_swimming_pool else "water heater"
-                )
-                _LOGGER.debug("Updated %s data: %s", entity_type, self._attr_name)
-                return
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the entity with the data pushed by the coordinator."""
+        self._update_from_coordinator()
+        self.async_write_ha_state()
+
+    def _update_from_coordinator(self) -> None:
+        """Read the zone record of the entity from the coordinator."""
+        sensor = self.coordinator.get_sensor(self._sensor_key)
 
         entity_type = "swimming pool" if self._is_swimming_pool else "water heater"
+        if sensor is not None:
+            self._sensor_data = sensor
+            self._update_attributes()
+            _LOGGER.debug("Updated %s data: %s", entity_type, self._attr_name)
+            return
+
         _LOGGER.warning(
             "No updated data found for %s: %s", entity_type, self._attr_name
         )
@@ -247,8 +255,16 @@ class CSNetHomeWaterHeater(WaterHeaterEntity):
             temperature=temperature,
         )
         if response:
-            self._sensor_data["setting_temperature"] = temperature
-            self._attr_target_temperature = temperature
+            # Hold the setpoint in the form the cloud will report it
+            expected = {
+                "setting_temperature": reported_setting_temperature(
+                    self._sensor_data["zone_id"], temperature
+                )
+            }
+            self._sensor_data = replace_zone(self._sensor_data, expected)
+            self._attr_target_temperature = expected["setting_temperature"]
+            self.async_write_ha_state()
+            self.coordinator.async_expect_fields(self._sensor_key, expected)
             _LOGGER.info("Set water heater target temperature to %s°C", temperature)
         else:
             _LOGGER.error("Failed to set water heater temperature.")
@@ -262,14 +278,19 @@ class CSNetHomeWaterHeater(WaterHeaterEntity):
         )
         if response:
             if operation_mode == "off":
-                self._sensor_data["on_off"] = 0
-                self._attr_operation_mode = operation_mode
+                changes = {"on_off": 0}
             else:
-                self._sensor_data["on_off"] = 1
+                changes = {"on_off": 1}
                 if not self._is_swimming_pool:
                     # Only water heaters have doingBoost
-                    self._sensor_data["doingBoost"] = operation_mode == "performance"
-                self._attr_operation_mode = operation_mode
+                    changes["doingBoost"] = operation_mode == "performance"
+            self._sensor_data = replace_zone(self._sensor_data, changes)
+            self._attr_operation_mode = operation_mode
+            self._update_attributes()
+            self.async_write_ha_state()
+            self.coordinator.async_expect_fields(
+                self._sensor_key, {"on_off": self._sensor_data["on_off"]}
+            )
 
             entity_type = "swimming pool" if self._is_swimming_pool else "water heater"
             _LOGGER.info("Set %s operation : %s", entity_type, operation_mode)
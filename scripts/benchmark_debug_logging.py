@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the payload debug logging done on every poll.
+
+Replays the ``_LOGGER.debug`` calls of one refresh (elements data, sensors,
+data elements, installation devices and alarms) with the logger at INFO
+level, once with the former eager ``redact_data()`` arguments and once with
+the ``LazyRedact`` wrappers, and reports the peak memory allocated and the time
+spent per poll.
+
+Run from the repository root with the development dependencies installed:
+
+    python scripts/benchmark_debug_logging.py
+"""
+
+import json
+import logging
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from custom_components.csnet_home.api import LazyRedact, redact_data  # noqa: E402
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures", "api_responses")
+NUMBER = 20_000
+
+_LOGGER = logging.getLogger("custom_components.csnet_home.api")
+
+
+def load(name):
+    """Load an API response fixture."""
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as file:
+        return json.load(file)
+
+
+ELEMENTS = load("elements_with_swp.json")
+# The parsed sensors are about as large as the elements they come from
+SENSORS = ELEMENTS["data"]["elements"]
+DATA_ELEMENTS = {"common_data": {"name": "My Home"}, "sensors": SENSORS}
+INSTALLATION_DEVICES = load("installation_devices.json")
+ALARMS = load("installation_alarms.json")
+
+
+def eager_poll():
+    """Log the payloads of one poll the way the fetchers used to."""
+    _LOGGER.debug("Sensor data retrieved: %s", redact_data(ELEMENTS["data"]))
+    _LOGGER.debug("Retrieved Sensors: %s", redact_data(SENSORS))
+    _LOGGER.debug("Retrieved Data Elements: %s", redact_data(DATA_ELEMENTS))
+    _LOGGER.debug(
+        "Installation devices data retrieved: %s", redact_data(INSTALLATION_DEVICES)
+    )
+    _LOGGER.debug("Installation alarms data retrieved: %s", redact_data(ALARMS))
+
+
+def lazy_poll():
+    """Log the payloads of one poll with deferred redaction."""
+    _LOGGER.debug("Sensor data retrieved: %s", LazyRedact(ELEMENTS["data"]))
+    _LOGGER.debug("Retrieved Sensors: %s", LazyRedact(SENSORS))
+    _LOGGER.debug("Retrieved Data Elements: %s", LazyRedact(DATA_ELEMENTS))
+    _LOGGER.debug(
+        "Installation devices data retrieved: %s", LazyRedact(INSTALLATION_DEVICES)
+    )
+    _LOGGER.debug("Installation alarms data retrieved: %s", LazyRedact(ALARMS))
+
+
+def allocated_per_poll(poll):
+    """Return the peak memory traced while one poll runs."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    poll()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Print the per-poll cost of both logging styles at INFO level."""
+    logging.basicConfig(level=logging.INFO)
+    print(f"{'logging':<10}{'peak bytes':>12}{'time (us)':>12}")
+    results = {}
+    for name, poll in (("eager", eager_poll), ("lazy", lazy_poll)):
+        poll()
+        allocated = allocated_per_poll(poll)
+        seconds = timeit.timeit(poll, number=NUMBER) / NUMBER
+        results[name] = seconds
+        print(f"{name:<10}{allocated:>12}{seconds * 1e6:>12.2f}")
+    print(f"speedup: {results['eager'] / results['lazy']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Micro-benchmark of the installation sensor state lookup.
+
+Compares the per-call cost of the former ``CSNetHomeInstallationSensor.state``
+lookup (mapping rebuilt on every call, nested walk of data/indoors and a
+chain of key comparisons) with the accessor compiled once per sensor.
+
+Run from the repository root with the development dependencies installed:
+
+    python scripts/benchmark_installation_sensor.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.const import STATE_OFF, STATE_ON  # noqa: E402
+
+from custom_components.csnet_home.models import InstallationSnapshot  # noqa: E402
+from custom_components.csnet_home.sensor import (  # noqa: E402
+    compile_installation_accessor,
+)
+
+KEYS = ("water_flow", "water_pressure", "defrost", "out_water_temperature")
+NUMBER = 200_000
+
+INSTALLATION_DATA = {
+    "data": [
+        {
+            "indoors": [
+                {
+                    "heatingStatus": {
+                        "waterFlow": 15,
+                        "waterPressure": 224,
+                        "defrosting": 0,
+                        "waterOutletTemp": 35,
+                    }
+                }
+            ]
+        }
+    ]
+}
+
+
+def legacy_state(key, installation_data):
+    """Reproduce the lookup done by the state property before compilation."""
+    key_mappings = {
+        "pump_speed": ["pumpSpeed"],
+        "water_flow": ["waterFlow"],
+        "in_water_temperature": ["waterInletTemp"],
+        "out_water_temperature": ["waterOutletTemp"],
+        "out_water_temperature_3": ["waterOutlet3Temp"],
+        "set_water_temperature": ["waterTempSetting"],
+        "water_pressure": ["waterPressure"],
+        "defrost": ["defrosting"],
+        "mix_valve_position": ["mixingValveOpening"],
+        "external_temperature": ["outdoorAmbientTemp"],
+        "mean_external_temperature": ["outdoorAmbientAverageTemp"],
+        "gas_temperature": ["gasTemp"],
+        "liquid_temperature": ["liquidTemp"],
+        "central_config": ["centralConfig"],
+        "lcd_software_version": ["lcdSoft"],
+        "unit_model": ["unitModel"],
+        "bottom_dhw_temperature": ["bottomTempDHW"],
+        "top_dhw_temperature": ["topTempDHW"],
+        "heat_exchanger_water_outlet_temperature": ["waterOutletHPTemp"],
+    }
+    possible_keys = key_mappings.get(key, [key])
+    value = None
+    if isinstance(installation_data, dict):
+        for possible_key in possible_keys:
+            value = installation_data.get(possible_key)
+            if value is not None:
+                break
+        if value is None:
+            data_array = installation_data.get("data", [])
+            if isinstance(data_array, list) and len(data_array) > 0:
+                first_device = data_array[0]
+                if isinstance(first_device, dict):
+                    indoors_array = first_device.get("indoors", [])
+                    if isinstance(indoors_array, list) and len(indoors_array) > 0:
+                        first_indoors = indoors_array[0]
+                        if isinstance(first_indoors, dict):
+                            heating_status = first_indoors.get("heatingStatus", {})
+                            if isinstance(heating_status, dict):
+                                for possible_key in possible_keys:
+                                    value = heating_status.get(possible_key)
+                                    if value is not None:
+                                        break
+
+    if key == "defrost":
+        return STATE_ON if value == 1 else STATE_OFF
+    if key == "water_flow":
+        if isinstance(value, (int, float)):
+            return value / 10
+        return value
+    if key == "water_pressure":
+        if isinstance(value, (int, float)):
+            return value / 50
+        return value
+    if key in ["pump_speed", "mix_valve_position"]:
+        return value
+    # The decoders of the other sensors are only reached by their own keys,
+    # keep the comparisons a plain temperature sensor used to go through
+    if key == "unit_model":
+        return value
+    if key == "lcd_software_version":
+        return value
+    if key == "central_config":
+        return value
+    if key == "central_control_enabled":
+        return value
+    if key in ("cascade_slave_mode", "fan_coil_compatible"):
+        return value
+    if key in ("c1_thermostat_present", "c2_thermostat_present"):
+        return value
+    return value
+
+
+def main():
+    """Print the per-call cost of both lookups for a few sensors."""
+    snapshot = InstallationSnapshot.from_installation_devices(INSTALLATION_DATA)
+    print(f"{'sensor':<24}{'before (ns)':>14}{'after (ns)':>14}{'speedup':>10}")
+    for key in KEYS:
+        accessor = compile_installation_accessor(key)
+        assert accessor(snapshot) == legacy_state(key, INSTALLATION_DATA)
+        before = timeit.timeit(
+            lambda key=key: legacy_state(key, INSTALLATION_DATA), number=NUMBER
+        )
+        after = timeit.timeit(
+            lambda accessor=accessor: accessor(snapshot), number=NUMBER
+        )
+        print(
+            f"{key:<24}{before / NUMBER * 1e9:>14.0f}"
+            f"{after / NUMBER * 1e9:>14.0f}{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Tests for the alarm catalog."""
+
+from custom_components.csnet_home.alarms import NO_ALARM, AlarmCatalog
+
+TRANSLATIONS = {
+    "alarm_5": "Five",
+    "alarm_05": "Five padded",
+    "alarm_042": "Forty-two padded",
+    "alarm_0007": "Too much padding",
+    "alarm_abc": "Not a code",
+    "STR_ORIGIN_INVERTER": "Inverter",
+    "STR_ORIGIN_INDOOR": "Indoor Unit",
+}
+
+
+def test_alarm_catalog_message_precedence():
+    """Test that unpadded keys win and padded keys are used as fallback."""
+    catalog = AlarmCatalog(TRANSLATIONS)
+    assert catalog.lookup(5).message == "Five"
+    assert catalog.lookup(42).message == "Forty-two padded"
+    assert catalog.lookup(7).message is None
+
+
+def test_alarm_catalog_records():
+    """Test that records carry the formatted code and origin."""
+    catalog = AlarmCatalog(TRANSLATIONS)
+
+    record = catalog.lookup(0x0162)
+    assert record.formatted_code == "62"
+    assert record.origin == "Inverter"
+
+    record = catalog.lookup(10)
+    assert record.formatted_code == "10"
+    assert record.origin == "Indoor Unit"
+
+    assert catalog.lookup(99).origin == ""
+
+
+def test_alarm_catalog_no_alarm_and_memoization():
+    """Test the empty record and that records are built only once."""
+    catalog = AlarmCatalog(TRANSLATIONS)
+    assert catalog.lookup(None) is NO_ALARM
+    assert catalog.lookup(0) is NO_ALARM
+    assert catalog.lookup(5) is catalog.lookup(5)
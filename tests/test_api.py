@@ -1,21 +1,45 @@
 """Test API module to check contracts."""
 
 import asyncio
-from unittest.mock import ANY, AsyncMock, patch
+import json
+import time
+from functools import partial
+from unittest.mock import (
+    ANY,
+    AsyncMock,
+    MagicMock,
+    PropertyMock,
+    create_autospec,
+    patch,
+)
 
 import pytest
-from aiohttp import CookieJar
+from aiohttp import ClientSession, CookieJar
+from yarl import URL
 
 from custom_components.csnet_home.api import CSNetHomeAPI
+from custom_components.csnet_home.const import (
+    VALIDATED_SESSION_MAX_AGE,
+    VALIDATED_SESSIONS,
+)
+from custom_components.csnet_home.models import ZoneState
 
 
 @pytest.fixture
 def mock_aiohttp_client():
-    """Mock the aiohttp ClientSession."""
-    with patch("aiohttp.ClientSession", autospec=True) as mock:
+    """Mock the client session created for the API."""
+    with patch("custom_components.csnet_home.api.async_create_clientsession") as mock:
+        mock.return_value = create_autospec(ClientSession, instance=True)
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def no_command_debounce():
+    """Send heat_setting commands without waiting for the debounce window."""
+    with patch("custom_components.csnet_home.api.COMMAND_DEBOUNCE_DELAY", 0):
+        yield
+
+
 @pytest.mark.asyncio
 async def test_api_initialization(hass):
     """Test initializing the CSNetHomeAPI."""
@@ -111,11 +135,14 @@ async def test_login_error(mock_aiohttp_client, hass):
 @pytest.mark.asyncio
 async def test_validate_credentials_success(hass):
     """Test successful credential validation."""
-    with patch.object(
-        CSNetHomeAPI, "async_login", return_value=True
-    ) as mock_login, patch("aiohttp.ClientSession") as mock_session:
+    with (
+        patch.object(CSNetHomeAPI, "async_login", return_value=True) as mock_login,
+        patch(
+            "custom_components.csnet_home.api.async_create_clientsession"
+        ) as mock_session,
+    ):
         mock_session_instance = mock_session.return_value
-        mock_session_instance.close = AsyncMock()
+        mock_session_instance.detach = MagicMock()
 
         result = await CSNetHomeAPI.async_validate_credentials(
             hass, "valid_user", "valid_pass"
@@ -124,17 +151,22 @@ async def test_validate_credentials_success(hass):
         assert result is True
         mock_login.assert_called_once()
         # Verify session was cleaned up
-        mock_session_instance.close.assert_called_once()
+        mock_session_instance.detach.assert_called_once()
+        # The login is kept for the entry set up next
+        assert "valid_user" in hass.data[VALIDATED_SESSIONS]
 
 
 @pytest.mark.asyncio
 async def test_validate_credentials_failure(hass):
     """Test failed credential validation."""
-    with patch.object(
-        CSNetHomeAPI, "async_login", return_value=False
-    ) as mock_login, patch("aiohttp.ClientSession") as mock_session:
+    with (
+        patch.object(CSNetHomeAPI, "async_login", return_value=False) as mock_login,
+        patch(
+            "custom_components.csnet_home.api.async_create_clientsession"
+        ) as mock_session,
+    ):
         mock_session_instance = mock_session.return_value
-        mock_session_instance.close = AsyncMock()
+        mock_session_instance.detach = MagicMock()
 
         result = await CSNetHomeAPI.async_validate_credentials(
             hass, "invalid_user", "invalid_pass"
@@ -143,17 +175,23 @@ async def test_validate_credentials_failure(hass):
         assert result is False
         mock_login.assert_called_once()
         # Verify session was still cleaned up even on failure
-        mock_session_instance.close.assert_called_once()
+        mock_session_instance.detach.assert_called_once()
+        assert "invalid_user" not in hass.data.get(VALIDATED_SESSIONS, {})
 
 
 @pytest.mark.asyncio
 async def test_validate_credentials_exception(hass):
     """Test credential validation with exception during login."""
-    with patch.object(
-        CSNetHomeAPI, "async_login", side_effect=Exception("Connection error")
-    ) as mock_login, patch("aiohttp.ClientSession") as mock_session:
+    with (
+        patch.object(
+            CSNetHomeAPI, "async_login", side_effect=Exception("Connection error")
+        ) as mock_login,
+        patch(
+            "custom_components.csnet_home.api.async_create_clientsession"
+        ) as mock_session,
+    ):
         mock_session_instance = mock_session.return_value
-        mock_session_instance.close = AsyncMock()
+        mock_session_instance.detach = MagicMock()
 
         result = await CSNetHomeAPI.async_validate_credentials(
             hass, "test_user", "test_pass"
@@ -162,18 +200,21 @@ async def test_validate_credentials_exception(hass):
         assert result is False
         mock_login.assert_called_once()
         # Verify session cleanup was attempted despite exception
-        mock_session_instance.close.assert_called_once()
+        mock_session_instance.detach.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_validate_credentials_cleanup_failure(hass):
     """Test credential validation when session cleanup fails."""
-    with patch.object(
-        CSNetHomeAPI, "async_login", return_value=True
-    ) as mock_login, patch("aiohttp.ClientSession") as mock_session:
+    with (
+        patch.object(CSNetHomeAPI, "async_login", return_value=True) as mock_login,
+        patch(
+            "custom_components.csnet_home.api.async_create_clientsession"
+        ) as mock_session,
+    ):
         mock_session_instance = mock_session.return_value
         # Simulate session close failure
-        mock_session_instance.close = AsyncMock(side_effect=Exception("Close failed"))
+        mock_session_instance.detach = MagicMock(side_effect=Exception("Close failed"))
 
         # Should still return the validation result despite cleanup error
         result = await CSNetHomeAPI.async_validate_credentials(
@@ -182,7 +223,7 @@ async def test_validate_credentials_cleanup_failure(hass):
 
         assert result is True
         mock_login.assert_called_once()
-        mock_session_instance.close.assert_called_once()
+        mock_session_instance.detach.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -637,7 +678,9 @@ async def test_api_close_session(mock_aiohttp_client, hass):
     api.session = mock_client_instance
 
     await api.close()
-    mock_client_instance.close.assert_called_once()
+    # The shared connector of Home Assistant must stay open
+    mock_client_instance.detach.assert_called_once()
+    mock_client_instance.close.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -2385,6 +2428,7 @@ async def test_async_set_temperature_swp(mock_aiohttp_client, hass):
 
     api = CSNetHomeAPI(hass, "user", "pass")
     api.session = mock_client_instance
+    api.logged_in = True
     api.xsrf_token = "test_token"
 
     result = await api.async_set_temperature(4, 1706, 1, temperature=28)
@@ -2409,6 +2453,7 @@ async def test_set_water_heater_mode_swp_on(mock_aiohttp_client, hass):
 
     api = CSNetHomeAPI(hass, "user", "pass")
     api.session = mock_client_instance
+    api.logged_in = True
     api.xsrf_token = "test_token"
 
     result = await api.set_water_heater_mode(4, 1706, "on")
@@ -2434,6 +2479,7 @@ async def test_set_water_heater_mode_swp_off(mock_aiohttp_client, hass):
 
     api = CSNetHomeAPI(hass, "user", "pass")
     api.session = mock_client_instance
+    api.logged_in = True
     api.xsrf_token = "test_token"
 
     result = await api.set_water_heater_mode(4, 1706, "off")
@@ -2488,3 +2534,530 @@ async def test_async_get_elements_data_with_swp(
     assert climate_sensor is not None
     assert climate_sensor["room_name"] == "Living Room"
     assert climate_sensor["unit_type"] == "standard"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_login(hass):
+    """Test that concurrent callers without a session trigger a single login."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+
+    async def fake_login():
+        await asyncio.sleep(0.01)
+        api.session = AsyncMock()
+        api.logged_in = True
+        return True
+
+    with patch.object(api, "async_login", side_effect=fake_login) as mock_login:
+        results = await asyncio.gather(
+            api._async_ensure_session(),
+            api._async_ensure_session(),
+            api._async_ensure_session(),
+        )
+
+    assert mock_login.call_count == 1
+    assert api.login_count == 1
+    assert api.login_coalesced_count == 2
+    assert results == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_request_retried_once_after_session_loss(hass):
+    """Test that a request failing on an expired session is retried after login."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session = AsyncMock()
+    api.logged_in = True
+
+    responses = [None, {"data": "fresh"}]
+
+    async def fetch():
+        data = responses.pop(0)
+        if data is None:
+            api.logged_in = False
+        return data
+
+    async def fake_login():
+        api.logged_in = True
+        return True
+
+    with patch.object(api, "async_login", side_effect=fake_login) as mock_login:
+        result = await api._async_call_with_login(fetch)
+
+    assert result == {"data": "fresh"}
+    assert mock_login.call_count == 1
+    assert api.login_count == 1
+
+
+@pytest.mark.asyncio
+async def test_request_not_retried_when_login_fails(hass):
+    """Test that a failed re-login does not retry the original request."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session = AsyncMock()
+    api.logged_in = True
+    fetch = AsyncMock(return_value=None)
+
+    async def failing_fetch():
+        api.logged_in = False
+        return await fetch()
+
+    with patch.object(api, "async_login", AsyncMock(return_value=False)):
+        result = await api._async_call_with_login(failing_fetch)
+
+    assert result is None
+    fetch.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_restore_session_from_store(hass):
+    """Test that a stored session is restored without logging in."""
+    store = AsyncMock()
+    store.async_load.return_value = {
+        "username": "user",
+        "xsrf_token": "stored-token",
+        "cookies": {"SESSION": "abc", "XSRF-TOKEN": "stored-token"},
+    }
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session_store = store
+
+    with patch.object(api, "async_login") as mock_login:
+        assert await api.async_restore_session() is True
+        generation = await api._async_ensure_session()
+
+    mock_login.assert_not_called()
+    assert generation == 0
+    assert api.logged_in is True
+    assert api.xsrf_token == "stored-token"
+    cookies = {cookie.key: cookie.value for cookie in api.session.cookie_jar}
+    assert cookies == {"SESSION": "abc", "XSRF-TOKEN": "stored-token"}
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_restore_session_ignores_other_user(hass):
+    """Test that a session stored for another account is not reused."""
+    store = AsyncMock()
+    store.async_load.return_value = {
+        "username": "someone-else",
+        "xsrf_token": "stored-token",
+        "cookies": {"SESSION": "abc"},
+    }
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session_store = store
+
+    assert await api.async_restore_session() is False
+    assert api.logged_in is False
+    assert api.session is None
+
+
+@pytest.mark.asyncio
+async def test_restore_session_reuses_validated_login(hass):
+    """Test that the login of the config flow is reused by the entry setup."""
+    hass.data[VALIDATED_SESSIONS] = {
+        "user": {
+            "username": "user",
+            "xsrf_token": "flow-token",
+            "cookies": {"SESSION": "flow"},
+            "validated_at": time.monotonic(),
+        }
+    }
+    store = AsyncMock()
+    store.async_load.return_value = {
+        "username": "user",
+        "xsrf_token": "stored-token",
+        "cookies": {"SESSION": "abc"},
+    }
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session_store = store
+
+    with patch.object(api, "async_login") as mock_login:
+        assert await api.async_restore_session() is True
+
+    mock_login.assert_not_called()
+    store.async_load.assert_not_called()
+    store.async_save.assert_awaited_once_with(
+        {"username": "user", "xsrf_token": "flow-token", "cookies": {"SESSION": "flow"}}
+    )
+    assert api.logged_in is True
+    assert api.xsrf_token == "flow-token"
+    assert hass.data[VALIDATED_SESSIONS] == {}
+    await api.close()
+
+
+@pytest.mark.asyncio
+async def test_restore_session_ignores_old_validated_login(hass):
+    """Test that a validated login past its freshness window is dropped."""
+    hass.data[VALIDATED_SESSIONS] = {
+        "user": {
+            "username": "user",
+            "xsrf_token": "flow-token",
+            "cookies": {"SESSION": "flow"},
+            "validated_at": time.monotonic() - VALIDATED_SESSION_MAX_AGE - 1,
+        }
+    }
+    store = AsyncMock()
+    store.async_load.return_value = None
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session_store = store
+
+    assert await api.async_restore_session() is False
+    assert api.logged_in is False
+    assert hass.data[VALIDATED_SESSIONS] == {}
+
+
+@pytest.mark.asyncio
+async def test_login_persists_session(hass):
+    """Test that a successful login saves cookies and XSRF token."""
+    store = AsyncMock()
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session_store = store
+    api.session = MagicMock()
+    api.session.cookie_jar = CookieJar()
+    api.session.cookie_jar.update_cookies(
+        {"SESSION": "abc"}, URL("https://www.csnetmanager.com")
+    )
+
+    async def fake_login():
+        api.logged_in = True
+        api.xsrf_token = "new-token"
+        return True
+
+    with patch.object(api, "async_login", side_effect=fake_login):
+        assert await api._async_relogin(0) is True
+
+    store.async_save.assert_awaited_once_with(
+        {"username": "user", "xsrf_token": "new-token", "cookies": {"SESSION": "abc"}}
+    )
+
+
+def _translation_response(status, data=None, etag=None):
+    """Build a mocked translation file response usable as a context manager."""
+    response = MagicMock()
+    response.status = status
+    response.headers = {"ETag": etag} if etag else {}
+    response.json = AsyncMock(return_value=data)
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_load_translations_uses_cache_and_revalidates(hass):
+    """Test that cached bundles apply at once and a 304 keeps them."""
+    store = AsyncMock()
+    store.async_load.return_value = {
+        "bundles": {
+            "en": {"etag": '"en-1"', "last_modified": None, "data": {"a": "A"}},
+            "fr": {"etag": '"fr-1"', "last_modified": None, "data": {"a": "Fr"}},
+            "es": {"etag": '"es-1"', "last_modified": None, "data": {"a": "Es"}},
+        }
+    }
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.preferred_language = "fr"
+    api.translations_store = store
+    api.translations_listener = MagicMock()
+    api.session = MagicMock()
+    api.session.closed = False
+    api.session.get = MagicMock(return_value=_translation_response(304))
+
+    await api.load_translations()
+    assert api.translations == {"a": "Fr"}
+
+    await api._translations_task
+    assert api.session.get.call_count == 2
+    headers = [call.kwargs["headers"] for call in api.session.get.call_args_list]
+    assert {h["if-none-match"] for h in headers} == {'"en-1"', '"fr-1"'}
+    store.async_save.assert_not_called()
+    api.translations_listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_translations_saves_changed_bundles(hass):
+    """Test that downloaded bundles are cached and listeners notified."""
+    store = AsyncMock()
+    store.async_load.return_value = None
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.preferred_language = "es"
+    api.translations_store = store
+    api.translations_listener = MagicMock()
+    api.session = MagicMock()
+    api.session.closed = False
+
+    def get(url, headers):
+        if url.endswith("english.json"):
+            return _translation_response(200, {"a": "A", "b": "B"}, '"en-2"')
+        return _translation_response(200, {"a": "Es"}, '"es-2"')
+
+    api.session.get = MagicMock(side_effect=get)
+
+    await api.load_translations()
+    assert api.translations == {}
+    await api._translations_task
+
+    assert api.translations == {"a": "Es", "b": "B"}
+    api.translations_listener.assert_called_once()
+    saved = store.async_save.call_args.args[0]["bundles"]
+    assert set(saved) == {"en", "es"}
+    assert saved["es"] == {"etag": '"es-2"', "last_modified": None, "data": {"a": "Es"}}
+
+
+@pytest.mark.asyncio
+async def test_load_translations_retries_after_failed_download(hass):
+    """Test that a failed download without cache is retried on the next call."""
+    store = AsyncMock()
+    store.async_load.return_value = None
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.translations_store = store
+    api.session = MagicMock()
+    api.session.closed = False
+    api.session.get = MagicMock(return_value=_translation_response(500))
+
+    await api.load_translations()
+    await api._translations_task
+    assert api.translations == {}
+
+    # A call while the retry runs does not start another download
+    api.session.get = MagicMock(
+        return_value=_translation_response(200, {"a": "A"}, '"en-1"')
+    )
+    await api.load_translations()
+    await api.load_translations()
+    await api._translations_task
+    assert api.session.get.call_count == 1
+    assert api.translations == {"a": "A"}
+
+
+def test_alarm_catalog_follows_translations(hass):
+    """Test that the alarm catalog is rebuilt when translations are replaced."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.translations = {"alarm_42": "Old message"}
+    catalog = api.alarm_catalog
+    assert api.alarm_catalog is catalog
+    assert api.translate_alarm(42) == "Old message"
+
+    api.translations = {"alarm_42": "New message"}
+    assert api.alarm_catalog is not catalog
+    assert api.translate_alarm(42) == "New message"
+
+
+@pytest.mark.asyncio
+async def test_heat_setting_commands_are_coalesced(mock_aiohttp_client, hass):
+    """Send the commands of one indoor unit issued together as a single POST."""
+    mock_client_instance = mock_aiohttp_client.return_value
+
+    mock_response = mock_client_instance.post.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.text = AsyncMock(return_value="OK")
+    mock_response.raise_for_status = MagicMock()
+
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session = mock_client_instance
+    api.logged_in = True
+    api.xsrf_token = "test-token"
+
+    results = await asyncio.gather(
+        api.async_set_hvac_mode(1, 1706, "heat"),
+        api.set_preset_modes(1, 1706, "eco", current_mode=0, on_off=1),
+        api.async_set_temperature(1, 1706, 1, temperature=21.5),
+        api.async_set_temperature(1, 1706, 1, temperature=22),
+    )
+
+    assert results == [True, True, True, True]
+    mock_client_instance.post.assert_called_once()
+    data = mock_client_instance.post.call_args[1]["data"]
+    assert data["indoorId"] == 1706
+    assert data["_csrf"] == "test-token"
+    assert data["runStopC1Air"] == "1"
+    assert data["ecoModeC1"] == "0"
+    # Conflicting fields keep the value of the last writer
+    assert data["mode"] == "0"
+    assert data["settingTempRoomZ1"] == "220"
+    assert api.heat_settings.queued_count == 4
+    assert api.heat_settings.sent_count == 1
+
+    # Another indoor unit gets its own form
+    await asyncio.gather(
+        api.async_set_silent_mode(1, 1706, True),
+        api.async_set_silent_mode(1, 2486, True),
+    )
+    assert mock_client_instance.post.call_count == 3
+
+
+def _response(status=200, content_type="application/json", path="/data", **kwargs):
+    """Build a response context manager for session.get/post side effects."""
+    response = MagicMock(status=status, content_type=content_type, **kwargs)
+    response.url = URL(f"https://www.csnetmanager.com{path}")
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context, response
+
+
+@pytest.mark.asyncio
+async def test_expired_session_relogs_and_retries_in_same_poll(hass):
+    """Log in again and retry when the login page answers a data request."""
+    expired, login_page = _response(
+        content_type="text/html", text=AsyncMock(), json=AsyncMock()
+    )
+    fresh, _ = _response(json=AsyncMock(return_value={"data": "fresh"}))
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session = MagicMock()
+    api.session.get.side_effect = [expired, fresh]
+    api.logged_in = True
+
+    async def fake_login():
+        api.logged_in = True
+        return True
+
+    with patch.object(api, "async_login", side_effect=fake_login) as mock_login:
+        data = await api.async_get_installation_devices_data()
+
+    assert data == {"data": "fresh"}
+    assert mock_login.call_count == 1
+    # The login page is recognised without reading its body
+    login_page.text.assert_not_awaited()
+    login_page.json.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    ("status", "content_type", "path", "json_expected", "expired"),
+    [
+        (200, "application/json", "/data/elements", True, False),
+        (200, "text/html", "/data/elements", True, True),
+        (200, "text/html", "/data/indoor/heat_setting", False, False),
+        (200, "text/html", "/login", False, True),
+        (401, "application/json", "/data/elements", True, True),
+        (403, "text/html", "/data/indoor/heat_setting", False, True),
+        (500, "text/html", "/data/elements", True, False),
+    ],
+)
+def test_session_expired(status, content_type, path, json_expected, expired):
+    """Recognise an expired session from the status, URL and content type."""
+    _, response = _response(status, content_type, path)
+    assert CSNetHomeAPI.session_expired(response, json_expected) is expired
+
+
+@pytest.mark.asyncio
+async def test_heat_settings_resent_after_login_redirect(hass):
+    """Send a command again once the session redirected it to the login page."""
+    redirected, _ = _response(content_type="text/html", path="/login")
+    accepted, _ = _response(
+        content_type="text/html",
+        path="/data/indoor/heat_setting",
+        text=AsyncMock(return_value="OK"),
+    )
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.session = MagicMock()
+    api.session.post.side_effect = [redirected, accepted]
+    api.logged_in = True
+    api.xsrf_token = "old-token"
+
+    async def fake_login():
+        api.logged_in = True
+        api.xsrf_token = "new-token"
+        return True
+
+    with patch.object(api, "async_login", side_effect=fake_login):
+        assert await api.async_set_silent_mode(1, 1706, True) is True
+
+    assert api.session.post.call_count == 2
+    assert api.session.post.call_args[1]["data"]["_csrf"] == "new-token"
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_connector_with_own_cookies(hass):
+    """Run every entry on the pooled connector, each with its own cookies."""
+    first = CSNetHomeAPI(hass, "first", "pass")
+    second = CSNetHomeAPI(hass, "second", "pass")
+    first._ensure_client_session()
+    second._ensure_client_session()
+
+    assert first.session.connector is second.session.connector
+    assert first.session.cookie_jar is not second.session.cookie_jar
+
+    await first.close()
+    assert first.session.closed
+    # Detaching one session keeps the shared connector open for the others
+    assert not second.session.closed
+    assert not second.session.connector.closed
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_large_response_decoded_in_executor(hass, load_fixture):
+    """Decode and transform large responses off the event loop."""
+    fixture_data = load_fixture("api_responses/elements_two_zones.json")
+    body = json.dumps(fixture_data).encode()
+    api = CSNetHomeAPI(hass, "user", "pass")
+    transform = partial(api._parse_elements_data, alarm_catalog=api.alarm_catalog)
+
+    _, small = _response(json=AsyncMock(side_effect=lambda loads: loads(body)))
+    inline = await api.check_api_response(small, transform)
+    assert api.offloaded_decodes == 0
+    assert api.decode_metrics["last_loop_block_ms"] is not None
+
+    _, large = _response(
+        content_length=api.decode_offload_threshold + 1,
+        read=AsyncMock(return_value=body),
+        json=AsyncMock(),
+    )
+    with (
+        patch.object(
+            hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+        ) as executor_job,
+        patch.object(
+            CSNetHomeAPI, "alarm_catalog", new_callable=PropertyMock
+        ) as alarm_catalog,
+    ):
+        offloaded = await api.check_api_response(large, transform)
+
+    executor_job.assert_called_once()
+    # The worker thread uses the given catalog, it does not build one
+    alarm_catalog.assert_not_called()
+    large.json.assert_not_called()
+    assert api.offloaded_decodes == 1
+    assert offloaded == inline
+    assert isinstance(offloaded[1]["sensors"][0], ZoneState)
+
+
+@pytest.mark.asyncio
+async def test_large_non_json_response_is_rejected(hass):
+    """Treat a large body of the wrong content type as a decoding error."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+    api.logged_in = True
+    _, response = _response(
+        content_type="text/plain",
+        content_length=api.decode_offload_threshold + 1,
+        read=AsyncMock(),
+    )
+
+    assert await api.check_api_response(response) is None
+    response.read.assert_not_called()
+    assert api.logged_in is False
+
+
+@pytest.mark.asyncio
+async def test_unchanged_response_reuses_previous_result(hass):
+    """Skip decoding and transform when a body matches the previous one."""
+    api = CSNetHomeAPI(hass, "user", "pass")
+    transform = MagicMock(side_effect=lambda data: {"parsed": data})
+
+    def body_response(body):
+        return _response(json=AsyncMock(side_effect=lambda loads: loads(body)))[1]
+
+    first = await api.check_api_response(
+        body_response('{"a": 1}'), transform, "/data/elements"
+    )
+    second = await api.check_api_response(
+        body_response('{"a": 1}'), transform, "/data/elements"
+    )
+    other_endpoint = await api.check_api_response(
+        body_response('{"a": 1}'), transform, "/data/installationdevices"
+    )
+    changed = await api.check_api_response(
+        body_response('{"a": 2}'), transform, "/data/elements"
+    )
+
+    assert second is first
+    assert other_endpoint == first and other_endpoint is not first
+    assert changed == {"parsed": {"a": 2}}
+    assert transform.call_count == 3
+    assert api.decode_metrics["unchanged"] == 1
@@ -1,7 +1,7 @@
 """Test CSNet Home climate entity."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.climate import FAN_AUTO, FAN_ON, HVACAction, HVACMode
@@ -33,6 +33,17 @@ from custom_components.csnet_home.const import (
     OTC_HEATING_TYPE_NONE,
     OTC_HEATING_TYPE_POINTS,
 )
+from custom_components.csnet_home.coordinator import (
+    TOPIC_HEATING_STATUS,
+    TOPIC_INSTALLATION,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_write_ha_state():
+    """Entities are not added to a platform, so do not write their state."""
+    with patch.object(CSNetHomeClimate, "async_write_ha_state") as write_ha_state:
+        yield write_ha_state
 
 
 def build_entity(
@@ -107,7 +118,9 @@ def build_entity(
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
+        get_sensor=lambda key: sensor_data,
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
         async_request_refresh=AsyncMock(return_value=None),
@@ -215,6 +228,39 @@ async def test_set_temperature_updates_state_on_success(hass):
     entity = build_entity(hass, mode=1, on_off=1, setp=19.0)
     await entity.async_set_temperature(temperature=21.0)
     assert entity.target_temperature == 21.0
+    # Polling speeds up until the cloud reports the new setpoint
+    entity.coordinator.async_expect_fields.assert_called_once_with(
+        (1234, 1706, 1), {"setting_temperature": 21.0}
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_non_integral_temperature_expects_reported_value(hass):
+    """Expect the setpoint truncated to tenths like the room zone write."""
+    entity = build_entity(hass, mode=1, on_off=1, setp=19.0)
+    await entity.async_set_temperature(temperature=21.25)
+    assert entity.target_temperature == 21.2
+    entity.coordinator.async_expect_fields.assert_called_once_with(
+        (1234, 1706, 1), {"setting_temperature": 21.2}
+    )
+
+
+@pytest.mark.asyncio
+async def test_set_preset_mode_reads_back(hass):
+    """Hold the ecocomfort value that the read path maps to the preset."""
+    entity = build_entity(hass, mode=1, on_off=1, ecocomfort=1)
+    await entity.async_set_preset_mode("eco")
+    assert entity.preset_mode == "eco"
+    entity.coordinator.async_expect_fields.assert_called_once_with(
+        (1234, 1706, 1), {"ecocomfort": 0}
+    )
+
+    entity.coordinator.async_expect_fields.reset_mock()
+    await entity.async_set_preset_mode("comfort")
+    assert entity.preset_mode == "comfort"
+    entity.coordinator.async_expect_fields.assert_called_once_with(
+        (1234, 1706, 1), {"ecocomfort": 1}
+    )
 
 
 def test_unique_id_contains_device_id(hass):
@@ -229,12 +275,12 @@ async def test_async_update_handles_missing_sensor_data(hass):
     """Test that async_update handles when sensor data becomes None gracefully."""
     entity = build_entity(hass, mode=1, on_off=1, cur=19.5, setp=20.0)
 
-    # Modify coordinator to return empty list (simulating room not found)
+    # Modify coordinator to find no record (simulating room not found)
     coordinator = hass.data[DOMAIN][entity.entry.entry_id]["coordinator"]
-    coordinator.get_sensors_data = lambda: []
+    coordinator.get_sensor = lambda key: None
 
     # This should not raise TypeError even though sensor_data becomes None
-    await entity.async_update()
+    entity._handle_coordinator_update()
 
     # Verify entity handles None sensor_data gracefully
     assert entity.current_temperature is None
@@ -253,7 +299,7 @@ async def test_async_update_preserves_sensor_data_when_found(hass):
     entity = build_entity(hass, mode=1, on_off=1, cur=19.5, setp=20.0)
 
     # Update should preserve the sensor data
-    await entity.async_update()
+    entity._handle_coordinator_update()
 
     # Verify entity still has valid data
     assert entity.current_temperature == 19.5
@@ -978,6 +1024,7 @@ def test_otc_attributes_zone1_heating_fix(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
@@ -1051,6 +1098,7 @@ def test_otc_attributes_zone2_heating_gradient(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
@@ -1124,6 +1172,7 @@ def test_otc_attributes_zone5_water_circuit(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
@@ -1187,6 +1236,7 @@ def test_otc_attributes_no_installation_data(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: None,  # No installation data
@@ -1256,6 +1306,7 @@ def test_otc_attributes_zone3_dhw_no_otc(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
@@ -1328,6 +1379,7 @@ def test_device_info_with_missing_firmware(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: {},
@@ -1398,6 +1450,7 @@ def test_device_info_with_missing_sensor_data_keys(hass):
         get_temperature_limits=lambda zone_id, mode, data: (None, None),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: {},
@@ -1410,3 +1463,24 @@ def test_device_info_with_missing_sensor_data_keys(hass):
     # Should not raise KeyError, should use defaults
     assert device_info is not None
     assert device_info["name"] == "Unknown Device-Unknown Room"
+
+
+@pytest.mark.asyncio
+async def test_coordinator_push_updates(hass, mock_write_ha_state):
+    """Follow the coordinator instead of polling, and apply commands optimistically."""
+    entity = build_entity(hass, mode=1, on_off=1)
+
+    assert entity.should_poll is False
+    assert entity.coordinator_context == frozenset(
+        {(1234, 1706, 1), TOPIC_INSTALLATION, TOPIC_HEATING_STATUS}
+    )
+
+    await entity.async_set_hvac_mode(HVACMode.COOL)
+
+    assert entity.hvac_mode == HVACMode.COOL
+    mock_write_ha_state.assert_called_once()
+    coordinator = hass.data[DOMAIN][entity.entry.entry_id]["coordinator"]
+    coordinator.async_request_refresh.assert_not_awaited()
+
+    entity._handle_coordinator_update()
+    assert mock_write_ha_state.call_count == 2
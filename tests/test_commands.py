@@ -0,0 +1,210 @@
+"""Test the heat setting command executor."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from custom_components.csnet_home.commands import HeatSettingsExecutor
+
+
+@pytest.mark.asyncio
+async def test_commands_merged_per_indoor_unit():
+    """Merge the fields of one indoor unit, last writer winning."""
+    send = AsyncMock(return_value=True)
+    executor = HeatSettingsExecutor(send, 0.01, 10)
+
+    results = await asyncio.gather(
+        executor.async_submit(1706, {"mode": "1", "runStopC1Air": "1"}),
+        executor.async_submit(1706, {"mode": "0"}),
+        executor.async_submit(2486, {"ecoModeC1": "0"}),
+    )
+
+    assert results == [True, True, True]
+    assert send.await_count == 2
+    send.assert_any_await(1706, {"mode": "0", "runStopC1Air": "1"})
+    send.assert_any_await(2486, {"ecoModeC1": "0"})
+    assert executor.metrics["queued"] == 3
+    assert executor.metrics["sent"] == 2
+    assert executor.metrics["pending"] == 0
+    assert executor.metrics["last_latency_ms"] is not None
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_commands_for_two_zones_of_one_unit_sent_apart():
+    """Keep the form of each zone when two zones of a unit change together."""
+    send = AsyncMock(return_value=True)
+    executor = HeatSettingsExecutor(send, 0.01, 10)
+
+    results = await asyncio.gather(
+        executor.async_submit(
+            1706, {"id": "17061", "mode": "1", "settingTempRoomZ1": "210"}
+        ),
+        executor.async_submit(
+            1706, {"id": "17062", "mode": "0", "settingTempRoomZ2": "190"}
+        ),
+        executor.async_submit(1706, {"id": "17061", "settingTempRoomZ1": "215"}),
+    )
+
+    assert results == [True, True, True]
+    assert send.await_args_list == [
+        call(1706, {"id": "17061", "mode": "1", "settingTempRoomZ1": "210"}),
+        call(1706, {"id": "17062", "mode": "0", "settingTempRoomZ2": "190"}),
+        call(1706, {"id": "17061", "settingTempRoomZ1": "215"}),
+    ]
+    assert executor.superseded_count == 0
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_interleaved_zone_commands_keep_their_order():
+    """Send the unit mode of the newest command when zones interleave."""
+    send = AsyncMock(return_value=True)
+    executor = HeatSettingsExecutor(send, 0.01, 10)
+
+    await asyncio.gather(
+        executor.async_submit(1706, {"id": "11", "mode": "1"}),
+        executor.async_submit(1706, {"id": "11", "settingTempRoomZ1": "210"}),
+        executor.async_submit(1706, {"id": "12", "mode": "0"}),
+        executor.async_submit(1706, {"id": "11", "mode": "1"}),
+    )
+
+    assert send.await_args_list == [
+        call(1706, {"id": "11", "mode": "1", "settingTempRoomZ1": "210"}),
+        call(1706, {"id": "12", "mode": "0"}),
+        call(1706, {"id": "11", "mode": "1"}),
+    ]
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_newer_commands_supersede_queued_ones():
+    """Drop the values of a slider drag that were rewritten before being sent."""
+    send = AsyncMock(return_value=True)
+    executor = HeatSettingsExecutor(send, 0.01, 10)
+
+    results = await asyncio.gather(
+        *(
+            executor.async_submit(1706, {"settingTempRoomZ1": str(value)})
+            for value in (200, 205, 210, 215)
+        )
+    )
+
+    assert results == [True] * 4
+    send.assert_awaited_once_with(1706, {"settingTempRoomZ1": "215"})
+    assert executor.superseded_count == 3
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_commands_sent_in_order():
+    """Queue commands issued during a POST for the next one, in order."""
+    sent = []
+    release = asyncio.Event()
+
+    async def send(indoor_id, fields):
+        sent.append(fields)
+        await release.wait()
+        return True
+
+    executor = HeatSettingsExecutor(send, 0, 10)
+    first = asyncio.ensure_future(executor.async_submit(1706, {"mode": "1"}))
+    while not sent:
+        await asyncio.sleep(0)
+
+    # Issued while the first POST is in flight
+    second = asyncio.ensure_future(executor.async_submit(1706, {"mode": "0"}))
+    third = asyncio.ensure_future(executor.async_submit(1706, {"ecoModeC1": "1"}))
+    await asyncio.sleep(0)
+    assert len(sent) == 1
+
+    release.set()
+    assert await asyncio.gather(first, second, third) == [True, True, True]
+    assert sent == [{"mode": "1"}, {"mode": "0", "ecoModeC1": "1"}]
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure():
+    """Make callers wait while the queue of the indoor unit is full."""
+    release = asyncio.Event()
+
+    async def send(indoor_id, fields):
+        await release.wait()
+        return True
+
+    executor = HeatSettingsExecutor(send, 0, 1)
+    first = asyncio.ensure_future(executor.async_submit(1706, {"mode": "1"}))
+    await asyncio.sleep(0.01)
+    second = asyncio.ensure_future(executor.async_submit(1706, {"mode": "0"}))
+    third = asyncio.ensure_future(executor.async_submit(1706, {"mode": "2"}))
+    await asyncio.sleep(0.01)
+
+    # One command in flight, one queued, the third one waits for room
+    assert executor.metrics["pending"] == 1
+    assert executor.queued_count == 2
+
+    release.set()
+    assert await asyncio.gather(first, second, third) == [True, True, True]
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_send_error_propagated_to_every_caller():
+    """Raise the error of the shared write in each waiting command."""
+    send = AsyncMock(side_effect=RuntimeError("boom"))
+    executor = HeatSettingsExecutor(send, 0, 10)
+
+    results = await asyncio.gather(
+        executor.async_submit(1706, {"mode": "1"}),
+        executor.async_submit(1706, {"ecoModeC1": "0"}),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    send.assert_awaited_once()
+    await executor.async_cancel()
+
+
+@pytest.mark.asyncio
+async def test_send_error_of_cancelled_caller_is_retrieved():
+    """Do not log an unread error for a caller that stopped waiting."""
+    release = asyncio.Event()
+
+    async def send(indoor_id, fields):
+        await release.wait()
+        raise RuntimeError("boom")
+
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    executor = HeatSettingsExecutor(send, 0, 10)
+    caller = asyncio.ensure_future(executor.async_submit(1706, {"mode": "1"}))
+    await asyncio.sleep(0.01)
+    caller.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0.01)
+    await executor.async_cancel()
+    del caller
+    gc.collect()
+    loop.set_exception_handler(None)
+
+    assert errors == []
+
+
+@pytest.mark.asyncio
+async def test_cancel_pending_commands():
+    """Resolve the pending commands as failed when the API is closed."""
+    send = AsyncMock(return_value=True)
+    executor = HeatSettingsExecutor(send, 10, 10)
+
+    pending = asyncio.ensure_future(executor.async_submit(1706, {"mode": "1"}))
+    await asyncio.sleep(0)
+    await executor.async_cancel()
+
+    assert await pending is False
+    assert await executor.async_submit(1706, {"mode": "0"}) is False
+    send.assert_not_awaited()
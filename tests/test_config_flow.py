@@ -7,10 +7,14 @@ from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.csnet_home import _async_migrate_scan_interval
 from custom_components.csnet_home.const import (
+    CONF_ALARMS_INTERVAL,
     CONF_FAN_COIL_MODEL,
+    CONF_INSTALLATION_DEVICES_INTERVAL,
     CONF_LANGUAGE,
     CONF_MAX_TEMP_OVERRIDE,
+    CONF_STALE_GRACE_PERIOD,
     DOMAIN,
 )
 
@@ -63,14 +67,17 @@ async def test_config_flow_user_success(hass: HomeAssistant):
         assert result["title"] == "CSNet Home"
         assert result["data"][CONF_USERNAME] == TEST_USERNAME
         assert result["data"][CONF_PASSWORD] == TEST_PASSWORD
+        assert CONF_SCAN_INTERVAL not in result["data"]
+        assert result["options"] == {CONF_SCAN_INTERVAL: TEST_SCAN_INTERVAL}
 
 
 async def test_reconfigure_flow_success(hass: HomeAssistant):
     """Test successful reconfiguration flow."""
-    # Create an existing config entry
+    # Create an existing config entry whose options were saved
     entry = MockConfigEntry(
         domain=DOMAIN,
         data=TEST_CONFIG,
+        options={CONF_SCAN_INTERVAL: 30, CONF_ALARMS_INTERVAL: 1800},
         entry_id="test_entry_id",
     )
     entry.add_to_hass(hass)
@@ -91,6 +98,10 @@ async def test_reconfigure_flow_success(hass: HomeAssistant):
 
         assert result["type"] == data_entry_flow.FlowResultType.FORM
         assert result["step_id"] == "reconfigure"
+        defaults = {
+            key.schema: key.default() for key in result["data_schema"].schema.keys()
+        }
+        assert defaults[CONF_SCAN_INTERVAL] == 30
 
         # Update configuration with new values
         new_config = TEST_CONFIG.copy()
@@ -106,7 +117,11 @@ async def test_reconfigure_flow_success(hass: HomeAssistant):
 
         # Verify the entry was updated
         updated_entry = hass.config_entries.async_get_entry(entry.entry_id)
-        assert updated_entry.data[CONF_SCAN_INTERVAL] == 120
+        # The scan interval is saved in the options the setup reads
+        assert updated_entry.options == {
+            CONF_SCAN_INTERVAL: 120,
+            CONF_ALARMS_INTERVAL: 1800,
+        }
         assert updated_entry.data[CONF_PASSWORD] == "new_password"
 
 
@@ -183,6 +198,72 @@ async def test_reconfigure_preserves_entry_id(hass: HomeAssistant):
         assert result["type"] == data_entry_flow.FlowResultType.ABORT
 
 
+async def test_options_flow_sets_polling_intervals(hass: HomeAssistant):
+    """Test that the options flow stores the interval of each endpoint."""
+    entry = MockConfigEntry(domain=DOMAIN, data=TEST_CONFIG)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+    defaults = {
+        key.schema: key.default() for key in result["data_schema"].schema.keys()
+    }
+    assert defaults == {
+        CONF_SCAN_INTERVAL: TEST_SCAN_INTERVAL,
+        CONF_INSTALLATION_DEVICES_INTERVAL: 60,
+        CONF_ALARMS_INTERVAL: 600,
+        CONF_STALE_GRACE_PERIOD: 600,
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SCAN_INTERVAL: 30,
+            CONF_INSTALLATION_DEVICES_INTERVAL: 120,
+            CONF_ALARMS_INTERVAL: 1800,
+            CONF_STALE_GRACE_PERIOD: 300,
+        },
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_SCAN_INTERVAL: 30,
+        CONF_INSTALLATION_DEVICES_INTERVAL: 120,
+        CONF_ALARMS_INTERVAL: 1800,
+        CONF_STALE_GRACE_PERIOD: 300,
+    }
+
+
+async def test_scan_interval_moves_from_data_to_options(hass: HomeAssistant):
+    """Test that the scan interval of older entries is moved to the options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=TEST_CONFIG, options={CONF_ALARMS_INTERVAL: 1800}
+    )
+    entry.add_to_hass(hass)
+
+    _async_migrate_scan_interval(hass, entry)
+
+    assert CONF_SCAN_INTERVAL not in entry.data
+    assert entry.data[CONF_USERNAME] == TEST_USERNAME
+    assert entry.options == {
+        CONF_SCAN_INTERVAL: TEST_SCAN_INTERVAL,
+        CONF_ALARMS_INTERVAL: 1800,
+    }
+
+    # A scan interval saved in the options is kept
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=TEST_CONFIG, options={CONF_SCAN_INTERVAL: 30}
+    )
+    entry.add_to_hass(hass)
+
+    _async_migrate_scan_interval(hass, entry)
+
+    assert CONF_SCAN_INTERVAL not in entry.data
+    assert entry.options == {CONF_SCAN_INTERVAL: 30}
+
+
 async def test_reauth_flow_success(hass: HomeAssistant):
     """Test successful reauthentication flow."""
     # Create an existing config entry
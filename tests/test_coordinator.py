@@ -1,11 +1,24 @@
 """Test Coordinator configuration."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
-
-from custom_components.csnet_home.coordinator import CSNetHomeCoordinator
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.csnet_home.coordinator import (
+    ENDPOINT_ALARMS,
+    ENDPOINT_INSTALLATION_DEVICES,
+    TOPIC_ALARMS,
+    TOPIC_COMMON,
+    TOPIC_INSTALLATION,
+    CSNetHomeCoordinator,
+    DeviceWatermark,
+    heating_status_topic,
+    sensor_key,
+)
+from custom_components.csnet_home.models import ZoneState
 
 
 @pytest.fixture(autouse=True)
@@ -265,3 +278,732 @@ async def test_coordinator_alarm_clearing(hass: HomeAssistant):
 
     # Verify alarm code was cleared from storage
     assert "123-456-789" not in coordinator._last_alarm_codes
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_endpoints_concurrently(hass: HomeAssistant):
+    """Test that all endpoints are requested together once a session exists."""
+    in_flight = 0
+    max_in_flight = 0
+
+    def tracked(result):
+        async def _request():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        return _request
+
+    mock_api = MagicMock()
+    mock_api.session = MagicMock()
+    mock_api.logged_in = True
+    mock_api.installation_id = 42
+    mock_api.load_translations = AsyncMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        side_effect=tracked({"common_data": {"device_status": {}}, "sensors": []})
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        side_effect=tracked({"data": []})
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(
+        side_effect=tracked({"alarms": []})
+    )
+
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    await coordinator._async_update_data()
+
+    assert max_in_flight == 3
+    assert set(coordinator.last_update_timings) == {
+        "elements",
+        "installation_devices",
+        "alarms",
+        "total",
+    }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_elements_first_without_session(
+    hass: HomeAssistant,
+):
+    """Test that elements are fetched first until the installation ID is known."""
+    calls = []
+    mock_api = MagicMock()
+    mock_api.session = None
+    mock_api.logged_in = False
+    mock_api.installation_id = None
+    mock_api.load_translations = AsyncMock()
+
+    async def get_elements():
+        calls.append("elements")
+        mock_api.installation_id = 42
+        return {"common_data": {"device_status": {}}, "sensors": []}
+
+    async def get_alarms():
+        calls.append(("alarms", mock_api.installation_id))
+        return {"alarms": []}
+
+    mock_api.async_get_elements_data = AsyncMock(side_effect=get_elements)
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(side_effect=get_alarms)
+
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    await coordinator._async_update_data()
+
+    assert calls == ["elements", ("alarms", 42)]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_retranslates_alarms_on_new_bundles(hass: HomeAssistant):
+    """Test that refreshed translations rewrite the cached alarm texts."""
+    mock_api = MagicMock()
+    mock_api.translate_alarm = MagicMock(return_value="Nouveau message")
+    mock_api.get_alarm_origin = MagicMock(return_value="Origine")
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    coordinator._device_data = {
+        "common_data": {},
+        "sensors": [
+            {
+                "alarm_code": 62,
+                "unit_type": "yutaki",
+                "alarm_message": "Old message",
+                "alarm_origin": "",
+            }
+        ],
+    }
+    coordinator.async_update_listeners = MagicMock()
+
+    coordinator.async_translations_updated()
+
+    sensor = coordinator.get_sensors_data()[0]
+    assert sensor["alarm_message"] == "Nouveau message"
+    assert sensor["alarm_origin"] == "Origine"
+    mock_api.get_alarm_origin.assert_called_once_with(62, "yutaki", None)
+    coordinator.async_update_listeners.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_indexes_sensors_by_key(hass: HomeAssistant):
+    """Test that zone records are resolved through the sensor key index."""
+    living = {"device_id": 1, "parent_id": 10, "zone_id": 1, "room_name": "Living"}
+    living_room = {
+        "device_id": 1,
+        "parent_id": 11,
+        "zone_id": 2,
+        "room_name": "Living Room",
+    }
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        return_value={"common_data": {}, "sensors": [living, living_room]}
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    assert coordinator.get_sensor(sensor_key(living)) is None
+
+    await coordinator._async_update_data()
+
+    assert coordinator.get_sensor(sensor_key(living)) == living
+    assert coordinator.get_sensor((1, 11, 2)) == living_room
+    assert coordinator.get_sensor((1, 12, 2)) is None
+
+
+def _installation_payload(heating_status, heating_setting=None):
+    """Build an installation devices payload around a heatingStatus."""
+    return {
+        "data": [
+            {
+                "indoors": [
+                    {
+                        "heatingStatus": heating_status,
+                        "heatingSetting": heating_setting or {},
+                    }
+                ]
+            }
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_notifies_only_changed_listeners(hass: HomeAssistant):
+    """Test that unchanged records and heatingStatus fields skip state writes."""
+    payloads = [
+        (
+            [{"device_id": 1, "parent_id": 10, "zone_id": 1, "temp": 20}],
+            {"waterFlow": 10, "gasTemp": 30},
+        ),
+        (
+            [{"device_id": 1, "parent_id": 10, "zone_id": 1, "temp": 21}],
+            {"waterFlow": 12, "gasTemp": 30},
+        ),
+        (
+            [{"device_id": 1, "parent_id": 10, "zone_id": 1, "temp": 21}],
+            {"waterFlow": 12, "gasTemp": 30},
+        ),
+    ]
+
+    async def get_elements():
+        sensors, _ = payloads[0]
+        return {"common_data": {"name": "Home"}, "sensors": sensors}
+
+    async def get_installation_devices():
+        _, heating_status = payloads.pop(0)
+        return _installation_payload(heating_status)
+
+    mock_api = MagicMock()
+    mock_api.session = AsyncMock()
+    mock_api.logged_in = True
+    mock_api.installation_id = 1
+    mock_api.load_translations = AsyncMock()
+    mock_api.async_get_elements_data = AsyncMock(side_effect=get_elements)
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        side_effect=get_installation_devices
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    coordinator.last_update_success = True
+    calls = {"zone": 0, "flow": 0, "gas": 0, "always": 0}
+
+    def listener(name):
+        return lambda: calls.__setitem__(name, calls[name] + 1)
+
+    coordinator._listeners = {
+        1: (listener("zone"), frozenset({(1, 10, 1)})),
+        2: (listener("flow"), frozenset({heating_status_topic("waterFlow")})),
+        3: (listener("gas"), frozenset({heating_status_topic("gasTemp")})),
+        4: (listener("always"), None),
+    }
+
+    clock = [0.0]
+
+    async def refresh():
+        # Every refresh happens one scan interval after the previous one
+        clock[0] += 30
+        with patch(
+            "custom_components.csnet_home.coordinator.time.monotonic",
+            return_value=clock[0],
+        ):
+            await coordinator._async_update_data()
+        coordinator.async_update_listeners()
+
+    await refresh()
+    assert calls == {"zone": 1, "flow": 1, "gas": 1, "always": 1}
+
+    await refresh()
+    assert calls == {"zone": 2, "flow": 2, "gas": 1, "always": 2}
+    assert coordinator.skipped_writes == 1
+
+    await refresh()
+    assert calls == {"zone": 2, "flow": 2, "gas": 1, "always": 3}
+    assert coordinator.skipped_writes == 3
+    assert coordinator.skipped_writes_total == 4
+
+    # A change of the update success state notifies every listener
+    coordinator.last_update_success = False
+    coordinator.async_update_listeners()
+    assert calls == {"zone": 3, "flow": 3, "gas": 2, "always": 4}
+
+
+@pytest.mark.asyncio
+async def test_coordinator_diff_topics_installation_changes(hass: HomeAssistant):
+    """Test the topics reported for common data and non heatingStatus changes."""
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    previous = {
+        "sensors": [],
+        "common_data": {
+            "weather_temperature": 10,
+            "installation_devices": _installation_payload(
+                {"waterFlow": 10}, {"fixTempHeatC1": 35}
+            ),
+        },
+    }
+    coordinator._device_data = {
+        "sensors": [],
+        "common_data": {
+            "weather_temperature": 11,
+            "installation_devices": _installation_payload(
+                {"waterFlow": 10}, {"fixTempHeatC1": 40}
+            ),
+            "installation_alarms": {"alarms": []},
+        },
+    }
+
+    assert coordinator._diff_topics(previous, {}) == {
+        TOPIC_COMMON,
+        TOPIC_ALARMS,
+        TOPIC_INSTALLATION,
+    }
+
+    previous["common_data"]["installation_devices"] = {"unexpected": True}
+    assert coordinator._diff_topics(previous, {}) is None
+
+
+@pytest.mark.asyncio
+async def test_coordinator_builds_installation_snapshot(hass: HomeAssistant):
+    """Test that the installation devices data is decoded once per refresh."""
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        return_value={"common_data": {"name": "Home"}, "sensors": []}
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        return_value={"data": [{"indoors": [{"heatingStatus": {"waterFlow": 30}}]}]}
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=30, entry_id="test")
+    assert not coordinator.get_installation_snapshot().heating_status
+
+    await coordinator._async_update_data()
+
+    snapshot = coordinator.get_installation_snapshot()
+    assert snapshot.heating_status["waterFlow"] == 30
+    assert snapshot.water_flow == 3.0
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polls_endpoints_on_their_own_interval(
+    hass: HomeAssistant,
+):
+    """Test that slower endpoints are served from cache until they are due."""
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        side_effect=lambda: {"common_data": {"name": "Home"}, "sensors": []}
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        return_value={"data": [{"indoors": [{"heatingStatus": {"waterFlow": 30}}]}]}
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(return_value={"alarms": []})
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(
+        hass=hass,
+        update_interval=60,
+        entry_id="test",
+        endpoint_intervals={
+            ENDPOINT_INSTALLATION_DEVICES: 120,
+            ENDPOINT_ALARMS: 600,
+        },
+    )
+    now = 1000.0
+    with patch(
+        "custom_components.csnet_home.coordinator.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        await coordinator._async_update_data()
+        # One refresh later only elements are requested, cached data is merged
+        now += 59
+        result = await coordinator._async_update_data()
+        assert mock_api.async_get_elements_data.await_count == 2
+        assert mock_api.async_get_installation_devices_data.await_count == 1
+        assert mock_api.async_get_installation_alarms.await_count == 1
+        assert result["common_data"]["installation_devices"]["data"]
+        assert result["common_data"]["installation_alarms"] == {"alarms": []}
+        assert coordinator.get_installation_snapshot().water_flow == 3.0
+        assert set(coordinator.last_update_timings) == {"elements", "total"}
+
+        # Timer drift does not push an endpoint to the following refresh
+        now += 59
+        await coordinator._async_update_data()
+        assert mock_api.async_get_installation_devices_data.await_count == 2
+        assert mock_api.async_get_installation_alarms.await_count == 1
+
+        now += 600
+        await coordinator._async_update_data()
+        assert mock_api.async_get_installation_alarms.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_coordinator_retries_failed_endpoint_next_refresh(hass: HomeAssistant):
+    """Test that a failed slower endpoint is not cached until its interval."""
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        side_effect=lambda: {"common_data": {"name": "Home"}, "sensors": []}
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value={"data": []})
+    mock_api.async_get_installation_alarms = AsyncMock(
+        side_effect=[None, {"alarms": []}]
+    )
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(
+        hass=hass,
+        update_interval=60,
+        entry_id="test",
+        endpoint_intervals={ENDPOINT_ALARMS: 600},
+    )
+    result = await coordinator._async_update_data()
+    assert "installation_alarms" not in result["common_data"]
+
+    result = await coordinator._async_update_data()
+    assert mock_api.async_get_installation_alarms.await_count == 2
+    assert result["common_data"]["installation_alarms"] == {"alarms": []}
+
+
+def _schedulable(coordinator):
+    """Give a coordinator built without the base initializer a refresh timer."""
+    coordinator.last_update_success = True
+    coordinator._unsub_refresh = None
+    coordinator._update_interval_seconds = None
+    coordinator._schedule_refresh = MagicMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_coordinator_bursts_until_command_confirmed(hass: HomeAssistant):
+    """Test that a command speeds up polling until the record reports it."""
+    elements = [
+        {"common_data": {}, "sensors": [{"zone_id": 1, "setting_temperature": t}]}
+        for t in (20, 20, 22)
+    ]
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(side_effect=elements)
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    await coordinator._async_update_data()
+    coordinator._async_refresh_finished()
+    assert coordinator.update_interval.total_seconds() == 60
+
+    coordinator._unsub_refresh = MagicMock()
+    coordinator.async_expect_fields((None, None, 1), {"setting_temperature": 22})
+    assert coordinator.update_interval.total_seconds() == 5
+    coordinator._schedule_refresh.assert_called_once()
+
+    # The cloud has not applied the setpoint yet
+    await coordinator._async_update_data()
+    coordinator._async_refresh_finished()
+    assert coordinator.update_interval.total_seconds() == 5
+
+    await coordinator._async_update_data()
+    coordinator._async_refresh_finished()
+    assert coordinator.update_interval.total_seconds() == 60
+    assert not coordinator._burst_checks
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backs_off_on_failed_refreshes(hass: HomeAssistant):
+    """Test that failed fetches widen the interval until the cloud recovers."""
+    mock_api = MagicMock()
+    good = {"common_data": {}, "sensors": []}
+    mock_api.async_get_elements_data = AsyncMock(side_effect=[good, None, None, good])
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    intervals = []
+    for _ in range(4):
+        await coordinator._async_update_data()
+        coordinator._async_refresh_finished()
+        intervals.append(coordinator.update_interval.total_seconds())
+
+    assert intervals[0] == 60
+    assert 96 <= intervals[1] <= 144
+    assert 192 <= intervals[2] <= 288
+    assert intervals[3] == 60
+
+
+@pytest.mark.asyncio
+async def test_coordinator_holds_optimistic_values_until_echoed(hass: HomeAssistant):
+    """Test that pending changes survive polls until the cloud reports them."""
+    setpoints = [20, 20, 22]
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        side_effect=lambda: {
+            "common_data": {},
+            "sensors": [
+                {"zone_id": 1, "setting_temperature": setpoints.pop(0), "mode": 1}
+            ],
+        }
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    key = (None, None, 1)
+    now = 1000.0
+    with patch(
+        "custom_components.csnet_home.coordinator.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        await coordinator._async_update_data()
+        coordinator.async_expect_fields(key, {"setting_temperature": 22})
+
+        # The cloud still reports the old setpoint: the written one is kept
+        now += 5
+        await coordinator._async_update_data()
+        assert coordinator.get_sensor(key)["setting_temperature"] == 22
+        assert key not in coordinator._changed_topics
+        assert coordinator.command_metrics["pending"] == 1
+
+        now += 5
+        await coordinator._async_update_data()
+        assert coordinator.get_sensor(key)["setting_temperature"] == 22
+        assert coordinator.command_metrics == {
+            "pending": 0,
+            "confirmed": 1,
+            "expired": 0,
+            "last_latency_ms": 10000.0,
+            "max_latency_ms": 10000.0,
+        }
+
+
+@pytest.mark.asyncio
+async def test_coordinator_drops_pending_changes(hass: HomeAssistant):
+    """Test that pending changes expire and are replaced by newer writes."""
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        side_effect=lambda: {
+            "common_data": {},
+            "sensors": [{"zone_id": 1, "setting_temperature": 20, "mode": 1}],
+        }
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    key = (None, None, 1)
+    now = 1000.0
+    with patch(
+        "custom_components.csnet_home.coordinator.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        coordinator.async_expect_fields(key, {"setting_temperature": 21, "mode": 0})
+        coordinator.async_expect_fields(key, {"setting_temperature": 22})
+        await coordinator._async_update_data()
+        assert coordinator.get_sensor(key) == {
+            "zone_id": 1,
+            "setting_temperature": 22,
+            "mode": 0,
+        }
+
+        now += 90
+        await coordinator._async_update_data()
+        assert coordinator.get_sensor(key)["setting_temperature"] == 20
+        assert coordinator.command_metrics["pending"] == 0
+        assert coordinator.command_metrics["expired"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_unchanged_responses(hass: HomeAssistant):
+    """Test that responses handed back unchanged by the API skip processing."""
+    elements = {
+        "common_data": {"name": "Home"},
+        "sensors": [
+            {"zone_id": 3, "current_temperature": 40, "setting_temperature": 45}
+        ],
+    }
+    installation = {"data": [{"indoors": [{"heatingStatus": {"tempDHW": 48}}]}]}
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(return_value=elements)
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=installation)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    key = (None, None, 3)
+    await coordinator._async_update_data()
+    assert coordinator.get_sensor(key)["current_temperature"] == 48
+    # The records of the API are left as decoded
+    assert elements["sensors"][0]["current_temperature"] == 40
+    assert "installation_devices" not in elements["common_data"]
+
+    with patch.object(coordinator, "_build_sensor_index") as build_index:
+        data = await coordinator._async_update_data()
+    build_index.assert_not_called()
+    assert data is coordinator._device_data
+    assert coordinator._changed_topics == set()
+    assert coordinator.unchanged_refreshes == 1
+
+    # A pending write needs its record checked against every poll
+    coordinator.async_expect_fields(key, {"setting_temperature": 50})
+    await coordinator._async_update_data()
+    assert coordinator.unchanged_refreshes == 1
+    assert coordinator.get_sensor(key)["setting_temperature"] == 50
+    assert elements["sensors"][0]["setting_temperature"] == 45
+
+
+@pytest.mark.asyncio
+async def test_coordinator_holds_records_of_devices_without_report(
+    hass: HomeAssistant,
+):
+    """Test that unchanged zones of a device whose lastComm did not move are kept."""
+    polls = [
+        (1000, {"current_temperature": 20}),
+        (1000, {"current_temperature": 20}),
+        (1000, {"current_temperature": 21}),
+        (61000, {"current_temperature": 22}),
+    ]
+
+    def elements():
+        last_comm, fields = polls.pop(0)
+        return {
+            "common_data": {
+                "device_status": {
+                    7: {"lastComm": last_comm, "currentTimeMillis": last_comm + 500}
+                }
+            },
+            "sensors": [{"device_id": 7, "zone_id": 1, **fields}],
+        }
+
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(side_effect=elements)
+    mock_api.async_get_installation_devices_data = AsyncMock(return_value=None)
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    key = (7, None, 1)
+    await coordinator._async_update_data()
+    record = coordinator.get_sensor(key)
+
+    await coordinator._async_update_data()
+    assert coordinator.get_sensor(key) is record
+    assert record["current_temperature"] == 20
+    assert key not in coordinator._changed_topics
+    assert coordinator.held_records == 1
+
+    # A changed record is not held back even though lastComm did not move
+    await coordinator._async_update_data()
+    assert coordinator.get_sensor(key)["current_temperature"] == 21
+    assert key in coordinator._changed_topics
+    assert coordinator.held_records == 1
+
+    await coordinator._async_update_data()
+    assert coordinator.get_sensor(key)["current_temperature"] == 22
+    assert key in coordinator._changed_topics
+    assert coordinator._watermarks[7].period == 60
+
+
+@pytest.mark.asyncio
+async def test_coordinator_aligns_refresh_with_device_reports(hass: HomeAssistant):
+    """Test that the next refresh is moved just after a device report."""
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    # Reported 10 s before the fetch, every 25 s: next reports in 15, 40, 65 s
+    coordinator._watermarks = {
+        7: DeviceWatermark(
+            last_comm=100_000, server_time=110_000, fetched_at=1000.0, period=25
+        )
+    }
+    assert coordinator._watermarks[7].next_report_delay(1000.0) == 15
+    assert coordinator._align_to_reports(60, 1000.0) == 43
+    # The configured interval is kept when no report is expected within it
+    coordinator._watermarks[7].period = 120
+    assert coordinator._align_to_reports(60, 1000.0) == 60
+    coordinator._watermarks[7].period = None
+    assert coordinator._align_to_reports(60, 1000.0) == 60
+
+
+@pytest.mark.asyncio
+async def test_coordinator_replaces_zone_state_records(hass: HomeAssistant):
+    """Test that enrichment and optimistic writes swap immutable records."""
+    zone = ZoneState(device_id=1, zone_id=3, room_name="DHW", current_temperature=40)
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(
+        return_value={"common_data": {"name": "Home"}, "sensors": [zone]}
+    )
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        return_value={"data": [{"indoors": [{"heatingStatus": {"tempDHW": 48}}]}]}
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = _schedulable(
+        CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    )
+    key = sensor_key(zone)
+    await coordinator._async_update_data()
+    enriched = coordinator.get_sensor(key)
+    assert isinstance(enriched, ZoneState)
+    assert enriched.current_temperature == 48
+    assert zone.current_temperature == 40
+
+    coordinator.async_expect_fields(key, {"setting_temperature": 55})
+    record = coordinator.get_sensor(key)
+    assert record.setting_temperature == 55
+    assert coordinator.get_sensors_data() == [record]
+    assert enriched.setting_temperature is None
+
+
+@pytest.mark.asyncio
+async def test_coordinator_serves_last_good_data_within_grace(hass: HomeAssistant):
+    """Test that failed fetches keep the last good data until the grace ends."""
+    good = {
+        "common_data": {"name": "Home"},
+        "sensors": [{"zone_id": 1, "setting_temperature": 20}],
+    }
+    mock_api = MagicMock()
+    mock_api.async_get_elements_data = AsyncMock(side_effect=[None, good, None, None])
+    mock_api.async_get_installation_devices_data = AsyncMock(
+        side_effect=[None, {"data": []}, None, None]
+    )
+    mock_api.async_get_installation_alarms = AsyncMock(return_value=None)
+    mock_api.load_translations = AsyncMock()
+    hass.data["csnet_home"] = {"test": {"api": mock_api}}
+
+    coordinator = CSNetHomeCoordinator(
+        hass=hass, update_interval=60, entry_id="test", stale_grace_period=300
+    )
+    now = 1000.0
+    with patch(
+        "custom_components.csnet_home.coordinator.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        # Nothing to fall back on before the first good refresh
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.data_age is None
+
+        await coordinator._async_update_data()
+        assert not coordinator.stale
+
+        now += 60
+        result = await coordinator._async_update_data()
+        assert result["sensors"] == good["sensors"]
+        assert result["common_data"]["installation_devices"] == {"data": []}
+        assert coordinator.stale
+        assert coordinator.data_age == 60
+        assert coordinator._changed_topics == set()
+
+        now += 300
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert coordinator.get_sensors_data() == good["sensors"]
@@ -0,0 +1,50 @@
+"""Test the diagnostics of the CSNet Home integration."""
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.csnet_home.api import CSNetHomeAPI
+from custom_components.csnet_home.const import DOMAIN
+from custom_components.csnet_home.coordinator import CSNetHomeCoordinator
+from custom_components.csnet_home.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_integration_frame():
+    """Mock integration frame to prevent RuntimeError in DataUpdateCoordinator."""
+    with patch(
+        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
+        return_value=None,
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_report_counters(hass: HomeAssistant):
+    """Expose the polling, decoding and command counters of the entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, entry_id="test", options={CONF_SCAN_INTERVAL: 60}
+    )
+    api = CSNetHomeAPI(hass, "user", "pass")
+    coordinator = CSNetHomeCoordinator(hass=hass, update_interval=60, entry_id="test")
+    hass.data[DOMAIN] = {"test": {"api": api, "coordinator": coordinator}}
+    coordinator.unchanged_refreshes = 3
+    coordinator.skipped_writes_total = 5
+    api.offloaded_decodes = 2
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["options"] == {CONF_SCAN_INTERVAL: 60}
+    assert diagnostics["coordinator"]["stale"] is False
+    assert diagnostics["coordinator"]["data_age_s"] is None
+    assert diagnostics["coordinator"]["unchanged_refreshes"] == 3
+    assert diagnostics["coordinator"]["skipped_writes_total"] == 5
+    assert diagnostics["coordinator"]["commands"] == coordinator.command_metrics
+    assert diagnostics["api"]["decode"]["offloaded"] == 2
+    assert diagnostics["api"]["heat_settings"] == api.heat_settings.metrics
@@ -1,6 +1,10 @@
 """Tests for helper functions."""
 
-from custom_components.csnet_home.helpers import extract_heating_status
+from custom_components.csnet_home.helpers import (
+    convert_unsigned_to_signed_byte,
+    extract_heating_status,
+    reported_setting_temperature,
+)
 
 
 def test_extract_heating_status_none():
@@ -65,3 +69,54 @@ def test_extract_heating_status_not_dict_data():
     """Test extract_heating_status with data[0] not being a dict."""
     data = {"data": ["not_a_dict"]}
     assert extract_heating_status(data) is None
+
+
+def test_convert_unsigned_to_signed_byte_positive_values():
+    """Test conversion of unsigned bytes that should remain positive."""
+    # Values 0-127 should remain unchanged
+    assert convert_unsigned_to_signed_byte(0) == 0
+    assert convert_unsigned_to_signed_byte(1) == 1
+    assert convert_unsigned_to_signed_byte(50) == 50
+    assert convert_unsigned_to_signed_byte(100) == 100
+    assert convert_unsigned_to_signed_byte(127) == 127
+
+
+def test_convert_unsigned_to_signed_byte_negative_values():
+    """Test conversion of unsigned bytes that should become negative.
+
+    When API sends unsigned bytes (0-255) for temperature values:
+    - 128 (0x80) represents -128°C
+    - 255 (0xFF) represents -1°C
+    - 246 (0xF6) represents -10°C
+    - 250 (0xFA) represents -6°C
+    """
+    # Values 128-255 should be converted to negative
+    assert convert_unsigned_to_signed_byte(128) == -128
+    assert convert_unsigned_to_signed_byte(255) == -1
+    assert convert_unsigned_to_signed_byte(246) == -10
+    assert convert_unsigned_to_signed_byte(250) == -6
+    assert convert_unsigned_to_signed_byte(254) == -2
+    assert convert_unsigned_to_signed_byte(240) == -16
+    assert convert_unsigned_to_signed_byte(200) == -56
+
+
+def test_convert_unsigned_to_signed_byte_edge_cases():
+    """Test edge cases for byte conversion."""
+    # None should remain None
+    assert convert_unsigned_to_signed_byte(None) is None
+
+    # Non-integer values should be passed through
+    assert convert_unsigned_to_signed_byte(25.5) == 25.5
+    assert convert_unsigned_to_signed_byte("100") == "100"
+    assert convert_unsigned_to_signed_byte([]) == []
+
+
+def test_reported_setting_temperature():
+    """Encode a setpoint the way the elements report it after the write."""
+    assert reported_setting_temperature(1, 21.25) == 21.2
+    assert reported_setting_temperature(2, 19) == 19.0
+    assert reported_setting_temperature(3, 50.5) == 50
+    assert reported_setting_temperature(4, 28.9) == 28
+    # elementType 5 reports its setting temperature multiplied by 10
+    assert reported_setting_temperature(5, 35.5) == 350
+    assert reported_setting_temperature(6, 35.5) == 35
@@ -0,0 +1,111 @@
+"""Tests for the typed installation snapshot and zone records."""
+
+import dataclasses
+
+import pytest
+
+from custom_components.csnet_home.models import (
+    EMPTY_SNAPSHOT,
+    ZONE_FIELDS,
+    InstallationSnapshot,
+    ZoneState,
+    replace_zone,
+)
+
+
+def test_snapshot_from_invalid_payload():
+    """Return the empty snapshot when there is no installation data."""
+    assert InstallationSnapshot.from_installation_devices(None) is EMPTY_SNAPSHOT
+    assert not EMPTY_SNAPSHOT.heating_status
+    assert EMPTY_SNAPSHOT.water_flow is None
+
+
+def test_snapshot_decodes_sections():
+    """Decode heatingStatus, heatingSetting and secondCycle once."""
+    snapshot = InstallationSnapshot.from_installation_devices(
+        {
+            "data": [
+                {
+                    "indoors": [
+                        {
+                            "heatingStatus": {
+                                "waterFlow": 25,
+                                "waterPressure": 224,
+                                "ouDischargeTemperature": 246,
+                                "ouEvapTemperature": 5,
+                            },
+                            "heatingSetting": {"fixTempHeatC1": 35},
+                            "secondCycle": {"dischargeTemp": 250, "suctionTemp": 0},
+                        }
+                    ]
+                }
+            ]
+        }
+    )
+
+    assert snapshot.heating_status["waterFlow"] == 25
+    assert snapshot.heating_setting["fixTempHeatC1"] == 35
+    assert snapshot.water_flow == 2.5
+    assert snapshot.water_pressure == 4.48
+    assert snapshot.discharge_temperature == -10
+    assert snapshot.evaporator_temperature == 5
+    assert snapshot.outdoor_ambient_temperature is None
+    assert snapshot.secondary_discharge_temperature == -6
+    assert snapshot.secondary_suction_temperature == 0
+
+
+def test_snapshot_is_immutable():
+    """Reject changes to the snapshot and its sections."""
+    snapshot = InstallationSnapshot.from_installation_devices(
+        {"heatingStatus": {"waterFlow": 10}}
+    )
+    assert snapshot.water_flow == 1.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.water_flow = 2.0
+    with pytest.raises(TypeError):
+        snapshot.heating_status["waterFlow"] = 20
+
+
+def test_zone_state_reads_as_mapping():
+    """Keep the dict accessors of the former zone records."""
+    zone = ZoneState(room_name="Living", zone_id=1, mode=1, setting_temperature=21)
+    assert zone["room_name"] == "Living"
+    assert zone.get("mode") == 1
+    assert zone.get("fan1_speed") is None
+    assert zone.get("unknown", "default") == "default"
+    assert "zone_id" in zone and "unknown" not in zone
+    assert list(zone) == list(ZONE_FIELDS)
+    assert dict(zone)["setting_temperature"] == 21
+    with pytest.raises(KeyError):
+        zone["unknown"]
+
+
+def test_zone_state_is_immutable():
+    """Changes build a new record and leave the original untouched."""
+    zone = ZoneState(zone_id=1, setting_temperature=21)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        zone.setting_temperature = 22
+
+    updated = zone.replace({"setting_temperature": 22})
+    assert updated.setting_temperature == 22
+    assert zone.setting_temperature == 21
+    assert replace_zone(zone, {"mode": 0}) == ZoneState(
+        zone_id=1, mode=0, setting_temperature=21
+    )
+
+
+def test_zone_state_equality():
+    """Compare records field by field, and with plain dicts."""
+    zone = ZoneState(zone_id=1, mode=1)
+    assert zone == ZoneState(zone_id=1, mode=1)
+    assert zone != ZoneState(zone_id=1, mode=0)
+    assert zone == dict(zone)
+    assert zone != {"zone_id": 1, "mode": 1}
+    assert hash(zone) == hash(ZoneState(zone_id=1, mode=1))
+
+
+def test_replace_zone_copies_dict_records():
+    """Plain dict records are copied, not changed in place."""
+    record = {"zone_id": 1, "mode": 1}
+    assert replace_zone(record, {"mode": 0}) == {"zone_id": 1, "mode": 0}
+    assert record == {"zone_id": 1, "mode": 1}
@@ -0,0 +1,81 @@
+"""Test the adaptive refresh interval policy."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.csnet_home.polling import AdaptivePolling
+
+
+def build_policy():
+    """Create a policy with a 60 s base interval."""
+    return AdaptivePolling(
+        60,
+        burst_interval=5,
+        burst_duration=30,
+        idle_refreshes=3,
+        idle_max_interval=240,
+        backoff_max_interval=900,
+        jitter=0.2,
+    )
+
+
+def test_base_interval_while_data_changes():
+    """Keep the configured interval while refreshes bring changes."""
+    policy = build_policy()
+    for _ in range(10):
+        policy.record_refresh(True, True)
+    assert policy.next_interval(0) == 60
+
+
+def test_idle_refreshes_widen_interval():
+    """Double the interval every few unchanged refreshes, up to the maximum."""
+    policy = build_policy()
+    intervals = []
+    for _ in range(12):
+        policy.record_refresh(True, False)
+        intervals.append(policy.next_interval(0))
+    assert intervals == [60, 60, 120, 120, 120, 240, 240, 240, 240, 240, 240, 240]
+
+    policy.record_refresh(True, True)
+    assert policy.next_interval(0) == 60
+
+
+def test_burst_until_confirmed_or_expired():
+    """Poll at the burst interval for a bounded time after a command."""
+    policy = build_policy()
+    for _ in range(6):
+        policy.record_refresh(True, False)
+
+    policy.start_burst(100)
+    assert policy.burst_active(100)
+    assert policy.next_interval(110) == 5
+    # The burst resets the idle widening
+    assert policy.next_interval(130) == 60
+
+    policy.start_burst(200)
+    policy.end_burst()
+    assert not policy.burst_active(200)
+    assert policy.next_interval(200) == 60
+
+
+@pytest.mark.parametrize(
+    ("failures", "expected"),
+    [(1, 120), (2, 240), (3, 480), (4, 900), (8, 900)],
+)
+def test_failures_back_off_with_jitter(failures, expected):
+    """Back off exponentially on failures, spreading retries with jitter."""
+    policy = build_policy()
+    policy.start_burst(0)
+    for _ in range(failures):
+        policy.record_refresh(False, False)
+
+    with patch(
+        "custom_components.csnet_home.polling.random.uniform",
+        side_effect=lambda low, high: high,
+    ):
+        assert policy.next_interval(0) == pytest.approx(expected * 1.2)
+    assert expected * 0.8 <= policy.next_interval(0) <= expected * 1.2
+
+    policy.record_refresh(True, True)
+    assert policy.failures == 0
@@ -1,7 +1,10 @@
 """Tests for security and PII redaction."""
 
+import logging
+from unittest.mock import patch
+
 import pytest
-from custom_components.csnet_home.api import redact_data
+from custom_components.csnet_home.api import LazyRedact, redact_data
 
 
 def test_redact_data_dictionary():
@@ -77,3 +80,24 @@ def test_redact_data_mixed_types():
     assert redacted["username"] == "**REDACTED**"
     assert redacted["nested"][2]["token"] == "**REDACTED**"
     assert redacted["nested"][0] == 1
+
+
+def test_lazy_redact_formats_redacted_data():
+    """Test that the lazy wrapper logs the redacted data."""
+    data = {"latitude": "50.1", "name": "My Home"}
+    assert str(LazyRedact(data)) == str(redact_data(data))
+    assert "%s" % LazyRedact(data) == str(redact_data(data))
+
+
+def test_lazy_redact_skipped_when_debug_disabled(caplog):
+    """Test that no redaction happens for records that are not emitted."""
+    logger = logging.getLogger("custom_components.csnet_home.api")
+    with patch(
+        "custom_components.csnet_home.api.redact_data"
+    ) as mock_redact, caplog.at_level(logging.INFO, logger=logger.name):
+        logger.debug("Data: %s", LazyRedact({"ownerId": 1}))
+    mock_redact.assert_not_called()
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        logger.debug("Data: %s", LazyRedact({"ownerId": 1}))
+    assert "**REDACTED**" in caplog.text
@@ -4,9 +4,11 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 from homeassistant.components.climate.const import HVACMode
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import STATE_OFF, STATE_ON, UnitOfTemperature
 
 from custom_components.csnet_home.const import (
+    DOMAIN,
     OTC_COOLING_TYPE_FIX,
     OTC_COOLING_TYPE_NONE,
     OTC_COOLING_TYPE_POINTS,
@@ -15,17 +17,36 @@ from custom_components.csnet_home.const import (
     OTC_HEATING_TYPE_NONE,
     OTC_HEATING_TYPE_POINTS,
 )
+from custom_components.csnet_home.coordinator import (
+    TOPIC_COMMON,
+    TOPIC_HEATING_STATUS,
+    TOPIC_INSTALLATION,
+    heating_status_topic,
+)
+from custom_components.csnet_home.models import InstallationSnapshot
 from custom_components.csnet_home.sensor import (
+    ALARM_STATISTICS_SENSORS,
+    COMPRESSOR_SENSORS,
+    DEVICE_SENSORS,
+    INSTALLATION_SENSORS,
+    ZONE_SENSORS,
     CSNetHomeAlarmHistorySensor,
     CSNetHomeAlarmStatisticsSensor,
     CSNetHomeCompressorSensor,
     CSNetHomeDeviceSensor,
     CSNetHomeInstallationSensor,
     CSNetHomeSensor,
-    _convert_unsigned_to_signed_byte,
+    CSNetHomeSensorEntityDescription,
+    async_setup_entry,
+    compile_installation_accessor,
 )
 
 
+def _description(table, key):
+    """Return the description of a sensor key from its table."""
+    return next(description for description in table if description.key == key)
+
+
 def build_context():
     """Build minimal coordinator/sensor_data/common_data for tests."""
     sensor_data = {
@@ -44,6 +65,7 @@ def build_context():
     common = {"name": "Hitachi PAC", "firmware": "1.0.0"}
     coordinator = SimpleNamespace(
         get_sensors_data=lambda: [sensor_data],
+        get_sensor=lambda key: sensor_data,
     )
     return coordinator, sensor_data, common
 
@@ -53,7 +75,12 @@ def test_state_mode_and_on_off_mapping():
     coordinator, sensor_data, common = build_context()
 
     # mode sensor
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "mode", "enum")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        _description(ZONE_SENSORS, "mode"),
+    )
     assert s.state == HVACMode.HEAT
     sensor_data["mode"] = 0
     assert s.state == HVACMode.COOL
@@ -61,7 +88,12 @@ def test_state_mode_and_on_off_mapping():
     assert s.state == HVACMode.OFF
 
     # on_off sensor
-    s2 = CSNetHomeSensor(coordinator, sensor_data, common, "on_off", "enum")
+    s2 = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        _description(ZONE_SENSORS, "on_off"),
+    )
     sensor_data["on_off"] = 1
     assert s2.state == STATE_ON
     sensor_data["on_off"] = 0
@@ -75,9 +107,11 @@ def test_metadata_and_identity():
         coordinator,
         sensor_data,
         common,
-        "current_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
+        CSNetHomeSensorEntityDescription(
+            key="current_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        ),
     )
     assert s.device_class == "temperature"
     assert s.unit_of_measurement == UnitOfTemperature.CELSIUS
@@ -92,7 +126,12 @@ def test_metadata_and_identity():
 def test_sensor_device_info_with_complete_data():
     """Test sensor device_info property with complete data (initial state)."""
     coordinator, sensor_data, common = build_context()
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "current_temperature")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="current_temperature"),
+    )
 
     device_info = s.device_info
     assert device_info is not None
@@ -108,7 +147,10 @@ def test_sensor_device_info_with_missing_firmware():
     # Remove firmware key
     common_no_firmware = {"name": "Hitachi PAC"}
     s = CSNetHomeSensor(
-        coordinator, sensor_data, common_no_firmware, "current_temperature"
+        coordinator,
+        sensor_data,
+        common_no_firmware,
+        CSNetHomeSensorEntityDescription(key="current_temperature"),
     )
 
     device_info = s.device_info
@@ -120,7 +162,12 @@ def test_sensor_device_info_with_missing_firmware():
 def test_sensor_device_info_after_update_with_nested_structure():
     """Test sensor device_info after update when _common_data is full dict."""
     coordinator, sensor_data, common = build_context()
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "current_temperature")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="current_temperature"),
+    )
 
     # Simulate update: replace _common_data with full common_data dict
     s._common_data = {
@@ -136,7 +183,12 @@ def test_sensor_device_info_after_update_with_nested_structure():
 def test_sensor_device_info_with_missing_device_status():
     """Test sensor device_info when device_status is missing after update."""
     coordinator, sensor_data, common = build_context()
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "current_temperature")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="current_temperature"),
+    )
 
     # Simulate update with missing device_status
     s._common_data = {"device_status": {}}
@@ -158,7 +210,12 @@ def test_sensor_device_info_with_missing_sensor_data_keys():
     coordinator = SimpleNamespace(
         get_sensors_data=lambda: [sensor_data],
     )
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "current_temperature")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="current_temperature"),
+    )
 
     device_info = s.device_info
     # Should not raise KeyError, should use defaults
@@ -169,7 +226,12 @@ def test_sensor_device_info_with_missing_sensor_data_keys():
 def test_handle_coordinator_update():
     """Refresh internal sensor_data on coordinator update."""
     coordinator, sensor_data, common = build_context()
-    s = CSNetHomeSensor(coordinator, sensor_data, common, "setting_temperature")
+    s = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="setting_temperature"),
+    )
     # avoid HA write call (Entity hass is not set in unit tests here)
     s.async_write_ha_state = MagicMock()
     # simulate change in coordinator data
@@ -183,9 +245,17 @@ def test_alarm_code_and_active():
     coordinator, sensor_data, common = build_context()
     sensor_data["alarm_code"] = 0
 
-    alarm_code = CSNetHomeSensor(coordinator, sensor_data, common, "alarm_code", "enum")
+    alarm_code = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="alarm_code", device_class="enum"),
+    )
     alarm_active = CSNetHomeSensor(
-        coordinator, sensor_data, common, "alarm_active", "binary"
+        coordinator,
+        sensor_data,
+        common,
+        _description(ZONE_SENSORS, "alarm_active"),
     )
 
     # no alarm
@@ -238,6 +308,9 @@ def test_installation_sensor():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test pump speed sensor
@@ -245,10 +318,12 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "pump_speed",
-        "water_speed",
-        "m/s",
-        "Pump Speed",
+        CSNetHomeSensorEntityDescription(
+            key="pump_speed",
+            device_class="water_speed",
+            native_unit_of_measurement="m/s",
+            name="Pump Speed",
+        ),
     )
     assert s.state == 100  # 100%
     assert s.unit_of_measurement == "m/s"
@@ -259,10 +334,12 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "water_flow",
-        "water_debit",
-        "m³/h",
-        "Water Flow",
+        CSNetHomeSensorEntityDescription(
+            key="water_flow",
+            device_class="water_debit",
+            native_unit_of_measurement="m³/h",
+            name="Water Flow",
+        ),
     )
     assert s.state == 3.9  # 39 / 10 = 3.9
     assert s.unit_of_measurement == "m³/h"
@@ -272,16 +349,23 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "water_pressure",
-        "pressure",
-        "bar",
-        "Water Pressure",
+        CSNetHomeSensorEntityDescription(
+            key="water_pressure",
+            device_class="pressure",
+            native_unit_of_measurement="bar",
+            name="Water Pressure",
+        ),
     )
     assert s.state == 4.48  # 224 / 50 = 4.48
 
     # Test defrost sensor
     s = CSNetHomeInstallationSensor(
-        coordinator, device_data, common_data, "defrost", "binary", None, "Defrost"
+        coordinator,
+        device_data,
+        common_data,
+        CSNetHomeSensorEntityDescription(
+            key="defrost", device_class="binary", name="Defrost"
+        ),
     )
     assert s.state == STATE_ON  # defrosting = 1
 
@@ -290,10 +374,12 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "gas_temperature",
-        "temperature",
-        "°C",
-        "Gas Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="gas_temperature",
+            device_class="temperature",
+            native_unit_of_measurement="°C",
+            name="Gas Temperature",
+        ),
     )
     assert s.state == 20
 
@@ -302,10 +388,12 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "liquid_temperature",
-        "temperature",
-        "°C",
-        "Liquid Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="liquid_temperature",
+            device_class="temperature",
+            native_unit_of_measurement="°C",
+            name="Liquid Temperature",
+        ),
     )
     assert s.state == 20
 
@@ -314,10 +402,12 @@ def test_installation_sensor():
         coordinator,
         device_data,
         common_data,
-        "out_water_temperature_3",
-        "temperature",
-        "°C",
-        "External Tank Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="out_water_temperature_3",
+            device_class="temperature",
+            native_unit_of_measurement="°C",
+            name="External Tank Temperature",
+        ),
     )
     assert s.state == 25
 
@@ -360,6 +450,9 @@ def test_installation_sensor_edge_cases():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test pump speed with conversion
@@ -367,10 +460,12 @@ def test_installation_sensor_edge_cases():
         coordinator,
         device_data,
         common_data,
-        "pump_speed",
-        "percentage",
-        "%",
-        "Pump Speed",
+        CSNetHomeSensorEntityDescription(
+            key="pump_speed",
+            device_class="percentage",
+            native_unit_of_measurement="%",
+            name="Pump Speed",
+        ),
     )
     assert s.state == 50  # pumpSpeed is already in percentage (0-100)
 
@@ -379,10 +474,12 @@ def test_installation_sensor_edge_cases():
         coordinator,
         device_data,
         common_data,
-        "water_flow",
-        "water_debit",
-        "m³/h",
-        "Water Flow",
+        CSNetHomeSensorEntityDescription(
+            key="water_flow",
+            device_class="water_debit",
+            native_unit_of_measurement="m³/h",
+            name="Water Flow",
+        ),
     )
     assert s.state == 2.5  # 25 / 10 = 2.5
 
@@ -391,16 +488,23 @@ def test_installation_sensor_edge_cases():
         coordinator,
         device_data,
         common_data,
-        "water_pressure",
-        "pressure",
-        "bar",
-        "Water Pressure",
+        CSNetHomeSensorEntityDescription(
+            key="water_pressure",
+            device_class="pressure",
+            native_unit_of_measurement="bar",
+            name="Water Pressure",
+        ),
     )
     assert s.state == 3.2  # 160 / 50 = 3.2
 
     # Test defrost with 0 value (off)
     s = CSNetHomeInstallationSensor(
-        coordinator, device_data, common_data, "defrost", "binary", None, "Defrost"
+        coordinator,
+        device_data,
+        common_data,
+        CSNetHomeSensorEntityDescription(
+            key="defrost", device_class="binary", name="Defrost"
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -409,10 +513,12 @@ def test_installation_sensor_edge_cases():
         coordinator,
         device_data,
         common_data,
-        "mix_valve_position",
-        "percentage",
-        "%",
-        "Mix Valve Position",
+        CSNetHomeSensorEntityDescription(
+            key="mix_valve_position",
+            device_class="percentage",
+            native_unit_of_measurement="%",
+            name="Mix Valve Position",
+        ),
     )
     assert s.state == 75  # mixingValveOpening is already in percentage (0-100)
 
@@ -431,32 +537,42 @@ def test_installation_sensor_no_data():
     # Test with empty data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: {},
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            {}
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "water_speed",
-        "water_speed",
-        "m/s",
-        "Water Speed",
+        CSNetHomeSensorEntityDescription(
+            key="water_speed",
+            device_class="water_speed",
+            native_unit_of_measurement="m/s",
+            name="Water Speed",
+        ),
     )
     assert s.state is None
 
     # Test with None data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: None,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            None
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "water_speed",
-        "water_speed",
-        "m/s",
-        "Water Speed",
+        CSNetHomeSensorEntityDescription(
+            key="water_speed",
+            device_class="water_speed",
+            native_unit_of_measurement="m/s",
+            name="Water Speed",
+        ),
     )
     assert s.state is None
 
@@ -492,6 +608,9 @@ def test_installation_sensor_nested_data():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test pump speed from nested data
@@ -499,16 +618,23 @@ def test_installation_sensor_nested_data():
         coordinator,
         device_data,
         common_data,
-        "pump_speed",
-        "water_speed",
-        "m/s",
-        "Pump Speed",
+        CSNetHomeSensorEntityDescription(
+            key="pump_speed",
+            device_class="water_speed",
+            native_unit_of_measurement="m/s",
+            name="Pump Speed",
+        ),
     )
     assert s.state == 80  # 80%
 
     # Test defrost from nested data
     s = CSNetHomeInstallationSensor(
-        coordinator, device_data, common_data, "defrost", "binary", None, "Defrost"
+        coordinator,
+        device_data,
+        common_data,
+        CSNetHomeSensorEntityDescription(
+            key="defrost", device_class="binary", name="Defrost"
+        ),
     )
     assert s.state == STATE_ON  # defrosting = 1
 
@@ -517,10 +643,12 @@ def test_installation_sensor_nested_data():
         coordinator,
         device_data,
         common_data,
-        "water_flow",
-        "water_debit",
-        "m³/h",
-        "Water Flow",
+        CSNetHomeSensorEntityDescription(
+            key="water_flow",
+            device_class="water_debit",
+            native_unit_of_measurement="m³/h",
+            name="Water Flow",
+        ),
     )
     assert s.state == 3.0  # 30 / 10 = 3.0
 
@@ -529,10 +657,12 @@ def test_installation_sensor_nested_data():
         coordinator,
         device_data,
         common_data,
-        "water_pressure",
-        "pressure",
-        "bar",
-        "Water Pressure",
+        CSNetHomeSensorEntityDescription(
+            key="water_pressure",
+            device_class="pressure",
+            native_unit_of_measurement="bar",
+            name="Water Pressure",
+        ),
     )
     assert s.state == 4.0  # 200 / 50 = 4.0
 
@@ -568,10 +698,12 @@ def test_installation_sensor_metadata():
         coordinator,
         device_data,
         common_data,
-        "pump_speed",
-        "water_speed",
-        "m/s",
-        "Pump Speed",
+        CSNetHomeSensorEntityDescription(
+            key="pump_speed",
+            device_class="water_speed",
+            native_unit_of_measurement="m/s",
+            name="Pump Speed",
+        ),
     )
 
     # Test device info
@@ -609,16 +741,18 @@ def test_central_config_sensor():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "central_config",
-        "enum",
-        None,
-        "Central Config",
+        CSNetHomeSensorEntityDescription(
+            key="central_config", device_class="enum", name="Central Config"
+        ),
     )
     assert s.state == "Unit Only ⚠️"
 
@@ -661,16 +795,18 @@ def test_lcd_software_version_sensor():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "lcd_software_version",
-        None,
-        None,
-        "LCD Software Version",
+        CSNetHomeSensorEntityDescription(
+            key="lcd_software_version", name="LCD Software Version"
+        ),
     )
     assert s.state == "0x0222"
 
@@ -702,16 +838,18 @@ def test_unit_model_sensor():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "unit_model",
-        "enum",
-        None,
-        "Unit Model",
+        CSNetHomeSensorEntityDescription(
+            key="unit_model", device_class="enum", name="Unit Model"
+        ),
     )
 
     # Test all known unit models
@@ -767,16 +905,20 @@ def test_central_control_enabled_sensor():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "central_control_enabled",
-        "binary",
-        None,
-        "Central Control Enabled",
+        CSNetHomeSensorEntityDescription(
+            key="central_control_enabled",
+            device_class="binary",
+            name="Central Control Enabled",
+        ),
     )
     assert s.state == STATE_ON
 
@@ -832,46 +974,58 @@ def test_central_control_enabled_no_data():
     # Test with empty data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: {},
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            {}
+        ),
     )
 
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "central_control_enabled",
-        "binary",
-        None,
-        "Central Control Enabled",
+        CSNetHomeSensorEntityDescription(
+            key="central_control_enabled",
+            device_class="binary",
+            name="Central Control Enabled",
+        ),
     )
     assert s.state == STATE_OFF
 
     # Test with None data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: None,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            None
+        ),
     )
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "central_control_enabled",
-        "binary",
-        None,
-        "Central Control Enabled",
+        CSNetHomeSensorEntityDescription(
+            key="central_control_enabled",
+            device_class="binary",
+            name="Central Control Enabled",
+        ),
     )
     assert s.state == STATE_OFF
 
     # Test with missing heatingStatus
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: {"data": [{"indoors": [{}]}]},
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            {"data": [{"indoors": [{}]}]}
+        ),
     )
     s = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "central_control_enabled",
-        "binary",
-        None,
-        "Central Control Enabled",
+        CSNetHomeSensorEntityDescription(
+            key="central_control_enabled",
+            device_class="binary",
+            name="Central Control Enabled",
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -905,6 +1059,9 @@ def test_central_control_sensors_metadata():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test central config sensor metadata
@@ -912,10 +1069,9 @@ def test_central_control_sensors_metadata():
         coordinator,
         device_data,
         common_data,
-        "central_config",
-        "enum",
-        None,
-        "Central Config",
+        CSNetHomeSensorEntityDescription(
+            key="central_config", device_class="enum", name="Central Config"
+        ),
     )
     assert s.name == "System Controller Central Config"
     assert s.unique_id == "csnet_home-installation-central_config"
@@ -926,10 +1082,9 @@ def test_central_control_sensors_metadata():
         coordinator,
         device_data,
         common_data,
-        "lcd_software_version",
-        None,
-        None,
-        "LCD Software Version",
+        CSNetHomeSensorEntityDescription(
+            key="lcd_software_version", name="LCD Software Version"
+        ),
     )
     assert s.name == "System Controller LCD Software Version"
     assert s.unique_id == "csnet_home-installation-lcd_software_version"
@@ -939,10 +1094,9 @@ def test_central_control_sensors_metadata():
         coordinator,
         device_data,
         common_data,
-        "unit_model",
-        "enum",
-        None,
-        "Unit Model",
+        CSNetHomeSensorEntityDescription(
+            key="unit_model", device_class="enum", name="Unit Model"
+        ),
     )
     assert s.name == "System Controller Unit Model"
     assert s.unique_id == "csnet_home-installation-unit_model"
@@ -953,10 +1107,11 @@ def test_central_control_sensors_metadata():
         coordinator,
         device_data,
         common_data,
-        "central_control_enabled",
-        "binary",
-        None,
-        "Central Control Enabled",
+        CSNetHomeSensorEntityDescription(
+            key="central_control_enabled",
+            device_class="binary",
+            name="Central Control Enabled",
+        ),
     )
     assert s.name == "System Controller Central Control Enabled"
     assert s.unique_id == "csnet_home-installation-central_control_enabled"
@@ -996,10 +1151,12 @@ def test_wifi_signal_sensor():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
 
     # Test WiFi signal strength
@@ -1041,10 +1198,12 @@ def test_wifi_signal_sensor_no_data():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
 
     # Should return None when rssi is missing
@@ -1084,10 +1243,9 @@ def test_connectivity_sensor_online():
         coordinator,
         sensor_data,
         common_data,
-        "connectivity",
-        "binary",
-        None,
-        "Connectivity",
+        CSNetHomeSensorEntityDescription(
+            key="connectivity", device_class="binary", name="Connectivity"
+        ),
     )
 
     # Should be ON (online) when last communication was < 10 minutes ago
@@ -1129,10 +1287,9 @@ def test_connectivity_sensor_offline():
         coordinator,
         sensor_data,
         common_data,
-        "connectivity",
-        "binary",
-        None,
-        "Connectivity",
+        CSNetHomeSensorEntityDescription(
+            key="connectivity", device_class="binary", name="Connectivity"
+        ),
     )
 
     # Should be OFF (offline) when last communication was > 10 minutes ago
@@ -1172,10 +1329,9 @@ def test_connectivity_sensor_exactly_10_minutes():
         coordinator,
         sensor_data,
         common_data,
-        "connectivity",
-        "binary",
-        None,
-        "Connectivity",
+        CSNetHomeSensorEntityDescription(
+            key="connectivity", device_class="binary", name="Connectivity"
+        ),
     )
 
     # Should be ON (online) when last communication was exactly 10 minutes ago (<=10)
@@ -1213,10 +1369,9 @@ def test_connectivity_sensor_no_data():
         coordinator,
         sensor_data,
         common_data,
-        "connectivity",
-        "binary",
-        None,
-        "Connectivity",
+        CSNetHomeSensorEntityDescription(
+            key="connectivity", device_class="binary", name="Connectivity"
+        ),
     )
 
     # Should be OFF (offline) when data is missing
@@ -1255,10 +1410,11 @@ def test_last_communication_sensor():
         coordinator,
         sensor_data,
         common_data,
-        "last_communication",
-        "timestamp",
-        None,
-        "Last Communication",
+        CSNetHomeSensorEntityDescription(
+            key="last_communication",
+            device_class="timestamp",
+            name="Last Communication",
+        ),
     )
 
     # Test timestamp conversion
@@ -1300,10 +1456,11 @@ def test_last_communication_sensor_no_data():
         coordinator,
         sensor_data,
         common_data,
-        "last_communication",
-        "timestamp",
-        None,
-        "Last Communication",
+        CSNetHomeSensorEntityDescription(
+            key="last_communication",
+            device_class="timestamp",
+            name="Last Communication",
+        ),
     )
 
     # Should return None when lastComm is missing
@@ -1352,6 +1509,7 @@ def test_device_sensor_coordinator_update():
 
     coordinator = SimpleNamespace(
         get_sensors_data=lambda: [updated_sensor_data],
+        get_sensor=lambda key: updated_sensor_data,
         get_common_data=lambda: updated_common_data,
     )
 
@@ -1359,10 +1517,12 @@ def test_device_sensor_coordinator_update():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
 
     # Mock the async_write_ha_state method
@@ -1415,10 +1575,12 @@ def test_device_sensor_metadata():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
 
     # Test device info
@@ -1464,10 +1626,12 @@ def test_device_sensor_no_device_status():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
 
     # Should return None when device_status is missing
@@ -1505,10 +1669,12 @@ def test_wifi_signal_different_values():
         coordinator,
         sensor_data,
         common_data,
-        "wifi_signal",
-        "signal_strength",
-        "dBm",
-        "WiFi Signal",
+        CSNetHomeSensorEntityDescription(
+            key="wifi_signal",
+            device_class="signal_strength",
+            native_unit_of_measurement="dBm",
+            name="WiFi Signal",
+        ),
     )
     assert s.state == -50
 
@@ -1533,23 +1699,43 @@ def test_enhanced_alarm_sensors():
 
     # Test alarm_code_formatted sensor
     s_formatted = CSNetHomeSensor(
-        coordinator, sensor_data, common, "alarm_code_formatted", "enum"
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(
+            key="alarm_code_formatted", device_class="enum"
+        ),
     )
     assert s_formatted.state == "62"
 
     # Test alarm_origin sensor
-    s_origin = CSNetHomeSensor(coordinator, sensor_data, common, "alarm_origin", "enum")
+    s_origin = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="alarm_origin", device_class="enum"),
+    )
     assert s_origin.state == "Indoor Unit"
 
     # Test unit_type sensor
-    s_type = CSNetHomeSensor(coordinator, sensor_data, common, "unit_type", "enum")
+    s_type = CSNetHomeSensor(
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(key="unit_type", device_class="enum"),
+    )
     assert s_type.state == "yutaki"
 
     # Test with BCD alarm code
     sensor_data["alarm_code"] = 0x0162
     sensor_data["alarm_code_formatted"] = "62"
     s_formatted = CSNetHomeSensor(
-        coordinator, sensor_data, common, "alarm_code_formatted", "enum"
+        coordinator,
+        sensor_data,
+        common,
+        CSNetHomeSensorEntityDescription(
+            key="alarm_code_formatted", device_class="enum"
+        ),
     )
     assert s_formatted.state == "62"
 
@@ -1656,7 +1842,9 @@ def test_alarm_statistics_sensor_total_count():
     )
 
     s = CSNetHomeAlarmStatisticsSensor(
-        coordinator, common_data, "total_alarm_count", "Total Alarms"
+        coordinator,
+        common_data,
+        CSNetHomeSensorEntityDescription(key="total_alarm_count", name="Total Alarms"),
     )
 
     # Test state (count of active alarms)
@@ -1705,7 +1893,11 @@ def test_alarm_statistics_sensor_by_origin():
     )
 
     s = CSNetHomeAlarmStatisticsSensor(
-        coordinator, common_data, "alarm_by_origin", "Alarms by Origin"
+        coordinator,
+        common_data,
+        CSNetHomeSensorEntityDescription(
+            key="alarm_by_origin", name="Alarms by Origin"
+        ),
     )
 
     # Test state (count of most common origin)
@@ -1746,12 +1938,18 @@ def test_alarm_statistics_sensor_no_alarms():
     )
 
     s_total = CSNetHomeAlarmStatisticsSensor(
-        coordinator, common_data, "total_alarm_count", "Total Alarms"
+        coordinator,
+        common_data,
+        CSNetHomeSensorEntityDescription(key="total_alarm_count", name="Total Alarms"),
     )
     assert s_total.state == 0
 
     s_origin = CSNetHomeAlarmStatisticsSensor(
-        coordinator, common_data, "alarm_by_origin", "Alarms by Origin"
+        coordinator,
+        common_data,
+        CSNetHomeSensorEntityDescription(
+            key="alarm_by_origin", name="Alarms by Origin"
+        ),
     )
     assert s_origin.state == 0
 
@@ -1785,6 +1983,9 @@ def test_system_config_sensors():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test cascade slave mode sensor (bit 0x1000)
@@ -1792,10 +1993,9 @@ def test_system_config_sensors():
         coordinator,
         device_data,
         common_data,
-        "cascade_slave_mode",
-        "binary",
-        None,
-        "Cascade Slave Mode",
+        CSNetHomeSensorEntityDescription(
+            key="cascade_slave_mode", device_class="binary", name="Cascade Slave Mode"
+        ),
     )
     assert s.state == STATE_ON
     assert s.name == "System Controller Cascade Slave Mode"
@@ -1805,10 +2005,9 @@ def test_system_config_sensors():
         coordinator,
         device_data,
         common_data,
-        "fan_coil_compatible",
-        "binary",
-        None,
-        "Fan Coil Compatible",
+        CSNetHomeSensorEntityDescription(
+            key="fan_coil_compatible", device_class="binary", name="Fan Coil Compatible"
+        ),
     )
     assert s.state == STATE_ON
 
@@ -1817,10 +2016,11 @@ def test_system_config_sensors():
         coordinator,
         device_data,
         common_data,
-        "c1_thermostat_present",
-        "binary",
-        None,
-        "C1 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c1_thermostat_present",
+            device_class="binary",
+            name="C1 Thermostat Present",
+        ),
     )
     assert s.state == STATE_ON
 
@@ -1829,10 +2029,11 @@ def test_system_config_sensors():
         coordinator,
         device_data,
         common_data,
-        "c2_thermostat_present",
-        "binary",
-        None,
-        "C2 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c2_thermostat_present",
+            device_class="binary",
+            name="C2 Thermostat Present",
+        ),
     )
     assert s.state == STATE_ON
 
@@ -1865,6 +2066,9 @@ def test_system_config_sensors_no_bits_set():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test cascade slave mode sensor (bit 0x1000)
@@ -1872,10 +2076,9 @@ def test_system_config_sensors_no_bits_set():
         coordinator,
         device_data,
         common_data,
-        "cascade_slave_mode",
-        "binary",
-        None,
-        "Cascade Slave Mode",
+        CSNetHomeSensorEntityDescription(
+            key="cascade_slave_mode", device_class="binary", name="Cascade Slave Mode"
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -1884,10 +2087,9 @@ def test_system_config_sensors_no_bits_set():
         coordinator,
         device_data,
         common_data,
-        "fan_coil_compatible",
-        "binary",
-        None,
-        "Fan Coil Compatible",
+        CSNetHomeSensorEntityDescription(
+            key="fan_coil_compatible", device_class="binary", name="Fan Coil Compatible"
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -1896,10 +2098,11 @@ def test_system_config_sensors_no_bits_set():
         coordinator,
         device_data,
         common_data,
-        "c1_thermostat_present",
-        "binary",
-        None,
-        "C1 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c1_thermostat_present",
+            device_class="binary",
+            name="C1 Thermostat Present",
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -1908,10 +2111,11 @@ def test_system_config_sensors_no_bits_set():
         coordinator,
         device_data,
         common_data,
-        "c2_thermostat_present",
-        "binary",
-        None,
-        "C2 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c2_thermostat_present",
+            device_class="binary",
+            name="C2 Thermostat Present",
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -1944,6 +2148,9 @@ def test_system_config_sensors_partial_bits():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test cascade slave mode sensor - should be OFF
@@ -1951,10 +2158,9 @@ def test_system_config_sensors_partial_bits():
         coordinator,
         device_data,
         common_data,
-        "cascade_slave_mode",
-        "binary",
-        None,
-        "Cascade Slave Mode",
+        CSNetHomeSensorEntityDescription(
+            key="cascade_slave_mode", device_class="binary", name="Cascade Slave Mode"
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -1963,10 +2169,9 @@ def test_system_config_sensors_partial_bits():
         coordinator,
         device_data,
         common_data,
-        "fan_coil_compatible",
-        "binary",
-        None,
-        "Fan Coil Compatible",
+        CSNetHomeSensorEntityDescription(
+            key="fan_coil_compatible", device_class="binary", name="Fan Coil Compatible"
+        ),
     )
     assert s.state == STATE_ON
 
@@ -1975,10 +2180,11 @@ def test_system_config_sensors_partial_bits():
         coordinator,
         device_data,
         common_data,
-        "c1_thermostat_present",
-        "binary",
-        None,
-        "C1 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c1_thermostat_present",
+            device_class="binary",
+            name="C1 Thermostat Present",
+        ),
     )
     assert s.state == STATE_ON
 
@@ -1987,10 +2193,11 @@ def test_system_config_sensors_partial_bits():
         coordinator,
         device_data,
         common_data,
-        "c2_thermostat_present",
-        "binary",
-        None,
-        "C2 Thermostat Present",
+        CSNetHomeSensorEntityDescription(
+            key="c2_thermostat_present",
+            device_class="binary",
+            name="C2 Thermostat Present",
+        ),
     )
     assert s.state == STATE_OFF
 
@@ -2009,6 +2216,9 @@ def test_system_config_sensors_no_data():
     # Mock with empty/no data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: {},
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            {}
+        ),
     )
 
     # All sensors should return STATE_OFF when no data is available
@@ -2022,10 +2232,7 @@ def test_system_config_sensors_no_data():
             coordinator,
             device_data,
             common_data,
-            key,
-            "binary",
-            None,
-            name,
+            CSNetHomeSensorEntityDescription(key=key, device_class="binary", name=name),
         )
         assert s.state == STATE_OFF
 
@@ -2059,6 +2266,9 @@ def test_outdoor_temperature_sensors():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     # Test outdoor temperature sensor (current outdoor temperature)
@@ -2066,10 +2276,12 @@ def test_outdoor_temperature_sensors():
         coordinator,
         device_data,
         common_data,
-        "external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Temperature",
+        ),
     )
     assert s.state == 14
     assert s.unit_of_measurement == UnitOfTemperature.CELSIUS
@@ -2082,10 +2294,12 @@ def test_outdoor_temperature_sensors():
         coordinator,
         device_data,
         common_data,
-        "mean_external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Average Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="mean_external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Average Temperature",
+        ),
     )
     assert s.state == 15
     assert s.unit_of_measurement == UnitOfTemperature.CELSIUS
@@ -2123,16 +2337,21 @@ def test_outdoor_temperature_sensors_various_values():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s_outdoor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Temperature",
+        ),
     )
     assert s_outdoor.state == -5
 
@@ -2140,10 +2359,12 @@ def test_outdoor_temperature_sensors_various_values():
         coordinator,
         device_data,
         common_data,
-        "mean_external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Average Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="mean_external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Average Temperature",
+        ),
     )
     assert s_avg.state == -3
 
@@ -2182,16 +2403,21 @@ def test_outdoor_temperature_sensors_no_data():
     # Test with empty installation data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: {},
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            {}
+        ),
     )
 
     s_outdoor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Temperature",
+        ),
     )
     assert s_outdoor.state is None
 
@@ -2199,26 +2425,33 @@ def test_outdoor_temperature_sensors_no_data():
         coordinator,
         device_data,
         common_data,
-        "mean_external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Average Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="mean_external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Average Temperature",
+        ),
     )
     assert s_avg.state is None
 
     # Test with None data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: None,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            None
+        ),
     )
 
     s_outdoor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "external_temperature",
-        "temperature",
-        UnitOfTemperature.CELSIUS,
-        "Outdoor Temperature",
+        CSNetHomeSensorEntityDescription(
+            key="external_temperature",
+            device_class="temperature",
+            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+            name="Outdoor Temperature",
+        ),
     )
     assert s_outdoor.state is None
 
@@ -2251,16 +2484,18 @@ def test_otc_cooling_type_c2_sensor():
     }
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     sensor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "otc_cooling_type_c2",
-        "enum",
-        None,
-        "OTC Cooling Type C2",
+        CSNetHomeSensorEntityDescription(
+            key="otc_cooling_type_c2", device_class="enum", name="OTC Cooling Type C2"
+        ),
     )
     assert sensor.state == "Fixed"
 
@@ -2308,16 +2543,18 @@ def test_otc_heating_type_c1_sensor():
     }
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     sensor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "otc_heating_type_c1",
-        "enum",
-        None,
-        "OTC Heating Type C1",
+        CSNetHomeSensorEntityDescription(
+            key="otc_heating_type_c1", device_class="enum", name="OTC Heating Type C1"
+        ),
     )
     assert sensor.state == "Fixed"
 
@@ -2368,16 +2605,18 @@ def test_otc_cooling_type_c1_sensor():
     }
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     sensor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "otc_cooling_type_c1",
-        "enum",
-        None,
-        "OTC Cooling Type C1",
+        CSNetHomeSensorEntityDescription(
+            key="otc_cooling_type_c1", device_class="enum", name="OTC Cooling Type C1"
+        ),
     )
     assert sensor.state == "Fixed"
 
@@ -2422,16 +2661,18 @@ def test_otc_heating_type_c2_sensor():
     }
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     sensor = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "otc_heating_type_c2",
-        "enum",
-        None,
-        "OTC Heating Type C2",
+        CSNetHomeSensorEntityDescription(
+            key="otc_heating_type_c2", device_class="enum", name="OTC Heating Type C2"
+        ),
     )
     assert sensor.state == "Gradient"
 
@@ -2456,16 +2697,18 @@ def test_otc_sensors_no_installation_data():
     # No installation data
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: None,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            None
+        ),
     )
 
     sensor_heat_c1 = CSNetHomeInstallationSensor(
         coordinator,
         device_data,
         common_data,
-        "otc_heating_type_c1",
-        "enum",
-        None,
-        "OTC Heating Type C1",
+        CSNetHomeSensorEntityDescription(
+            key="otc_heating_type_c1", device_class="enum", name="OTC Heating Type C1"
+        ),
     )
     assert sensor_heat_c1.state == "Unknown"
 
@@ -2473,10 +2716,9 @@ def test_otc_sensors_no_installation_data():
         coordinator,
         device_data,
         common_data,
-        "otc_cooling_type_c1",
-        "enum",
-        None,
-        "OTC Cooling Type C1",
+        CSNetHomeSensorEntityDescription(
+            key="otc_cooling_type_c1", device_class="enum", name="OTC Cooling Type C1"
+        ),
     )
     assert sensor_cool_c1.state == "Unknown"
 
@@ -2484,46 +2726,6 @@ def test_otc_sensors_no_installation_data():
 # Tests for Issue #124: Compressor Temperature Negative Value Overflow Fix
 
 
-def test_convert_unsigned_to_signed_byte_positive_values():
-    """Test conversion of unsigned bytes that should remain positive."""
-    # Values 0-127 should remain unchanged
-    assert _convert_unsigned_to_signed_byte(0) == 0
-    assert _convert_unsigned_to_signed_byte(1) == 1
-    assert _convert_unsigned_to_signed_byte(50) == 50
-    assert _convert_unsigned_to_signed_byte(100) == 100
-    assert _convert_unsigned_to_signed_byte(127) == 127
-
-
-def test_convert_unsigned_to_signed_byte_negative_values():
-    """Test conversion of unsigned bytes that should become negative.
-
-    When API sends unsigned bytes (0-255) for temperature values:
-    - 128 (0x80) represents -128°C
-    - 255 (0xFF) represents -1°C
-    - 246 (0xF6) represents -10°C
-    - 250 (0xFA) represents -6°C
-    """
-    # Values 128-255 should be converted to negative
-    assert _convert_unsigned_to_signed_byte(128) == -128
-    assert _convert_unsigned_to_signed_byte(255) == -1
-    assert _convert_unsigned_to_signed_byte(246) == -10
-    assert _convert_unsigned_to_signed_byte(250) == -6
-    assert _convert_unsigned_to_signed_byte(254) == -2
-    assert _convert_unsigned_to_signed_byte(240) == -16
-    assert _convert_unsigned_to_signed_byte(200) == -56
-
-
-def test_convert_unsigned_to_signed_byte_edge_cases():
-    """Test edge cases for byte conversion."""
-    # None should remain None
-    assert _convert_unsigned_to_signed_byte(None) is None
-
-    # Non-integer values should be passed through
-    assert _convert_unsigned_to_signed_byte(25.5) == 25.5
-    assert _convert_unsigned_to_signed_byte("100") == "100"
-    assert _convert_unsigned_to_signed_byte([]) == []
-
-
 def test_compressor_evaporator_temperature_positive():
     """Test compressor evaporator temperature sensor with positive values."""
     device_data = {
@@ -2552,16 +2754,16 @@ def test_compressor_evaporator_temperature_positive():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "evaporator_temperature",
-        "temperature",
-        "°C",
-        "Evaporator Temperature",
+        _description(COMPRESSOR_SENSORS, "evaporator_temperature"),
     )
 
     assert s.state == 45
@@ -2600,16 +2802,16 @@ def test_compressor_evaporator_temperature_negative():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "evaporator_temperature",
-        "temperature",
-        "°C",
-        "Evaporator Temperature",
+        _description(COMPRESSOR_SENSORS, "evaporator_temperature"),
     )
 
     # Should be -10, NOT 246
@@ -2644,16 +2846,16 @@ def test_compressor_discharge_temperature_negative():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "discharge_temperature",
-        "temperature",
-        "°C",
-        "Discharge Temperature",
+        _description(COMPRESSOR_SENSORS, "discharge_temperature"),
     )
 
     # Should be -6, NOT 250
@@ -2688,16 +2890,16 @@ def test_compressor_outdoor_ambient_temperature_negative():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "outdoor_ambient_temperature",
-        "temperature",
-        "°C",
-        "Outdoor Ambient Temperature",
+        _description(COMPRESSOR_SENSORS, "outdoor_ambient_temperature"),
     )
 
     # Should be -16, NOT 240
@@ -2733,16 +2935,16 @@ def test_compressor_secondary_discharge_temperature_negative():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "secondary_discharge_temp",
-        "temperature",
-        "°C",
-        "Secondary Discharge Temperature",
+        _description(COMPRESSOR_SENSORS, "secondary_discharge_temp"),
     )
 
     # Should be -2, NOT 254
@@ -2778,16 +2980,16 @@ def test_compressor_secondary_suction_temperature_negative():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "secondary_suction_temp",
-        "temperature",
-        "°C",
-        "Secondary Suction Temperature",
+        _description(COMPRESSOR_SENSORS, "secondary_suction_temp"),
     )
 
     # Should be -128, NOT 128
@@ -2824,34 +3026,28 @@ def test_compressor_temperatures_extreme_values():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s_evap = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "evaporator_temperature",
-        "temperature",
-        "°C",
-        "Evaporator",
+        _description(COMPRESSOR_SENSORS, "evaporator_temperature"),
     )
     s_discharge = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "discharge_temperature",
-        "temperature",
-        "°C",
-        "Discharge",
+        _description(COMPRESSOR_SENSORS, "discharge_temperature"),
     )
     s_ambient = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "outdoor_ambient_temperature",
-        "temperature",
-        "°C",
-        "Ambient",
+        _description(COMPRESSOR_SENSORS, "outdoor_ambient_temperature"),
     )
 
     assert s_evap.state == -56
@@ -2903,17 +3099,155 @@ def test_compressor_temperature_none_values():
 
     coordinator = SimpleNamespace(
         get_installation_devices_data=lambda: installation_data,
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
     )
 
     s = CSNetHomeCompressorSensor(
         coordinator,
         device_data,
         common_data,
-        "evaporator_temperature",
-        "temperature",
-        "°C",
-        "Evaporator Temperature",
+        _description(COMPRESSOR_SENSORS, "evaporator_temperature"),
     )
 
     # Should return None, not crash
     assert s.state is None
+
+
+def test_sensor_listener_contexts():
+    """Subscribe each sensor only to the coordinator topics it reads."""
+    coordinator, sensor_data, common = build_context()
+    device_data = {"device_name": "System", "room_name": "Controller"}
+
+    def installation_context(key):
+        return CSNetHomeInstallationSensor(
+            coordinator, device_data, common, CSNetHomeSensorEntityDescription(key=key)
+        ).coordinator_context
+
+    assert installation_context("water_flow") == frozenset(
+        {heating_status_topic("waterFlow")}
+    )
+    assert installation_context("otc_heating_type_c2") == frozenset(
+        {heating_status_topic("otcTypeHeatC2")}
+    )
+    assert installation_context("weather_temperature") == frozenset({TOPIC_COMMON})
+    assert installation_context("unknown_key") == frozenset(
+        {TOPIC_INSTALLATION, TOPIC_HEATING_STATUS}
+    )
+
+    zone = CSNetHomeSensor(
+        coordinator, sensor_data, common, _description(ZONE_SENSORS, "mode")
+    )
+    assert zone.coordinator_context == frozenset({(1234, 1706, None)})
+
+
+async def test_async_setup_entry_builds_sensors_from_descriptions():
+    """Create one entity per description for every zone and the installation."""
+    coordinator, sensor_data, _ = build_context()
+    coordinator.get_common_data = lambda: {
+        "device_status": {1234: {"name": "Hitachi PAC"}}
+    }
+    coordinator.get_installation_devices_data = lambda: {"data": []}
+    hass = SimpleNamespace(
+        data={DOMAIN: {"entry": {"coordinator": coordinator}}},
+    )
+    added = []
+
+    await async_setup_entry(hass, SimpleNamespace(entry_id="entry"), added.extend)
+
+    expected = (
+        len(ZONE_SENSORS)
+        + len(DEVICE_SENSORS)
+        + len(INSTALLATION_SENSORS)
+        + 1
+        + len(ALARM_STATISTICS_SENSORS)
+        + len(COMPRESSOR_SENSORS)
+    )
+    assert len(added) == expected
+    assert len({entity.unique_id for entity in added}) == expected
+    assert all(isinstance(entity, SensorEntity) for entity in added)
+    compressor = [s for s in added if isinstance(s, CSNetHomeCompressorSensor)]
+    assert compressor[0].entity_description is COMPRESSOR_SENSORS[0]
+    assert compressor[0].name == "Compressor Outdoor Unit Compressor Frequency"
+    assert compressor[0].native_unit_of_measurement == "Hz"
+
+
+def test_compressor_value_functions():
+    """Decode the compressor sensors through their description value_fn."""
+    installation_data = {
+        "data": [
+            {
+                "indoors": [
+                    {
+                        "heatingStatus": {
+                            "ouHz": 42,
+                            "fanRPM": -1,
+                            "operationStatus": 99,
+                            "systemStatus2Flags": 10,
+                            "ouCode": 3,
+                        },
+                        "secondCycle": {"suctionPressure": 127, "stopCode": 0},
+                    }
+                ],
+            }
+        ]
+    }
+    coordinator = SimpleNamespace(
+        get_installation_snapshot=lambda: InstallationSnapshot.from_installation_devices(
+            installation_data
+        ),
+    )
+    device_data = {"device_name": "Compressor", "room_name": "Outdoor Unit"}
+
+    descriptions = {description.key: description for description in COMPRESSOR_SENSORS}
+
+    def state(key):
+        description = descriptions.get(key, CSNetHomeSensorEntityDescription(key=key))
+        return CSNetHomeCompressorSensor(
+            coordinator, device_data, {}, description
+        ).state
+
+    assert state("compressor_frequency") == 42
+    assert state("outdoor_fan_rpm") is None
+    assert state("operation_status") == "Unknown (99)"
+    assert state("system_status_flags") == "0x000A"
+    assert state("ou_code") == "Yutaki"
+    assert state("secondary_suction_pressure") is None
+    assert state("secondary_stop_code") == "Running"
+    assert state("ou_evo_1") is None
+    assert state("unknown_key") is None
+
+
+def test_compile_installation_accessor():
+    """Resolve the field and conversion of an installation sensor once."""
+    snapshot = InstallationSnapshot.from_installation_devices(
+        {
+            "data": [
+                {
+                    "indoors": [
+                        {
+                            "heatingStatus": {
+                                "waterFlow": 15,
+                                "defrosting": 1,
+                                "waterOutletTemp": 35,
+                                "systemConfigBits": 0x40,
+                                "otcTypeHeatC1": OTC_HEATING_TYPE_POINTS,
+                                "centralConfig": 2,
+                            }
+                        }
+                    ]
+                }
+            ]
+        }
+    )
+
+    assert compile_installation_accessor("water_flow")(snapshot) == 1.5
+    assert compile_installation_accessor("defrost")(snapshot) == STATE_ON
+    assert compile_installation_accessor("out_water_temperature")(snapshot) == 35
+    assert compile_installation_accessor("c1_thermostat_present")(snapshot) == STATE_ON
+    assert compile_installation_accessor("c2_thermostat_present")(snapshot) == STATE_OFF
+    assert compile_installation_accessor("otc_heating_type_c1")(snapshot) == "Points"
+    assert compile_installation_accessor("otc_cooling_type_c1")(snapshot) == "Unknown"
+    assert compile_installation_accessor("central_config")(snapshot) == "Unit & RT ⚠️"
+    assert compile_installation_accessor("bottom_dhw_temperature")(snapshot) is None
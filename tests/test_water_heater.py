@@ -1,7 +1,7 @@
 """Test CSNet Home water heater entity."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.water_heater import WaterHeaterEntityFeature
@@ -16,6 +16,13 @@ from custom_components.csnet_home.const import (
 from custom_components.csnet_home.water_heater import CSNetHomeWaterHeater
 
 
+@pytest.fixture(autouse=True)
+def mock_write_ha_state():
+    """Entities are not added to a platform, so do not write their state."""
+    with patch.object(CSNetHomeWaterHeater, "async_write_ha_state") as write_ha_state:
+        yield write_ha_state
+
+
 def build_water_heater_entity(
     hass,
     *,
@@ -72,7 +79,9 @@ def build_water_heater_entity(
         ),
     )
     hass.data[DOMAIN][entry.entry_id]["coordinator"] = SimpleNamespace(
+        async_expect_fields=MagicMock(),
         get_sensors_data=lambda: [sensor_data],
+        get_sensor=lambda key: sensor_data,
         get_common_data=lambda: {"device_status": {1234: common_data}},
         get_installation_devices_data=lambda: installation_devices_data,
     )
@@ -200,6 +209,18 @@ async def test_water_heater_set_temperature(hass):
     assert entity._attr_target_temperature == 50
 
 
+@pytest.mark.asyncio
+async def test_water_heater_set_non_integral_temperature(hass):
+    """Expect the whole degrees the DHW write sends and the cloud reports."""
+    entity = build_water_heater_entity(hass, zone_id=3, setp=45)
+    await entity.async_set_temperature(temperature=50.5)
+
+    assert entity._attr_target_temperature == 50
+    entity.coordinator.async_expect_fields.assert_called_once_with(
+        entity._sensor_key, {"setting_temperature": 50}
+    )
+
+
 @pytest.mark.asyncio
 async def test_swimming_pool_set_temperature(hass):
     """Test setting swimming pool temperature."""
@@ -293,9 +314,9 @@ async def test_water_heater_update(hass):
         "current_temperature": 50.0,
         "setting_temperature": 52,
     }
-    coordinator.get_sensors_data = lambda: [updated_sensor]
+    coordinator.get_sensor = lambda key: updated_sensor
 
-    await entity.async_update()
+    entity._handle_coordinator_update()
 
     assert entity._sensor_data["current_temperature"] == 50.0
     assert entity._sensor_data["setting_temperature"] == 52
@@ -315,9 +336,9 @@ async def test_swimming_pool_update(hass):
         "current_temperature": 29.0,
         "setting_temperature": 30,
     }
-    coordinator.get_sensors_data = lambda: [updated_sensor]
+    coordinator.get_sensor = lambda key: updated_sensor
 
-    await entity.async_update()
+    entity._handle_coordinator_update()
 
     assert entity._sensor_data["current_temperature"] == 29.0
     assert entity._sensor_data["setting_temperature"] == 30